@@ -14,21 +14,14 @@ Features:
 - Configurable settings
 """
 
+import sys
+
 __version__ = "1.2.0"
 __author__ = "WG File Manager Team"
 
-from .core.config import get_config
-from .core.file_ops import FileOperations
-from .ui.main_screen import create_main_screen, WGFileManagerMain
-from .ui.pane import EnhancedFileList, FilePane
-from .ui.progress import create_progress_dialog, OperationProgressDialog
-from .ui.permission_dialog import PermissionDialog
-from .utils.formatters import format_permissions_with_octal, get_permissions_string, get_permissions_octal
-from .utils.logger import get_logger, set_debug_mode, log_operation
-
 __all__ = [
-    'get_config', 
-    'FileOperations', 
+    'get_config',
+    'FileOperations',
     'create_main_screen',
     'WGFileManagerMain',
     'EnhancedFileList',
@@ -42,4 +35,53 @@ __all__ = [
     'get_logger',
     'set_debug_mode',
     'log_operation'
-]
\ No newline at end of file
+]
+
+# Map exported names to (module, attribute) so submodules are only
+# imported when actually used - importing the UI stack pulls in the
+# whole Enigma2 skin machinery, which callers that just want a logger
+# or config handle should not pay for at startup.
+_LAZY = {
+    'get_config': ('.core.config', 'get_config'),
+    'FileOperations': ('.core.file_ops', 'FileOperations'),
+    'create_main_screen': ('.ui.main_screen', 'create_main_screen'),
+    'WGFileManagerMain': ('.ui.main_screen', 'WGFileManagerMain'),
+    'EnhancedFileList': ('.ui.pane', 'EnhancedFileList'),
+    'FilePane': ('.ui.pane', 'FilePane'),
+    'create_progress_dialog': ('.ui.progress', 'create_progress_dialog'),
+    'OperationProgressDialog': ('.ui.progress', 'OperationProgressDialog'),
+    'PermissionDialog': ('.ui.permission_dialog', 'PermissionDialog'),
+    'format_permissions_with_octal': ('.utils.formatters', 'format_permissions_with_octal'),
+    'get_permissions_string': ('.utils.formatters', 'get_permissions_string'),
+    'get_permissions_octal': ('.utils.formatters', 'get_permissions_octal'),
+    'get_logger': ('.utils.logger', 'get_logger'),
+    'set_debug_mode': ('.utils.logger', 'set_debug_mode'),
+    'log_operation': ('.utils.logger', 'log_operation'),
+}
+
+if sys.version_info >= (3, 7):
+    # PEP 562: resolve exports on first attribute access
+    import importlib
+
+    def __getattr__(name):
+        try:
+            module_name, attr = _LAZY[name]
+        except KeyError:
+            raise AttributeError("module %r has no attribute %r" % (__name__, name))
+        value = getattr(importlib.import_module(module_name, __name__), attr)
+        globals()[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(list(globals()) + list(_LAZY)))
+
+else:
+    # Older Pythons have no module-level __getattr__ - import eagerly
+    from .core.config import get_config
+    from .core.file_ops import FileOperations
+    from .ui.main_screen import create_main_screen, WGFileManagerMain
+    from .ui.pane import EnhancedFileList, FilePane
+    from .ui.progress import create_progress_dialog, OperationProgressDialog
+    from .ui.permission_dialog import PermissionDialog
+    from .utils.formatters import format_permissions_with_octal, get_permissions_string, get_permissions_octal
+    from .utils.logger import get_logger, set_debug_mode, log_operation
@@ -0,0 +1,61 @@
+# cython: language_level=3
+"""
+Optional compiled fast paths for core/compatibility.py
+
+Build out-of-band with `cythonize -i core/_compat_fast.pyx` and ship the
+resulting extension next to compatibility.py; when it is absent the
+pure-Python implementations are used, so deployment without a compiler
+keeps working unchanged. Semantics must match compatibility.py exactly.
+"""
+
+
+cpdef str ensure_str(object s):
+    if type(s) is str:
+        return <str>s
+    if s is None:
+        return ''
+    if isinstance(s, bytes):
+        return (<bytes>s).decode('utf-8', 'replace')
+    return str(s)
+
+
+cpdef str ensure_unicode(object s):
+    cdef bytes b
+    if type(s) is str:
+        return <str>s
+    if s is None:
+        return ''
+    if isinstance(s, bytes):
+        b = <bytes>s
+        if b.isascii():
+            return b.decode('ascii')
+        return b.decode('utf-8', 'replace')
+    if isinstance(s, bytearray):
+        b = bytes(s)
+        if b.isascii():
+            return b.decode('ascii')
+        return b.decode('utf-8', 'replace')
+    return str(s)
+
+
+cdef dict _NAV_DELTA = {'up': -1, 'down': 1, 'pageup': -10, 'pagedown': 10}
+
+
+cpdef int get_navigation_index(int current_index, int total_items, direction,
+                               bint wrap_around=True):
+    if total_items <= 0:
+        return 0
+
+    delta_obj = _NAV_DELTA.get(direction)
+    if delta_obj is None:
+        return current_index
+
+    cdef int delta = delta_obj
+    cdef int new_index = current_index + delta
+    if wrap_around and (delta == 1 or delta == -1):
+        return new_index % total_items
+    if new_index < 0:
+        return 0
+    if new_index >= total_items:
+        return total_items - 1
+    return new_index
@@ -0,0 +1,80 @@
+# cython: language_level=3
+"""
+Optional compiled digest loop for core/file_ops.py
+
+Build out-of-band with `cythonize -i core/_fastdigest.pyx` (link with
+`libraries=['crypto']`) and ship the extension next to file_ops.py;
+when it is absent the hashlib read loop is used, so deployment without
+a compiler keeps working unchanged.
+
+The whole read/update cycle runs as one nogil C loop over OpenSSL's
+EVP_DigestUpdate: no Python bytecode per chunk, no bytes objects, and
+concurrent hash threads (verify_file) truly overlap.
+"""
+
+from libc.stdlib cimport malloc, free
+
+cdef extern from "unistd.h" nogil:
+    long read(int fd, void *buf, size_t count)
+
+cdef extern from "fcntl.h" nogil:
+    int posix_fadvise(int fd, long offset, long length, int advice)
+    int POSIX_FADV_SEQUENTIAL
+
+cdef extern from "openssl/evp.h" nogil:
+    ctypedef struct EVP_MD
+    ctypedef struct EVP_MD_CTX
+    const EVP_MD *EVP_md5()
+    EVP_MD_CTX *EVP_MD_CTX_new()
+    void EVP_MD_CTX_free(EVP_MD_CTX *ctx)
+    int EVP_DigestInit_ex(EVP_MD_CTX *ctx, const EVP_MD *md_type, void *impl)
+    int EVP_DigestUpdate(EVP_MD_CTX *ctx, const void *d, size_t cnt)
+    int EVP_DigestFinal_ex(EVP_MD_CTX *ctx, unsigned char *md, unsigned int *s)
+
+DEF _BUF_SIZE = 4 * 1024 * 1024
+
+
+def hash_fd(int fd, str algo='md5'):
+    """Digest the remaining bytes of an open fd; returns raw digest
+
+    Only 'md5' is supported - it is the one algorithm file_ops still
+    hashes through a Python-level chunk loop (blake3/blake2b have
+    their own C fast paths). Raises OSError on read or digest failure.
+    """
+    if algo != 'md5':
+        raise ValueError("unsupported algo: %s" % algo)
+
+    cdef unsigned char digest[64]
+    cdef unsigned int digest_len = 0
+    cdef long n = 0
+    cdef int ok = 1
+    cdef char *buf = <char *>malloc(_BUF_SIZE)
+    if buf == NULL:
+        raise MemoryError()
+    cdef EVP_MD_CTX *ctx = EVP_MD_CTX_new()
+    if ctx == NULL:
+        free(buf)
+        raise MemoryError()
+
+    try:
+        with nogil:
+            posix_fadvise(fd, 0, 0, POSIX_FADV_SEQUENTIAL)
+            ok = EVP_DigestInit_ex(ctx, EVP_md5(), NULL)
+            if ok == 1:
+                while True:
+                    n = read(fd, buf, _BUF_SIZE)
+                    if n <= 0:
+                        break
+                    if EVP_DigestUpdate(ctx, buf, <size_t>n) != 1:
+                        ok = 0
+                        break
+                if n < 0:
+                    ok = 0
+                if ok == 1 and EVP_DigestFinal_ex(ctx, digest, &digest_len) != 1:
+                    ok = 0
+        if ok != 1:
+            raise OSError("digest failed")
+        return bytes(digest[:digest_len])
+    finally:
+        EVP_MD_CTX_free(ctx)
+        free(buf)
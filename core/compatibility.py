@@ -1,353 +1,818 @@
 """
-Progress dialog with dual progress bars and operation controls
-Shows real-time progress for file operations
+Python 2/3 compatibility layer and common path helpers
+Lowest-level module - must not import from other plugin modules
 """
 
 from __future__ import absolute_import, print_function
-import threading
+import os
+import sys
+import errno
+import shutil
+import pwd
+import grp
+import operator
+from array import array
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import chain
 
+# Python version detection
+PY2 = sys.version_info[0] == 2
+PY3 = sys.version_info[0] >= 3
+
+# ConfigParser: module on Python 2, class on Python 3
+if PY2:
+    import ConfigParser
+else:
+    from configparser import ConfigParser
+
+# os.scandir: stdlib on Python 3.5+, 'scandir' backport package on Python 2
 try:
-    from Screens.Screen import Screen
-    from Components.Label import Label
-    from Components.ProgressBar import ProgressBar
-    from Components.ActionMap import ActionMap
-    from enigma import eTimer
-    ENIGMA2_AVAILABLE = True
+    from os import scandir
 except ImportError:
-    ENIGMA2_AVAILABLE = False
-    Screen = object
-
-from Plugins.Extensions.WGFileManagerPro.utils.formatters import format_size, format_speed, format_time
-from Plugins.Extensions.WGFileManagerPro.utils.logger import get_logger
-
-logger = get_logger(__name__)
-
-
-if ENIGMA2_AVAILABLE:
-    
-    class OperationProgressDialog(Screen):
-        """Progress dialog for file operations"""
-        
-        # Skin definition
-        skin = """
-            <screen position="center,center" size="800,450" title="Operation in Progress">
-                <widget name="title" position="20,20" size="760,40" font="Regular;28" />
-                
-                <!-- Current file progress -->
-                <widget name="current_label" position="20,80" size="760,30" font="Regular;22" />
-                <widget name="current_file" position="20,115" size="760,25" font="Regular;20" />
-                <widget name="current_progress" position="20,145" size="760,30" />
-                <widget name="current_stats" position="20,180" size="760,22" font="Regular;18" />
-                
-                <!-- Overall progress -->
-                <widget name="overall_label" position="20,220" size="760,30" font="Regular;22" />
-                <widget name="overall_progress" position="20,255" size="760,30" />
-                <widget name="overall_stats" position="20,290" size="760,22" font="Regular;18" />
-                
-                <!-- Status log -->
-                <widget name="log" position="20,330" size="760,60" font="Regular;16" />
-                
-                <!-- Controls -->
-                <widget name="buttons" position="20,400" size="760,30" font="Regular;20" halign="center" />
-            </screen>
-        """
-        
-        def __init__(self, session, operation_name="File Operation", file_operation=None):
-            """
-            Initialize progress dialog
-            
-            Args:
-                session: Enigma2 session
-                operation_name: Name of operation
-                file_operation: FileOperations instance
-            """
-            Screen.__init__(self, session)
-            self.session = session
-            
-            self.operation_name = operation_name
-            self.file_operation = file_operation
-            self.paused = False
-            self.cancelled = False
-            
-            # Timer connection reference for cleanup
-            self._timer_conn = None
-            
-            # UI components
-            self["title"] = Label(operation_name)
-            self["current_label"] = Label("Current File:")
-            self["current_file"] = Label("Initializing...")
-            self["current_progress"] = ProgressBar()
-            self["current_stats"] = Label("")
-            self["overall_label"] = Label("Overall Progress:")
-            self["overall_progress"] = ProgressBar()
-            self["overall_stats"] = Label("")
-            self["log"] = Label("")
-            self["buttons"] = Label("[PAUSE]  [SKIP]  [CANCEL]")
-            
-            # Setup actions
-            self["actions"] = ActionMap(
-                ["WGFileManagerActions", "ColorActions"],
-                {
-                    "yellow": self.toggle_pause,
-                    "blue": self.skip_file,
-                    "red": self.cancel_operation,
-                    "ok": self.toggle_pause,
-                    "cancel": self.handle_exit,
-                },
-                -1
-            )
-            
-            # Update timer
-            self.update_timer = eTimer()
-            
-            # Last progress data
-            self.last_progress = {}
-            
-            logger.info("[Progress] Dialog initialized: %s", operation_name)
-        
-        def start(self):
-            """Start progress tracking"""
-            # Clean up any existing timer connection
-            self.stop()
-            
-            # Add callback
-            self._timer_conn = self.update_display
-            self.update_timer.callback.append(self._timer_conn)
-            self.update_timer.start(100, False)
-            
-            logger.debug("[Progress] Progress tracking started")
-        
-        def stop(self):
-            """Stop progress tracking"""
-            if hasattr(self, 'update_timer') and self.update_timer.isActive():
-                self.update_timer.stop()
-            
-            # Remove callback
-            if hasattr(self, '_timer_conn') and self._timer_conn:
-                if self._timer_conn in self.update_timer.callback:
-                    self.update_timer.callback.remove(self._timer_conn)
-                self._timer_conn = None
-            
-            logger.debug("[Progress] Progress tracking stopped")
-        
-        def update_progress(self, data):
-            """
-            Update progress from operation
-            
-            Args:
-                data: Progress data dictionary
-            """
-            self.last_progress = data
-        
-        def update_display(self):
-            """Update display with latest progress"""
-            if not self.last_progress:
-                return
-            
-            try:
-                data = self.last_progress
-                
-                # Current file
-                if 'file' in data:
-                    self["current_file"].setText(data['file'])
-                
-                if 'percent' in data:
-                    self["current_progress"].setValue(data['percent'])
-                
-                # Current stats
-                stats = []
-                if 'copied' in data and 'total' in data:
-                    stats.append("%s / %s" % (
-                        format_size(data['copied']),
-                        format_size(data['total'])
-                    ))
-                
-                if 'speed' in data:
-                    stats.append("Speed: %s" % format_speed(data['speed']))
-                
-                if 'eta' in data:
-                    stats.append("ETA: %s" % format_time(data['eta']))
-                
-                if stats:
-                    self["current_stats"].setText("  |  ".join(stats))
-                
-                # Overall progress
-                if 'overall_percent' in data:
-                    self["overall_progress"].setValue(data['overall_percent'])
-                
-                # Overall stats
-                overall_stats = []
-                if 'completed' in data and 'files_total' in data:
-                    overall_stats.append("Files: %d / %d" % (
-                        data['completed'],
-                        data['files_total']
-                    ))
-                
-                if 'elapsed' in data:
-                    overall_stats.append("Elapsed: %s" % format_time(data['elapsed']))
-                
-                if 'errors' in data and data['errors'] > 0:
-                    overall_stats.append("Errors: %d" % data['errors'])
-                
-                if overall_stats:
-                    self["overall_stats"].setText("  |  ".join(overall_stats))
-                
-                # Check if operation is complete
-                if data.get('overall_percent', 0) >= 100:
-                    self.operation_complete()
-                    
-            except Exception as e:
-                logger.error("[Progress] Display update error: %s", e)
-        
-        def toggle_pause(self):
-            """Toggle pause state"""
-            if not self.file_operation:
-                return
-            
-            self.paused = not self.paused
-            
-            if self.paused:
-                self.file_operation.pause()
-                self["buttons"].setText("[RESUME]  [SKIP]  [CANCEL]")
-                self["log"].setText("Operation paused")
-                logger.debug("[Progress] Operation paused")
-            else:
-                self.file_operation.resume()
-                self["buttons"].setText("[PAUSE]  [SKIP]  [CANCEL]")
-                self["log"].setText("Operation resumed")
-                logger.debug("[Progress] Operation resumed")
-        
-        def skip_file(self):
-            """Skip current file"""
-            self["log"].setText("Skip not implemented yet")
-            logger.debug("[Progress] Skip requested")
-        
-        def cancel_operation(self):
-            """Cancel operation"""
-            if not self.file_operation:
-                return
-            
-            self.file_operation.cancel()
-            self.cancelled = True
-            self["log"].setText("Cancelling operation...")
-            self["buttons"].setText("Please wait...")
-            logger.info("[Progress] Operation cancelled by user")
-        
-        def handle_exit(self):
-            """Handle exit button"""
-            if self.paused or self.cancelled:
-                self.close_dialog()
-            else:
-                # Ask to cancel
-                self.cancel_operation()
-        
-        def operation_complete(self):
-            """Handle operation completion"""
-            self.stop()
-            
-            # Show completion message
-            errors = self.last_progress.get('errors', 0)
-            if errors > 0:
-                self["log"].setText("Completed with %d error(s)" % errors)
-            else:
-                self["log"].setText("Operation completed successfully!")
-            
-            self["buttons"].setText("[OK to close]")
-            logger.info("[Progress] Operation completed. Errors: %d", errors)
-            
-            # Auto-close after 2 seconds if no errors
-            if errors == 0:
-                from enigma import eTimer
-                close_timer = eTimer()
-                close_timer.callback.append(self.close_dialog)
-                close_timer.start(2000, True)  # 2 seconds, single shot
-        
-        def close_dialog(self):
-            """Close the dialog"""
-            self.stop()
-            self.close(self.cancelled)
-        
-        def __del__(self):
-            """Cleanup"""
-            self.stop()
+    try:
+        from scandir import scandir
+    except ImportError:
+        scandir = None
+
+
+# ==================== STRING CONVERSION ====================
+#
+# These run for every path touched during a listing, so the common case
+# (already the right type) must be as close to a no-op as possible. The
+# Python 2/3 branch is taken once at import time by binding the right
+# implementation, and each implementation checks the dominant input type
+# first with an exact `type() is` test, which is cheaper than isinstance.
+
+def _ensure_str_py3(s, _str=str, _bytes=bytes):
+    if type(s) is _str:
+        return s
+    if s is None:
+        return ''
+    if type(s) is _bytes or isinstance(s, _bytes):
+        return s.decode('utf-8', errors='replace')
+    return _str(s)
+
+
+def _ensure_str_py2(s):
+    if type(s) is str:
+        return s
+    if s is None:
+        return ''
+    if isinstance(s, unicode):  # noqa: F821
+        return s.encode('utf-8')
+    return str(s)
+
+
+def _ensure_unicode_py3(s, _str=str, _bytes=bytes):
+    if type(s) is _str:
+        return s
+    if s is None:
+        return u''
+    if isinstance(s, (_bytes, bytearray)):
+        # Filenames are overwhelmingly ASCII - the C-level isascii check
+        # plus plain ascii decode skips the UTF-8 state machine and the
+        # 'replace' error-handler setup on the common path
+        if s.isascii():
+            return s.decode('ascii')
+        return s.decode('utf-8', errors='replace')
+    return _str(s)
+
+
+def _ensure_unicode_py2(s):
+    if type(s) is unicode:  # noqa: F821
+        return s
+    if s is None:
+        return u''
+    if isinstance(s, str):
+        try:
+            return s.decode('ascii')
+        except UnicodeDecodeError:
+            return s.decode('utf-8', errors='replace')
+    return unicode(s)  # noqa: F821
 
 
+def _ensure_bytes(s, _bytes=bytes):
+    if type(s) is _bytes:
+        return s
+    if s is None:
+        return b''
+    return ensure_unicode(s).encode('utf-8')
+
+
+if PY2:
+    ensure_str = _ensure_str_py2
+    ensure_unicode = _ensure_unicode_py2
 else:
-    # Non-Enigma2 progress dialog (simple console version)
-    
-    class OperationProgressDialog:
-        """Simple progress dialog for testing"""
-        
-        def __init__(self, session=None, operation_name="Operation", file_operation=None):
-            """
-            Initialize progress dialog for testing
-            
-            Args:
-                session: Enigma2 session (ignored in test mode)
-                operation_name: Operation name
-                file_operation: FileOperations instance
-            """
-            self.session = session
-            self.operation_name = operation_name
-            self.file_operation = file_operation
-            self.paused = False
-            self.cancelled = False
-            print("\n=== %s ===" % operation_name)
-        
-        def start(self):
-            """Start tracking"""
-            pass
-        
-        def stop(self):
-            """Stop tracking"""
-            pass
-        
-        def update_progress(self, data):
-            """Update progress"""
-            if 'file' in data:
-                print("File: %s" % data['file'])
-            if 'percent' in data:
-                print("Progress: %d%%" % data['percent'])
-            if 'overall_percent' in data:
-                print("Overall: %d%%" % data['overall_percent'])
-        
-        def toggle_pause(self):
-            """Toggle pause"""
-            self.paused = not self.paused
-            if self.file_operation:
-                if self.paused:
-                    self.file_operation.pause()
-                    print("Operation paused")
-                else:
-                    self.file_operation.resume()
-                    print("Operation resumed")
-        
-        def cancel_operation(self):
-            """Cancel"""
-            if self.file_operation:
-                self.file_operation.cancel()
-            self.cancelled = True
-            print("Operation cancelled")
-        
-        def close_dialog(self):
-            """Close"""
-            print("=== Operation Complete ===\n")
-
-
-# Factory function
-def create_progress_dialog(session, operation_name, file_operation=None):
+    ensure_str = _ensure_str_py3
+    ensure_unicode = _ensure_unicode_py3
+ensure_bytes = _ensure_bytes
+
+ensure_str.__doc__ = """
+    Ensure value is a native str for the running Python version
+
+    Args:
+        s: String, bytes or other value
+
+    Returns:
+        str: Native string ('' for None)
+    """
+ensure_unicode.__doc__ = """
+    Ensure value is a unicode string
+
+    Args:
+        s: String, bytes or other value
+
+    Returns:
+        unicode/str: Unicode string ('' for None)
+    """
+ensure_bytes.__doc__ = """
+    Ensure value is a bytes object
+
+    Args:
+        s: String, bytes or other value
+
+    Returns:
+        bytes: Byte string (b'' for None)
+    """
+
+
+# ==================== DIRECTORY LISTING ====================
+
+class DirListing(object):
+    """
+    Directory listing as parallel per-column arrays
+
+    One scandir pass fills names plus compact typed arrays for sizes,
+    mtimes and type flags, so per-column work (sorting by size, drawing
+    the size column) walks one contiguous array instead of re-statting
+    or chasing per-entry objects. Iterating the listing yields names,
+    matching the old list-of-names shape.
+    """
+
+    __slots__ = ('names', 'sizes', 'mtimes', 'flags')
+
+    # Bits in flags
+    IS_DIR = 1
+    IS_LINK = 2
+
+    def __init__(self, names=None, sizes=None, mtimes=None, flags=None):
+        self.names = names if names is not None else []
+        self.sizes = sizes if sizes is not None else array('q')
+        self.mtimes = mtimes if mtimes is not None else array('d')
+        self.flags = flags if flags is not None else array('B')
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def is_dir(self, index):
+        """Check if entry at index is a directory"""
+        return bool(self.flags[index] & self.IS_DIR)
+
+    def is_link(self, index):
+        """Check if entry at index is a symbolic link"""
+        return bool(self.flags[index] & self.IS_LINK)
+
+
+def _scan(path):
+    """Build a DirListing from one scandir pass over path"""
+    listing = DirListing()
+    append_name = listing.names.append
+    append_size = listing.sizes.append
+    append_mtime = listing.mtimes.append
+    append_flags = listing.flags.append
+
+    with scandir(path) as it:
+        for entry in it:
+            try:
+                st = entry.stat(follow_symlinks=False)
+                flags = 0
+                if entry.is_dir(follow_symlinks=False):
+                    flags |= DirListing.IS_DIR
+                if entry.is_symlink():
+                    flags |= DirListing.IS_LINK
+            except OSError:
+                # Entry disappeared mid-scan - keep the name, zero the rest
+                st = None
+                flags = 0
+            append_name(ensure_unicode(entry.name))
+            append_size(st.st_size if st is not None else 0)
+            append_mtime(st.st_mtime if st is not None else 0.0)
+            append_flags(flags)
+
+    return listing
+
+
+# Recently listed directories, keyed by path with the directory mtime
+# captured at scan time. Navigating back and forth between the same few
+# directories is the dominant browsing pattern, and any write to a
+# directory bumps its mtime, so a matching mtime means the cached
+# listing is still current. Bounded LRU - set-top boxes are memory
+# constrained.
+_DIR_CACHE_MAX = 32
+_dir_cache = OrderedDict()  # path -> (mtime, DirListing)
+
+
+def safe_listdir(path):
+    """
+    List a directory in one os.scandir pass
+
+    Returns a DirListing whose parallel arrays carry name, size, mtime
+    and type flags per entry, all captured from the cached DirEntry stat
+    during the scan. Repeat listings of an unchanged directory (same
+    mtime) are served from a small LRU cache. Callers that only need
+    names can iterate it directly or use safe_listdir_names().
+
+    Args:
+        path: Directory path
+
+    Returns:
+        DirListing: Listing (empty on error)
+    """
+    path = ensure_str(path)
+    try:
+        st = os.stat(path)
+    except OSError:
+        return DirListing()
+    mtime = getattr(st, 'st_mtime_ns', None) or st.st_mtime
+
+    cached = _dir_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        _dir_cache.move_to_end(path)
+        return cached[1]
+
+    try:
+        listing = _scan(path)
+    except OSError:
+        return DirListing()
+
+    _dir_cache[path] = (mtime, listing)
+    _dir_cache.move_to_end(path)
+    if len(_dir_cache) > _DIR_CACHE_MAX:
+        _dir_cache.popitem(last=False)
+    return listing
+
+
+def invalidate_dir(path):
+    """
+    Drop the cached listing for a directory
+
+    The mtime check already catches most writes; this is for callers
+    that modified a directory and want the next listing re-scanned even
+    on filesystems with coarse mtime granularity.
+
+    Args:
+        path: Directory path
+    """
+    _dir_cache.pop(ensure_str(path), None)
+
+
+def clear_dir_cache():
+    """Drop all cached directory listings"""
+    _dir_cache.clear()
+
+
+def safe_listdir_names(path):
+    """
+    List directory entry names (compatibility shim)
+
+    Args:
+        path: Directory path
+
+    Returns:
+        list: Entry names as unicode strings (empty list on error)
+    """
+    return list(safe_listdir(path).names)
+
+
+# ==================== OWNERSHIP LOOKUPS ====================
+#
+# The same handful of uid/gid values recurs across almost every entry in
+# a listing, so the name resolution is memoized - one passwd/group
+# database hit per unique id instead of one per row.
+
+@lru_cache(maxsize=1024)
+def _uid_to_name(uid):
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
+
+
+@lru_cache(maxsize=1024)
+def _gid_to_name(gid):
+    try:
+        return grp.getgrgid(gid).gr_name
+    except KeyError:
+        return str(gid)
+
+
+def get_owner_name(path):
+    """
+    Get owner name for path (uid as string if unknown)
+
+    Args:
+        path: File path
+
+    Returns:
+        str: Owner name ('' on error)
+    """
+    try:
+        return _uid_to_name(os.stat(ensure_str(path)).st_uid)
+    except OSError:
+        return ''
+
+
+def get_group_name(path):
+    """
+    Get group name for path (gid as string if unknown)
+
+    Args:
+        path: File path
+
+    Returns:
+        str: Group name ('' on error)
+    """
+    try:
+        return _gid_to_name(os.stat(ensure_str(path)).st_gid)
+    except OSError:
+        return ''
+
+
+def clear_id_cache():
+    """Reset the cached uid/gid name lookups"""
+    _uid_to_name.cache_clear()
+    _gid_to_name.cache_clear()
+
+
+# ==================== PATH HELPERS ====================
+
+def safe_join(*args, _join=os.path.join, _str=str):
+    """
+    Join path components, converting each to native str
+
+    Args:
+        *args: Path components
+
+    Returns:
+        str: Joined path
+    """
+    # Callers have almost always converted already - join directly then,
+    # running ensure_str over the components only when needed
+    for a in args:
+        if type(a) is not _str:
+            return _join(*[ensure_str(x) for x in args])
+    return _join(*args)
+
+
+@lru_cache(maxsize=1024)
+def normalize_path(path, _normpath=os.path.normpath, _abspath=os.path.abspath,
+                   _e=ensure_str):
+    """
+    Normalize path to an absolute, collapsed form
+
+    Results are cached - users navigate the same handful of paths
+    repeatedly.
+
+    Args:
+        path: Path to normalize
+
+    Returns:
+        str: Normalized path
+    """
+    try:
+        return _normpath(_abspath(_e(path)))
+    except (TypeError, ValueError):
+        return _e(path)
+
+
+def compare_paths(path1, path2):
     """
-    Create appropriate progress dialog
-    
+    Compare two paths after normalization
+
     Args:
-        session: Enigma2 session (or None)
-        operation_name: Operation name
-        file_operation: FileOperations instance
-        
+        path1: First path
+        path2: Second path
+
     Returns:
-        Progress dialog instance
+        bool: True if both refer to the same location
+    """
+    if path1 is path2 or path1 == path2:
+        return True
+    return normalize_path(path1) == normalize_path(path2)
+
+
+# The single-call wrappers below run once per entry during a listing.
+# The os.path functions are bound as default arguments so each call skips
+# the module and attribute lookups, and the except clauses are narrowed
+# to the exceptions the wrapped call can actually raise.
+
+def path_exists(path, _f=os.path.exists, _e=ensure_str):
+    """Check if path exists"""
+    try:
+        return _f(_e(path))
+    except OSError:
+        return False
+
+
+def is_directory(path, _f=os.path.isdir, _e=ensure_str):
+    """Check if path is a directory"""
+    try:
+        return _f(_e(path))
+    except OSError:
+        return False
+
+
+def is_file(path, _f=os.path.isfile, _e=ensure_str):
+    """Check if path is a regular file"""
+    try:
+        return _f(_e(path))
+    except OSError:
+        return False
+
+
+def is_symlink(path, _f=os.path.islink, _e=ensure_str):
+    """Check if path is a symbolic link"""
+    try:
+        return _f(_e(path))
+    except OSError:
+        return False
+
+
+def get_file_size(path, _f=os.path.getsize, _e=ensure_str):
+    """Get file size in bytes (0 on error)"""
+    try:
+        return _f(_e(path))
+    except OSError:
+        return 0
+
+
+def get_file_mtime(path, _f=os.path.getmtime, _e=ensure_str):
+    """Get file modification time (0 on error)"""
+    try:
+        return _f(_e(path))
+    except OSError:
+        return 0
+
+
+def get_parent_path(path, _f=os.path.dirname, _e=ensure_str):
+    """Get parent directory of path"""
+    try:
+        return _f(_e(path))
+    except (TypeError, ValueError):
+        return ''
+
+
+def get_basename(path, _f=os.path.basename, _e=ensure_str):
+    """Get base name of path"""
+    try:
+        return _f(_e(path))
+    except (TypeError, ValueError):
+        return ''
+
+
+def is_valid_path(path):
+    """
+    Check if path looks usable (non-empty, absolute)
+
+    Args:
+        path: Path to check
+
+    Returns:
+        bool: True if path is valid
+    """
+    try:
+        path = ensure_str(path)
+        return bool(path) and os.path.isabs(path)
+    except (TypeError, ValueError):
+        return False
+
+
+def get_common_path(paths):
+    """
+    Get common parent path of multiple paths
+
+    Args:
+        paths: List of paths
+
+    Returns:
+        str: Common parent path ('/' if none)
+    """
+    if not paths:
+        return '/'
+    try:
+        # Stream over the paths instead of materializing a converted
+        # list for commonpath: trim the candidate component list as we
+        # go and bail out as soon as it collapses to root, skipping the
+        # ensure_str pass over the remaining entries entirely
+        it = iter(paths)
+        common = ensure_str(next(it)).split(os.sep)
+        for p in it:
+            parts = ensure_str(p).split(os.sep)
+            limit = min(len(common), len(parts))
+            i = 0
+            while i < limit and common[i] == parts[i]:
+                i += 1
+            del common[i:]
+            if not common or common == ['']:
+                return '/'
+        return os.sep.join(common) or '/'
+    except (TypeError, StopIteration):
+        return '/'
+
+
+# ==================== FILESYSTEM OPERATIONS ====================
+
+def create_directory(path, mode=0o755):
+    """Create directory (including parents), return True on success"""
+    try:
+        path = ensure_str(path)
+        os.makedirs(path, mode)
+        invalidate_dir(os.path.dirname(path))
+        return True
+    except OSError:
+        return False
+
+
+def remove_file(path):
+    """Remove a file, return True on success"""
+    try:
+        path = ensure_str(path)
+        os.remove(path)
+        invalidate_dir(os.path.dirname(path))
+        return True
+    except OSError:
+        return False
+
+
+# os.fwalk (Python 3.3+, POSIX only) yields a directory fd alongside the
+# names, so deletions can go through unlink(dir_fd=...) without the
+# kernel re-resolving the full path for every entry
+_HAS_FWALK = hasattr(os, 'fwalk')
+
+
+def _fast_rmtree(path):
+    """Remove a tree bottom-up using fwalk's directory fds"""
+    for dirpath, dirnames, filenames, dirfd in os.fwalk(path, topdown=False):
+        for name in filenames:
+            os.unlink(name, dir_fd=dirfd)
+        for name in dirnames:
+            try:
+                os.rmdir(name, dir_fd=dirfd)
+            except OSError as exc:
+                # symlinks to directories are listed here but must be
+                # unlinked, never rmdir'd
+                if exc.errno != errno.ENOTDIR:
+                    raise
+                os.unlink(name, dir_fd=dirfd)
+    os.rmdir(path)
+
+
+def remove_directory(path):
+    """Remove a directory tree, return True on success"""
+    try:
+        path = ensure_str(path)
+        if _HAS_FWALK:
+            _fast_rmtree(path)
+        else:
+            shutil.rmtree(path)
+        invalidate_dir(path)
+        invalidate_dir(os.path.dirname(path))
+        return True
+    except OSError:
+        return False
+
+
+# In-kernel fd-to-fd copy syscalls, probed once at import so the copy
+# hot path never repeats the hasattr checks. copy_file_range can reflink
+# on CoW filesystems; sendfile at least avoids bouncing data through
+# userspace buffers.
+_HAS_COPY_FILE_RANGE = hasattr(os, 'copy_file_range')
+_HAS_SENDFILE = hasattr(os, 'sendfile')
+
+# errnos meaning "this syscall/filesystem combination is unsupported" -
+# safe to fall back as long as no bytes were moved yet
+_COPY_FALLBACK_ERRNOS = (errno.EINVAL, errno.ENOSYS, errno.EXDEV,
+                         errno.EOPNOTSUPP, errno.EBADF)
+
+
+def _fd_copy(copyfn, size):
+    """
+    Copy size bytes with an fd-to-fd syscall wrapper
+
+    Returns True when the copy completed, False if the syscall is
+    unsupported here and nothing was written yet; re-raises mid-copy
+    failures.
     """
-    if ENIGMA2_AVAILABLE and session:
-        return OperationProgressDialog(session, operation_name, file_operation)
-    else:
-        return OperationProgressDialog(session, operation_name, file_operation)
\ No newline at end of file
+    copied = 0
+    while copied < size:
+        try:
+            n = copyfn(size - copied)
+        except OSError as exc:
+            if copied == 0 and exc.errno in _COPY_FALLBACK_ERRNOS:
+                return False
+            raise
+        if n == 0:
+            break
+        copied += n
+    return True
+
+
+def copy_file(src, dst, _copyfileobj=shutil.copyfileobj,
+              _copystat=shutil.copystat):
+    """Copy a file preserving metadata, return True on success"""
+    try:
+        src = ensure_str(src)
+        dst = ensure_str(dst)
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            sfd = fsrc.fileno()
+            dfd = fdst.fileno()
+            size = os.fstat(sfd).st_size
+            done = False
+            if _HAS_COPY_FILE_RANGE:
+                done = _fd_copy(
+                    lambda count: os.copy_file_range(sfd, dfd, count), size)
+            if not done and _HAS_SENDFILE:
+                done = _fd_copy(
+                    lambda count: os.sendfile(dfd, sfd, None, count), size)
+            if not done:
+                # Userspace fallback with a large buffer to keep the
+                # read/write syscall count down
+                fsrc.seek(0)
+                _copyfileobj(fsrc, fdst, 1024 * 1024)
+        _copystat(src, dst)
+        invalidate_dir(os.path.dirname(dst))
+        return True
+    except OSError:
+        return False
+
+
+def move_file(src, dst, _move=shutil.move):
+    """Move a file or directory, return True on success"""
+    try:
+        src = ensure_str(src)
+        dst = ensure_str(dst)
+        _move(src, dst)
+        invalidate_dir(os.path.dirname(src))
+        invalidate_dir(os.path.dirname(dst))
+        return True
+    except (OSError, shutil.Error):
+        return False
+
+
+# ==================== NAVIGATION ====================
+
+# Index delta per navigation direction; single steps wrap, page steps
+# clamp at the list boundaries
+_NAV_DELTA = {'up': -1, 'down': 1, 'pageup': -10, 'pagedown': 10}
+
+
+class NavigationHelper:
+    """Index calculations for list navigation"""
+
+    @staticmethod
+    def get_navigation_index(current_index, total_items, direction, wrap_around=True,
+                             _delta=_NAV_DELTA):
+        """
+        Calculate new selection index for a navigation event
+
+        Args:
+            current_index: Current selection index
+            total_items: Number of items in the list
+            direction: 'up', 'down', 'pageup' or 'pagedown'
+            wrap_around: Wrap at list boundaries
+
+        Returns:
+            int: New selection index
+        """
+        if total_items <= 0:
+            return 0
+
+        delta = _delta.get(direction)
+        if delta is None:
+            return current_index
+
+        new_index = current_index + delta
+        if wrap_around and (delta == 1 or delta == -1):
+            # One dict hit plus a modulo replaces the per-direction
+            # compare/branch chain
+            return new_index % total_items
+        if new_index < 0:
+            return 0
+        if new_index >= total_items:
+            return total_items - 1
+        return new_index
+
+    @staticmethod
+    def find_item_by_name(items, name, start_index=0):
+        """
+        Find first item whose name starts with the given prefix
+
+        Searches forward from start_index and wraps around. Items may be
+        objects with get_name(), dicts with a 'name' key, (path, is_dir,
+        name, ...) tuples or plain strings.
+
+        Args:
+            items: List of items
+            name: Name prefix to search for (case-insensitive)
+            start_index: Index to start searching from
+
+        Returns:
+            int: Index of match or -1
+        """
+        if not items or not name:
+            return -1
+
+        name_lower = ensure_unicode(name).lower()
+        total = len(items)
+
+        # The list is homogeneous, so detect the item shape once from the
+        # first item and bind a plain getter - the per-item hasattr/
+        # isinstance chain is what made this loop stall on large panes.
+        first = items[0]
+        if hasattr(first, 'get_name'):
+            getter = operator.methodcaller('get_name')
+        elif isinstance(first, dict):
+            getter = operator.methodcaller('get', 'name', '')
+        elif isinstance(first, (list, tuple)) and len(first) > 2:
+            getter = operator.itemgetter(2)
+        else:
+            getter = None
+
+        # Search forward from start_index and wrap, without a modulo per
+        # iteration.
+        order = chain(range(start_index, total), range(0, start_index))
+        if getter is None:
+            for idx in order:
+                item_name = ensure_unicode(items[idx])
+                if item_name and item_name.lower().startswith(name_lower):
+                    return idx
+        else:
+            for idx in order:
+                item_name = ensure_unicode(getter(items[idx]))
+                if item_name and item_name.lower().startswith(name_lower):
+                    return idx
+
+        return -1
+
+
+# ==================== CLASS HELPERS ====================
+
+if PY2:
+    def add_metaclass(metaclass):
+        """
+        Class decorator for creating a class with a metaclass (PY2 only)
+
+        On Python 3 use native `class X(base, metaclass=meta)` syntax:
+        it has no import-time cost and keeps __slots__ compaction, which
+        the dict-copying decorator loses.
+
+        Args:
+            metaclass: Metaclass to apply
+
+        Returns:
+            Class decorator
+        """
+        def wrapper(cls):
+            orig_vars = cls.__dict__.copy()
+            slots = orig_vars.get('__slots__')
+            if slots is not None:
+                if isinstance(slots, str):
+                    slots = [slots]
+                for slots_var in slots:
+                    orig_vars.pop(slots_var)
+            orig_vars.pop('__dict__', None)
+            orig_vars.pop('__weakref__', None)
+            return metaclass(cls.__name__, cls.__bases__, orig_vars)
+        return wrapper
+else:
+    def add_metaclass(metaclass):
+        """Removed on Python 3 - use native metaclass syntax instead"""
+        raise RuntimeError(
+            "add_metaclass is Python 2 only; "
+            "use 'class X(base, metaclass=...)' on Python 3")
+
+
+# ==================== OPTIONAL COMPILED FAST PATHS ====================
+#
+# A Cython build of the hottest helpers can be dropped in as
+# core/_compat_fast (see _compat_fast.pyx). When present it replaces the
+# pure-Python implementations above with identical semantics; when
+# absent, nothing changes.
+
+try:
+    from Plugins.Extensions.WGFileManagerPro.core import _compat_fast
+except ImportError:
+    try:
+        from . import _compat_fast
+    except ImportError:
+        _compat_fast = None
+
+if _compat_fast is not None:
+    ensure_str = _compat_fast.ensure_str
+    ensure_unicode = _compat_fast.ensure_unicode
+    NavigationHelper.get_navigation_index = staticmethod(
+        _compat_fast.get_navigation_index)
@@ -4,8 +4,12 @@ Handles all settings, preferences, and persistent storage
 """
 
 from __future__ import absolute_import, print_function
+import json
+import logging
 import os
 import sys
+from collections import deque
+from contextlib import contextmanager
 
 # Define logger placeholder - will be initialized after config
 _logger = None
@@ -23,6 +27,15 @@ def _get_logger():
             _logger = logging.getLogger('wgfilemanager.config')
     return _logger
 
+def _invalidate_plugin_runtime():
+    """Drop plugin.py's cached logger/debug pair (lazy import to avoid
+    a circular dependency on the plugin entry point)"""
+    try:
+        from Plugins.Extensions.WGFileManagerPro.plugin import invalidate_runtime
+    except ImportError:
+        return
+    invalidate_runtime()
+
 # Try to import Enigma2 config system
 try:
     from Components.config import config, ConfigSubsection, ConfigSelection, \
@@ -39,175 +52,290 @@ except ImportError:
 from Plugins.Extensions.WGFileManagerPro.core.compatibility import ensure_str, ensure_unicode, ConfigParser
 
 
+if ENIGMA2_AVAILABLE:
+    _YES_NO = [("yes", "Yes"), ("no", "No")]
+
+    # Declarative schema: section -> ((attribute, factory, kwargs), ...).
+    # Sections are registered lazily on first access, so a session that
+    # only reads a couple of values never constructs the other ~40
+    # Config objects.
+    _SCHEMA = {
+        'paths': (
+            ('left_path', ConfigText, {'default': '/media/hdd', 'fixed_size': False}),
+            ('right_path', ConfigText, {'default': '/tmp', 'fixed_size': False}),
+            ('save_left_on_exit', ConfigSelection, {'default': 'yes', 'choices': _YES_NO}),
+            ('save_right_on_exit', ConfigSelection, {'default': 'yes', 'choices': _YES_NO}),
+            ('default_left_path', ConfigText, {'default': '/media/hdd', 'fixed_size': False}),
+            ('default_right_path', ConfigText, {'default': '/tmp', 'fixed_size': False}),
+        ),
+        'navigation': (
+            ('enable_wraparound', ConfigYesNo, {'default': True}),
+            ('scroll_speed', ConfigSelection, {
+                'default': 'normal',
+                'choices': [("slow", "Slow"), ("normal", "Normal"), ("fast", "Fast")]}),
+            ('items_per_page', ConfigInteger, {'default': 20, 'limits': (5, 100)}),
+            ('confirm_exit', ConfigYesNo, {'default': True}),
+            ('exit_behavior', ConfigSelection, {
+                'default': 'parent',
+                'choices': [("parent", "Go to parent"), ("exit", "Exit immediately")]}),
+        ),
+        'view': (
+            ('show_hidden_files', ConfigYesNo, {'default': False}),
+            ('show_file_size', ConfigYesNo, {'default': True}),
+            ('show_file_date', ConfigYesNo, {'default': False}),
+            ('show_icons', ConfigYesNo, {'default': True}),
+            ('show_permissions', ConfigYesNo, {'default': False}),
+            ('sort_dirs_first', ConfigYesNo, {'default': True}),
+            ('sort_case_sensitive', ConfigYesNo, {'default': False}),
+            ('view_mode', ConfigSelection, {
+                'default': 'list', 'choices': [("list", "List"), ("grid", "Grid")]}),
+            ('font_size', ConfigSelection, {
+                'default': 'auto',
+                'choices': [("auto", "Auto"), ("small", "Small"),
+                            ("medium", "Medium"), ("large", "Large")]}),
+        ),
+        'theme': (
+            ('theme', ConfigSelection, {
+                'default': 'dark',
+                'choices': [("dark", "Dark"), ("light", "Light"), ("blue", "Blue"),
+                            ("green", "Green"), ("orange", "Orange"), ("purple", "Purple")]}),
+            ('icon_set', ConfigSelection, {
+                'default': 'modern',
+                'choices': [("modern", "Modern"), ("classic", "Classic"),
+                            ("minimal", "Minimal"), ("colorful", "Colorful")]}),
+            ('highlight_color', ConfigSelection, {
+                'default': 'blue',
+                'choices': [("blue", "Blue"), ("green", "Green"),
+                            ("red", "Red"), ("yellow", "Yellow")]}),
+        ),
+        'operations': (
+            ('confirm_delete', ConfigYesNo, {'default': True}),
+            ('confirm_overwrite', ConfigYesNo, {'default': True}),
+            ('use_trash', ConfigYesNo, {'default': True}),
+            ('verify_copy', ConfigYesNo, {'default': False}),
+            ('buffer_size', ConfigInteger, {'default': 1024, 'limits': (4, 1024)}),  # KB
+            ('parallel_copies', ConfigInteger, {'default': 4, 'limits': (1, 16)}),
+            ('parallel_scan', ConfigYesNo, {'default': True}),
+            ('preserve_permissions', ConfigYesNo, {'default': True}),
+            ('default_file_perms', ConfigText, {'default': '644', 'fixed_size': False}),
+            ('default_dir_perms', ConfigText, {'default': '755', 'fixed_size': False}),
+        ),
+        'network': (
+            ('ftp_timeout', ConfigInteger, {'default': 30, 'limits': (5, 300)}),
+            ('network_buffer', ConfigInteger, {'default': 32, 'limits': (4, 256)}),  # KB
+            ('enable_ftp', ConfigYesNo, {'default': False}),
+            ('enable_smb', ConfigYesNo, {'default': False}),
+        ),
+        'media': (
+            ('auto_thumbnails', ConfigYesNo, {'default': True}),
+            ('thumbnail_size', ConfigSelection, {
+                'default': 'medium',
+                'choices': [("small", "Small"), ("medium", "Medium"), ("large", "Large")]}),
+            ('show_metadata', ConfigYesNo, {'default': True}),
+            ('auto_play_media', ConfigYesNo, {'default': True}),
+            ('media_player', ConfigSelection, {
+                'default': 'enigma2',
+                'choices': [("enigma2", "Enigma2 Player"), ("external", "External Player")]}),
+        ),
+        'advanced': (
+            ('debug_mode', ConfigYesNo, {'default': False}),
+            ('log_operations', ConfigYesNo, {'default': True}),
+            ('max_history', ConfigInteger, {'default': 50, 'limits': (10, 500)}),
+            ('max_log_size', ConfigInteger, {'default': 1024, 'limits': (100, 10240)}),  # KB
+            ('enable_animations', ConfigYesNo, {'default': True}),
+            ('cache_size', ConfigInteger, {'default': 10, 'limits': (1, 100)}),  # MB
+        ),
+    }
+else:
+    _SCHEMA = {}
+
+# Attribute name -> schema section, for resolving which section a
+# get()/set() key needs registered
+_ATTR_SECTION = {}
+for _section, _entries in _SCHEMA.items():
+    for _name, _factory, _kw in _entries:
+        _ATTR_SECTION[_name] = _section
+
+
 class WGFileManagerConfig:
     """Main configuration manager"""
     
     def __init__(self):
         """Initialize configuration"""
-        self.config_file = "/etc/enigma2/wg_filemanager.conf"
-        self.setup_enigma2_config()
+        # Resolved once; every config write used to call _get_logger()
+        # inline before logging
+        self.log = _get_logger()
+        # JSON is the canonical on-disk form: one json.load at startup,
+        # one json.dump per flush, native types (no INI string coercion).
+        # A legacy .conf file is migrated once on first load.
+        self.config_file = "/etc/enigma2/wg_filemanager.json"
+        self.legacy_config_file = "/etc/enigma2/wg_filemanager.conf"
+        # In-memory settings dict shared by all mutations; written back
+        # only on flush() so bulk operations do one rewrite instead of
+        # one per key
+        self._data = None
+        self._data_mtime = 0
+        self._dirty = False
+        self._in_batch = False
+        # Schema sections whose Config objects exist; filled lazily by
+        # _ensure_section so startup registers nothing
+        self._ready_sections = set()
+        # Recent paths ring, oldest first; loaded lazily from the
+        # [recent] section so navigation events stay in-memory ops
+        self._recent = None
+        # Memoized get_all_settings result; dropped on any set()
+        self._settings_cache = None
+        # Next free bookmark_%d id; computed once instead of probing
+        # every existing key on each save_bookmark
+        self._next_bookmark_id = None
+
+    def _file_mtime(self):
+        """mtime of the config file (ns where available), 0 if missing"""
+        try:
+            st = os.stat(self.config_file)
+            return getattr(st, 'st_mtime_ns', None) or st.st_mtime
+        except OSError:
+            return 0
+
+    def _load_data(self):
+        """
+        Get the settings dict, re-reading the file only when it changed
+
+        Steady-state cost is a single stat(); the JSON text is only
+        re-parsed when something else modified the file on disk.
+        Pending unflushed mutations are never thrown away.
+        """
+        mtime = self._file_mtime()
+        if self._data is None or (not self._dirty
+                                  and mtime != self._data_mtime):
+            if mtime:
+                try:
+                    with open(self.config_file, 'r') as f:
+                        self._data = json.load(f)
+                except (ValueError, OSError):
+                    self._data = {}
+            else:
+                self._data = self._migrate_legacy_config()
+            self._data_mtime = mtime
+        return self._data
+
+    def _migrate_legacy_config(self):
+        """One-shot import of the old INI config file, if present"""
+        data = {}
+        try:
+            parser = self._get_config_parser()
+            # read() silently skips missing files and returns the list
+            # of files it parsed - no separate exists() stat needed
+            if parser.read(self.legacy_config_file):
+                for section in parser.sections():
+                    converted = {}
+                    for option, value in parser.items(section):
+                        converted[option] = self._coerce_legacy_value(value)
+                    data[section] = converted
+                self.log.info("[Config] Migrated legacy config from %s",
+                              self.legacy_config_file)
+        except Exception:
+            pass
+        return data
+
+    @staticmethod
+    def _coerce_legacy_value(value):
+        """Apply the old INI string-to-type heuristics during migration"""
+        lowered = value.lower()
+        if lowered in ('yes', 'true', '1'):
+            return True
+        if lowered in ('no', 'false', '0'):
+            return False
+        if value.isdigit():
+            return int(value)
+        return ensure_unicode(value)
+
+    def _atomic_write(self, data):
+        """Write the settings dict to a temp file and rename it into place
+
+        os.replace is atomic on POSIX, so a crash mid-write leaves the
+        old config intact instead of a truncated file.
+        """
+        tmp_path = '%s.tmp.%d' % (self.config_file, os.getpid())
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f, separators=(',', ':'))
+            # os.replace is Python 3 only; plain rename overwrites
+            # atomically on POSIX too
+            getattr(os, 'replace', os.rename)(tmp_path, self.config_file)
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def flush(self):
+        """Write pending config changes to disk"""
+        if not self._dirty or self._data is None:
+            return
+        try:
+            config_dir = os.path.dirname(self.config_file)
+            if config_dir:
+                try:
+                    os.makedirs(config_dir)
+                except OSError:
+                    pass  # already exists (the common case)
+
+            self._atomic_write(self._data)
+            self._dirty = False
+            self._data_mtime = self._file_mtime()
+        except Exception as e:
+            self.log.error("[Config] Error flushing config: %s", e)
+
+    def _flush_unless_batched(self):
+        """Flush now, unless a batch() block is coalescing writes"""
+        if not self._in_batch:
+            self.flush()
+
+    @contextmanager
+    def batch(self):
+        """
+        Coalesce config writes inside a with-block
+
+        All mutations inside the block only touch the in-memory parser;
+        a single flush happens on exit.
+        """
+        self._in_batch = True
+        try:
+            yield self
+        finally:
+            self._in_batch = False
+            self.flush()
         
     def setup_enigma2_config(self):
-        """Setup Enigma2 configuration entries"""
+        """Register every configuration entry (all sections)"""
         if not ENIGMA2_AVAILABLE:
             return
-            
+
+        for section in _SCHEMA:
+            self._ensure_section(section)
+
+        self.log.info("[Config] Configuration initialized")
+
+    def _ensure_section(self, section):
+        """Register one schema section's Config objects on first use"""
+        if not ENIGMA2_AVAILABLE or section in self._ready_sections:
+            return
+
         if not hasattr(config, 'plugins'):
             config.plugins = ConfigSubsection()
-            
+
         if not hasattr(config.plugins, 'wgfilemanager'):
             config.plugins.wgfilemanager = ConfigSubsection()
-        
+
         cfg = config.plugins.wgfilemanager
-        
-        # ==================== PATH SETTINGS ====================
-        if not hasattr(cfg, 'left_path'):
-            cfg.left_path = ConfigText(default="/media/hdd", fixed_size=False)
-        if not hasattr(cfg, 'right_path'):
-            cfg.right_path = ConfigText(default="/tmp", fixed_size=False)
-        if not hasattr(cfg, 'save_left_on_exit'):
-            cfg.save_left_on_exit = ConfigSelection(default="yes", choices=[("yes", "Yes"), ("no", "No")])
-        if not hasattr(cfg, 'save_right_on_exit'):
-            cfg.save_right_on_exit = ConfigSelection(default="yes", choices=[("yes", "Yes"), ("no", "No")])
-        if not hasattr(cfg, 'default_left_path'):
-            cfg.default_left_path = ConfigText(default="/media/hdd", fixed_size=False)
-        if not hasattr(cfg, 'default_right_path'):
-            cfg.default_right_path = ConfigText(default="/tmp", fixed_size=False)
-        
-        # ==================== NAVIGATION SETTINGS ====================
-        if not hasattr(cfg, 'enable_wraparound'):
-            cfg.enable_wraparound = ConfigYesNo(default=True)
-        if not hasattr(cfg, 'scroll_speed'):
-            cfg.scroll_speed = ConfigSelection(
-                default="normal",
-                choices=[("slow", "Slow"), ("normal", "Normal"), ("fast", "Fast")]
-            )
-        if not hasattr(cfg, 'items_per_page'):
-            cfg.items_per_page = ConfigInteger(default=20, limits=(5, 100))
-        if not hasattr(cfg, 'confirm_exit'):
-            cfg.confirm_exit = ConfigYesNo(default=True)
-        if not hasattr(cfg, 'exit_behavior'):
-            cfg.exit_behavior = ConfigSelection(
-                default="parent",
-                choices=[("parent", "Go to parent"), ("exit", "Exit immediately")]
-            )
-        
-        # ==================== VIEW SETTINGS ====================
-        if not hasattr(cfg, 'show_hidden_files'):
-            cfg.show_hidden_files = ConfigYesNo(default=False)
-        if not hasattr(cfg, 'show_file_size'):
-            cfg.show_file_size = ConfigYesNo(default=True)
-        if not hasattr(cfg, 'show_file_date'):
-            cfg.show_file_date = ConfigYesNo(default=False)
-        if not hasattr(cfg, 'show_icons'):
-            cfg.show_icons = ConfigYesNo(default=True)
-        if not hasattr(cfg, 'show_permissions'):
-            cfg.show_permissions = ConfigYesNo(default=False)
-        if not hasattr(cfg, 'sort_dirs_first'):
-            cfg.sort_dirs_first = ConfigYesNo(default=True)
-        if not hasattr(cfg, 'sort_case_sensitive'):
-            cfg.sort_case_sensitive = ConfigYesNo(default=False)
-        if not hasattr(cfg, 'view_mode'):
-            cfg.view_mode = ConfigSelection(default="list", choices=[("list", "List"), ("grid", "Grid")])
-        if not hasattr(cfg, 'font_size'):
-            cfg.font_size = ConfigSelection(
-                default="auto",
-                choices=[("auto", "Auto"), ("small", "Small"), ("medium", "Medium"), ("large", "Large")]
-            )
-        
-        # ==================== THEME SETTINGS ====================
-        if not hasattr(cfg, 'theme'):
-            cfg.theme = ConfigSelection(
-                default="dark",
-                choices=[
-                    ("dark", "Dark"),
-                    ("light", "Light"),
-                    ("blue", "Blue"),
-                    ("green", "Green"),
-                    ("orange", "Orange"),
-                    ("purple", "Purple")
-                ]
-            )
-        if not hasattr(cfg, 'icon_set'):
-            cfg.icon_set = ConfigSelection(
-                default="modern",
-                choices=[
-                    ("modern", "Modern"),
-                    ("classic", "Classic"),
-                    ("minimal", "Minimal"),
-                    ("colorful", "Colorful")
-                ]
-            )
-        if not hasattr(cfg, 'highlight_color'):
-            cfg.highlight_color = ConfigSelection(
-                default="blue",
-                choices=[("blue", "Blue"), ("green", "Green"), ("red", "Red"), ("yellow", "Yellow")]
-            )
-        
-        # ==================== OPERATION SETTINGS ====================
-        if not hasattr(cfg, 'confirm_delete'):
-            cfg.confirm_delete = ConfigYesNo(default=True)
-        if not hasattr(cfg, 'confirm_overwrite'):
-            cfg.confirm_overwrite = ConfigYesNo(default=True)
-        if not hasattr(cfg, 'use_trash'):
-            cfg.use_trash = ConfigYesNo(default=True)
-        if not hasattr(cfg, 'verify_copy'):
-            cfg.verify_copy = ConfigYesNo(default=False)
-        if not hasattr(cfg, 'buffer_size'):
-            cfg.buffer_size = ConfigInteger(default=64, limits=(4, 1024))  # KB
-        if not hasattr(cfg, 'preserve_permissions'):
-            cfg.preserve_permissions = ConfigYesNo(default=True)
-        if not hasattr(cfg, 'default_file_perms'):
-            cfg.default_file_perms = ConfigText(default="644", fixed_size=False)
-        if not hasattr(cfg, 'default_dir_perms'):
-            cfg.default_dir_perms = ConfigText(default="755", fixed_size=False)
-        
-        # ==================== NETWORK SETTINGS ====================
-        if not hasattr(cfg, 'ftp_timeout'):
-            cfg.ftp_timeout = ConfigInteger(default=30, limits=(5, 300))
-        if not hasattr(cfg, 'network_buffer'):
-            cfg.network_buffer = ConfigInteger(default=32, limits=(4, 256))  # KB
-        if not hasattr(cfg, 'enable_ftp'):
-            cfg.enable_ftp = ConfigYesNo(default=False)
-        if not hasattr(cfg, 'enable_smb'):
-            cfg.enable_smb = ConfigYesNo(default=False)
-        
-        # ==================== MEDIA SETTINGS ====================
-        if not hasattr(cfg, 'auto_thumbnails'):
-            cfg.auto_thumbnails = ConfigYesNo(default=True)
-        if not hasattr(cfg, 'thumbnail_size'):
-            cfg.thumbnail_size = ConfigSelection(
-                default="medium",
-                choices=[("small", "Small"), ("medium", "Medium"), ("large", "Large")]
-            )
-        if not hasattr(cfg, 'show_metadata'):
-            cfg.show_metadata = ConfigYesNo(default=True)
-        if not hasattr(cfg, 'auto_play_media'):
-            cfg.auto_play_media = ConfigYesNo(default=True)
-        if not hasattr(cfg, 'media_player'):
-            cfg.media_player = ConfigSelection(
-                default="enigma2",
-                choices=[("enigma2", "Enigma2 Player"), ("external", "External Player")]
-            )
-        
-        # ==================== ADVANCED SETTINGS ====================
-        if not hasattr(cfg, 'debug_mode'):
-            cfg.debug_mode = ConfigYesNo(default=False)
-        if not hasattr(cfg, 'log_operations'):
-            cfg.log_operations = ConfigYesNo(default=True)
-        if not hasattr(cfg, 'max_history'):
-            cfg.max_history = ConfigInteger(default=50, limits=(10, 500))
-        if not hasattr(cfg, 'max_log_size'):
-            cfg.max_log_size = ConfigInteger(default=1024, limits=(100, 10240))  # KB
-        if not hasattr(cfg, 'enable_animations'):
-            cfg.enable_animations = ConfigYesNo(default=True)
-        if not hasattr(cfg, 'cache_size'):
-            cfg.cache_size = ConfigInteger(default=10, limits=(1, 100))  # MB
-        
-        logger = _get_logger()
-        if logger:
-            logger.info("[Config] Configuration initialized")
-        
+        for name, factory, kwargs in _SCHEMA.get(section, ()):
+            if not hasattr(cfg, name):
+                setattr(cfg, name, factory(**kwargs))
+
+        self._ready_sections.add(section)
+
     def get(self, key, default=None):
         """
         Get configuration value
@@ -221,10 +349,13 @@ class WGFileManagerConfig:
         """
         if not ENIGMA2_AVAILABLE:
             return default
-            
+
         try:
-            cfg = config.plugins.wgfilemanager
             parts = key.split('.')
+            section = _ATTR_SECTION.get(parts[0])
+            if section is not None:
+                self._ensure_section(section)
+            cfg = config.plugins.wgfilemanager
             obj = cfg
             for part in parts:
                 obj = getattr(obj, part)
@@ -236,33 +367,20 @@ class WGFileManagerConfig:
     def _get_from_file(self, key, default=None):
         """Get value from config file"""
         try:
-            if os.path.exists(self.config_file):
-                parser = self._get_config_parser()
-                parser.read(self.config_file)
-                
-                if '.' in key:
-                    section, option = key.split('.', 1)
-                else:
-                    section = 'general'
-                    option = key
-                
-                if parser.has_section(section) and parser.has_option(section, option):
-                    value = parser.get(section, option)
-                    
-                    # Try to convert to appropriate type
-                    if value.lower() in ('yes', 'true', '1'):
-                        return True
-                    elif value.lower() in ('no', 'false', '0'):
-                        return False
-                    elif value.isdigit():
-                        return int(value)
-                    else:
-                        return ensure_unicode(value)
+            if '.' in key:
+                section, option = key.split('.', 1)
+            else:
+                section = 'general'
+                option = key
+
+            # JSON stores native types, so no string coercion is needed
+            section_data = self._load_data().get(section)
+            if section_data is not None and option in section_data:
+                return section_data[option]
         except Exception as e:
-            logger = _get_logger()
-            if logger:
-                logger.debug("[Config] Error reading from file: %s", e)
-        
+            if self.log.isEnabledFor(logging.DEBUG):
+                self.log.debug("[Config] Error reading from file: %s", e)
+
         return default
     
     def _get_config_parser(self):
@@ -274,28 +392,41 @@ class WGFileManagerConfig:
             # Python 3
             return ConfigParser()
     
-    def set(self, key, value):
+    def set(self, key, value, flush=True):
         """
         Set configuration value
-        
+
         Args:
             key: Configuration key
             value: New value
+            flush: Save the Enigma2 config entry immediately; pass False
+                when bulk-updating and call save() once at the end
         """
+        # plugin.py caches the resolved logger and debug flag across
+        # launches; a debug toggle must drop that cache to take effect
+        if key.split('.')[-1] == 'debug_mode':
+            _invalidate_plugin_runtime()
+
         if not ENIGMA2_AVAILABLE:
             return
-            
+
         try:
-            cfg = config.plugins.wgfilemanager
             parts = key.split('.')
+            section = _ATTR_SECTION.get(parts[0])
+            if section is not None:
+                self._ensure_section(section)
+            cfg = config.plugins.wgfilemanager
             obj = cfg
             for part in parts[:-1]:
                 obj = getattr(obj, part)
             final_key = parts[-1]
+            self._settings_cache = None
             if hasattr(obj, final_key):
-                getattr(obj, final_key).value = value
-                getattr(obj, final_key).save()
-                
+                entry = getattr(obj, final_key)
+                entry.value = value
+                if flush:
+                    entry.save()
+
                 # Also update file cache
                 self._save_to_file(key, value)
         except AttributeError:
@@ -305,50 +436,29 @@ class WGFileManagerConfig:
     def _save_to_file(self, key, value):
         """Save value to config file"""
         try:
-            parser = self._get_config_parser()
-            if os.path.exists(self.config_file):
-                parser.read(self.config_file)
-            
+            data = self._load_data()
+
             if '.' in key:
                 section, option = key.split('.', 1)
             else:
                 section = 'general'
                 option = key
-            
-            if not parser.has_section(section):
-                parser.add_section(section)
-            
-            # Convert value to string
-            if isinstance(value, bool):
-                str_value = 'yes' if value else 'no'
-            else:
-                str_value = ensure_str(str(value))
-            
-            parser.set(section, option, str_value)
-            
-            # Ensure directory exists
-            config_dir = os.path.dirname(self.config_file)
-            if config_dir and not os.path.exists(config_dir):
-                try:
-                    os.makedirs(config_dir)
-                except:
-                    pass
-            
-            with open(self.config_file, 'w') as f:
-                parser.write(f)
+
+            data.setdefault(section, {})[option] = value
+            self._dirty = True
+            self._flush_unless_batched()
         except Exception as e:
-            logger = _get_logger()
-            if logger:
-                logger.error("[Config] Error saving to file: %s", e)
+            self.log.error("[Config] Error saving to file: %s", e)
     
     def save(self):
         """Save all configuration to disk"""
         if ENIGMA2_AVAILABLE:
             configfile.save()
-        
-        logger = _get_logger()
-        if logger:
-            logger.debug("[Config] Configuration saved")
+
+        self.flush()
+
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug("[Config] Configuration saved")
     
     def reset_to_defaults(self, section=None):
         """
@@ -357,70 +467,31 @@ class WGFileManagerConfig:
         Args:
             section: Specific section to reset (None for all)
         """
-        logger = _get_logger()
-        if logger:
-            logger.info("[Config] Resetting configuration to defaults")
-        
-        if section == 'paths' or section is None:
-            self.set('left_path', self.get('default_left_path', '/media/hdd'))
-            self.set('right_path', self.get('default_right_path', '/tmp'))
-            self.set('save_left_on_exit', 'yes')
-            self.set('save_right_on_exit', 'yes')
-        
-        if section == 'navigation' or section is None:
-            self.set('enable_wraparound', True)
-            self.set('scroll_speed', 'normal')
-            self.set('items_per_page', 20)
-            self.set('confirm_exit', True)
-            self.set('exit_behavior', 'parent')
-        
-        if section == 'view' or section is None:
-            self.set('show_hidden_files', False)
-            self.set('show_file_size', True)
-            self.set('show_file_date', False)
-            self.set('show_icons', True)
-            self.set('show_permissions', False)
-            self.set('sort_dirs_first', True)
-            self.set('sort_case_sensitive', False)
-            self.set('view_mode', 'list')
-            self.set('font_size', 'auto')
-        
-        if section == 'theme' or section is None:
-            self.set('theme', 'dark')
-            self.set('icon_set', 'modern')
-            self.set('highlight_color', 'blue')
-        
-        if section == 'operations' or section is None:
-            self.set('confirm_delete', True)
-            self.set('confirm_overwrite', True)
-            self.set('use_trash', True)
-            self.set('verify_copy', False)
-            self.set('buffer_size', 64)
-            self.set('preserve_permissions', True)
-            self.set('default_file_perms', '644')
-            self.set('default_dir_perms', '755')
-        
-        if section == 'network' or section is None:
-            self.set('ftp_timeout', 30)
-            self.set('network_buffer', 32)
-            self.set('enable_ftp', False)
-            self.set('enable_smb', False)
-        
-        if section == 'media' or section is None:
-            self.set('auto_thumbnails', True)
-            self.set('thumbnail_size', 'medium')
-            self.set('show_metadata', True)
-            self.set('auto_play_media', True)
-            self.set('media_player', 'enigma2')
-        
-        if section == 'advanced' or section is None:
-            self.set('debug_mode', False)
-            self.set('log_operations', True)
-            self.set('max_history', 50)
-            self.set('max_log_size', 1024)
-            self.set('enable_animations', True)
-            self.set('cache_size', 10)
-        
+        self.log.info("[Config] Resetting configuration to defaults")
+
+        # Defaults come straight from the _SCHEMA table so they cannot
+        # drift from what setup registers. The active pane paths reset
+        # to the user's configured default paths, not the factory ones,
+        # and the default_* entries themselves are left alone.
+        overrides = {
+            'left_path': self.get('default_left_path', '/media/hdd'),
+            'right_path': self.get('default_right_path', '/tmp'),
+        }
+        skip = ('default_left_path', 'default_right_path')
+
+        if section is None:
+            sections = _SCHEMA.keys()
+        else:
+            sections = (section,) if section in _SCHEMA else ()
+
+        with self.batch():
+            for sec in sections:
+                for name, factory, kwargs in _SCHEMA[sec]:
+                    if name in skip:
+                        continue
+                    self.set(name, overrides.get(name, kwargs.get('default')),
+                             flush=False)
+
         self.save()
     
     def get_bookmarks(self):
@@ -432,16 +503,13 @@ class WGFileManagerConfig:
         """
         bookmarks = []
         try:
-            if os.path.exists(self.config_file):
-                parser = self._get_config_parser()
-                parser.read(self.config_file)
-                if parser.has_section('bookmarks'):
-                    for key, value in parser.items('bookmarks'):
-                        bookmarks.append({
-                            'id': key,
-                            'path': ensure_unicode(value),
-                            'name': os.path.basename(ensure_unicode(value))
-                        })
+            for key, value in sorted(self._load_data().get('bookmarks', {}).items()):
+                path = ensure_unicode(value)
+                bookmarks.append({
+                    'id': key,
+                    'path': path,
+                    'name': os.path.basename(path)
+                })
         except Exception:
             pass
         return bookmarks
@@ -455,39 +523,31 @@ class WGFileManagerConfig:
             name: Optional bookmark name
         """
         try:
-            parser = self._get_config_parser()
-            if os.path.exists(self.config_file):
-                parser.read(self.config_file)
-            
-            if not parser.has_section('bookmarks'):
-                parser.add_section('bookmarks')
-            
+            bookmarks = self._load_data().setdefault('bookmarks', {})
+
             if name is None:
                 name = os.path.basename(path) or path
-            
-            # Find next available key
-            i = 1
-            while parser.has_option('bookmarks', 'bookmark_%d' % i):
-                i += 1
-            
-            parser.set('bookmarks', 'bookmark_%d' % i, ensure_str(path))
-            
-            # Ensure directory exists
-            config_dir = os.path.dirname(self.config_file)
-            if config_dir and not os.path.exists(config_dir):
-                os.makedirs(config_dir)
-            
-            with open(self.config_file, 'w') as f:
-                parser.write(f)
-            
-            logger = _get_logger()
-            if logger:
-                logger.info("[Config] Bookmark saved: %s -> %s", name, path)
+
+            if self._next_bookmark_id is None:
+                # One scan over the existing keys; afterwards allocation
+                # is a counter increment
+                highest = 0
+                for key in bookmarks:
+                    try:
+                        highest = max(highest, int(key.rsplit('_', 1)[1]))
+                    except (IndexError, ValueError):
+                        pass
+                self._next_bookmark_id = highest + 1
+
+            bookmarks['bookmark_%d' % self._next_bookmark_id] = ensure_str(path)
+            self._next_bookmark_id += 1
+            self._dirty = True
+            self._flush_unless_batched()
+
+            self.log.info("[Config] Bookmark saved: %s -> %s", name, path)
             
         except Exception as e:
-            logger = _get_logger()
-            if logger:
-                logger.error("[Config] Error saving bookmark: %s", e)
+            self.log.error("[Config] Error saving bookmark: %s", e)
     
     def remove_bookmark(self, path):
         """
@@ -497,26 +557,19 @@ class WGFileManagerConfig:
             path: Path to remove
         """
         try:
-            parser = self._get_config_parser()
-            if os.path.exists(self.config_file):
-                parser.read(self.config_file)
-            
-            if parser.has_section('bookmarks'):
-                for key, value in parser.items('bookmarks'):
-                    if ensure_unicode(value) == ensure_unicode(path):
-                        parser.remove_option('bookmarks', key)
-                
-                with open(self.config_file, 'w') as f:
-                    parser.write(f)
-            
-            logger = _get_logger()
-            if logger:
-                logger.info("[Config] Bookmark removed: %s", path)
+            bookmarks = self._load_data().get('bookmarks', {})
+            path = ensure_unicode(path)
+
+            for key in [k for k, v in bookmarks.items()
+                        if ensure_unicode(v) == path]:
+                del bookmarks[key]
+                self._dirty = True
+            self._flush_unless_batched()
+
+            self.log.info("[Config] Bookmark removed: %s", path)
             
         except Exception as e:
-            logger = _get_logger()
-            if logger:
-                logger.error("[Config] Error removing bookmark: %s", e)
+            self.log.error("[Config] Error removing bookmark: %s", e)
     
     def get_recent_paths(self):
         """
@@ -525,18 +578,21 @@ class WGFileManagerConfig:
         Returns:
             list: List of recent paths
         """
-        recent = []
         try:
-            if os.path.exists(self.config_file):
-                parser = self._get_config_parser()
-                parser.read(self.config_file)
-                if parser.has_section('recent'):
-                    items = [(key, value) for key, value in parser.items('recent')]
-                    items.sort(reverse=True)  # Most recent first
-                    recent = [ensure_unicode(value) for key, value in items[:20]]
+            return list(reversed(self._load_recent()))
         except Exception:
-            pass
-        return recent
+            return []
+
+    def _load_recent(self):
+        """Load the recent-path ring from the stored list (once)"""
+        if self._recent is None:
+            self._recent = deque(maxlen=20)
+            try:
+                for value in self._load_data().get('recent', ()):
+                    self._recent.append(ensure_unicode(value))
+            except Exception:
+                pass
+        return self._recent
     
     def add_recent_path(self, path):
         """
@@ -546,36 +602,25 @@ class WGFileManagerConfig:
             path: Path to add
         """
         try:
-            parser = self._get_config_parser()
-            if os.path.exists(self.config_file):
-                parser.read(self.config_file)
-            
-            if not parser.has_section('recent'):
-                parser.add_section('recent')
-            
-            # Use timestamp as key for sorting
-            import time
-            key = 'recent_%d' % int(time.time())
-            parser.set('recent', key, ensure_str(path))
-            
-            # Keep only last 20
-            items = [(k, v) for k, v in parser.items('recent')]
-            if len(items) > 20:
-                items.sort()
-                for k, v in items[:-20]:
-                    parser.remove_option('recent', k)
-            
-            with open(self.config_file, 'w') as f:
-                parser.write(f)
-            
-            logger = _get_logger()
-            if logger:
-                logger.debug("[Config] Recent path added: %s", path)
+            path = ensure_unicode(path)
+            recent = self._load_recent()
+
+            # De-dup: revisiting a path moves it to the front instead of
+            # filling the ring with copies; the deque's maxlen drops the
+            # oldest entry automatically
+            if path in recent:
+                recent.remove(path)
+            recent.append(path)
+
+            self._load_data()['recent'] = list(recent)
+            self._dirty = True
+            self._flush_unless_batched()
+
+            if self.log.isEnabledFor(logging.DEBUG):
+                self.log.debug("[Config] Recent path added: %s", path)
             
         except Exception as e:
-            logger = _get_logger()
-            if logger:
-                logger.error("[Config] Error adding recent path: %s", e)
+            self.log.error("[Config] Error adding recent path: %s", e)
     
     def get_all_settings(self):
         """
@@ -584,22 +629,29 @@ class WGFileManagerConfig:
         Returns:
             dict: All configuration settings
         """
-        settings = {}
-        
-        if ENIGMA2_AVAILABLE:
+        if not ENIGMA2_AVAILABLE:
+            return {}
+
+        if self._settings_cache is None:
+            # The schema knows the exact attribute names, so there is no
+            # need for dir()'s sorted reflection over the whole object
+            settings = {}
             try:
+                for section in _SCHEMA:
+                    self._ensure_section(section)
                 cfg = config.plugins.wgfilemanager
-                for key in dir(cfg):
-                    if not key.startswith('_'):
-                        value = getattr(cfg, key)
+                for section, entries in _SCHEMA.items():
+                    for name, factory, kwargs in entries:
+                        value = getattr(cfg, name, None)
                         if hasattr(value, 'value'):
-                            settings[key] = value.value
+                            settings[name] = value.value
                         else:
-                            settings[key] = value
-            except:
+                            settings[name] = value
+            except Exception:
                 pass
-        
-        return settings
+            self._settings_cache = settings
+
+        return self._settings_cache.copy()
     
     def export_settings(self, filepath):
         """
@@ -618,15 +670,11 @@ class WGFileManagerConfig:
             with open(filepath, 'w') as f:
                 json.dump(settings, f, indent=2)
             
-            logger = _get_logger()
-            if logger:
-                logger.info("[Config] Settings exported to: %s", filepath)
+            self.log.info("[Config] Settings exported to: %s", filepath)
             return True
             
         except Exception as e:
-            logger = _get_logger()
-            if logger:
-                logger.error("[Config] Error exporting settings: %s", e)
+            self.log.error("[Config] Error exporting settings: %s", e)
             return False
     
     def import_settings(self, filepath):
@@ -645,20 +693,19 @@ class WGFileManagerConfig:
             with open(filepath, 'r') as f:
                 settings = json.load(f)
             
-            for key, value in settings.items():
-                self.set(key, value)
-            
+            # One batched file flush plus one configfile.save() for the
+            # whole import instead of two writes per key
+            with self.batch():
+                for key, value in settings.items():
+                    self.set(key, value, flush=False)
+
             self.save()
             
-            logger = _get_logger()
-            if logger:
-                logger.info("[Config] Settings imported from: %s", filepath)
+            self.log.info("[Config] Settings imported from: %s", filepath)
             return True
             
         except Exception as e:
-            logger = _get_logger()
-            if logger:
-                logger.error("[Config] Error importing settings: %s", e)
+            self.log.error("[Config] Error importing settings: %s", e)
             return False
 
 
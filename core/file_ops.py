@@ -4,15 +4,22 @@ Handles copy, move, delete, rename with visual feedback
 """
 
 from __future__ import absolute_import, division, print_function
+import errno
+import logging
 import os
 import shutil
+try:
+    import fcntl
+except ImportError:  # non-POSIX platform; reflink path disabled
+    fcntl = None
+import subprocess
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import hashlib
+import mmap
 import stat
-import pwd
-import grp
-from Plugins.Extensions.WGFileManagerPro.core.compatibility import ensure_str, ensure_unicode, safe_listdir, safe_join
+from Plugins.Extensions.WGFileManagerPro.core.compatibility import ensure_str, ensure_unicode, safe_listdir_names, safe_join, _uid_to_name, _gid_to_name, _fast_rmtree
 
 # Try to import config, but don't fail if not available
 try:
@@ -25,13 +32,156 @@ from Plugins.Extensions.WGFileManagerPro.utils.formatters import format_size
 
 logger = get_logger(__name__)
 
+# In-kernel fd-to-fd copy syscalls, probed once at import. copy_file_range
+# keeps bytes in the kernel (and can reflink / server-side copy on CoW
+# filesystems and NFS); sendfile is the fallback on older kernels.
+_HAS_COPY_FILE_RANGE = hasattr(os, 'copy_file_range')
+_HAS_SENDFILE = hasattr(os, 'sendfile')
+_HAS_FADVISE = hasattr(os, 'posix_fadvise')
+
+
+def _fadvise(fd, advice):
+    """Page-cache hint for a copy fd; advisory only, failures ignored"""
+    if _HAS_FADVISE:
+        try:
+            os.posix_fadvise(fd, 0, 0, advice)
+        except OSError:
+            pass
+
+# Bytes per kernel-copy syscall; large enough to amortize the call,
+# small enough to keep progress updates and cancel checks responsive
+_KERNEL_COPY_CHUNK = 4 * 1024 * 1024
+
+# errnos meaning "unsupported here" - safe to fall back to the
+# userspace loop as long as nothing was written yet
+_KERNEL_COPY_ERRNOS = (errno.EINVAL, errno.ENOSYS, errno.EXDEV,
+                       errno.EOPNOTSUPP, errno.EBADF)
+
+# Linux FICLONE ioctl: clone src extents into dst (btrfs/XFS reflink)
+_FICLONE = 0x40049409
+
+# Size window for the mmap fallback path: below 1 MiB the setup cost
+# dominates, above 256 MiB mapping the whole source risks page-cache
+# thrash on a small-memory STB. Written out in 8 MiB slices.
+_MMAP_COPY_MIN = 1024 * 1024
+_MMAP_COPY_MAX = 256 * 1024 * 1024
+_MMAP_COPY_CHUNK = 8 * 1024 * 1024
+
+# Largest file hashed via a whole-file mapping; bigger ones use the
+# chunked read loop to bound resident memory
+_MMAP_HASH_MAX = 256 * 1024 * 1024
+
+# Probe size for the cheap same-size comparison: first and last block
+# of each file are checked before committing to full-content hashing
+_CMP_PROBE_BYTES = 64 * 1024
+
+# Worker cap for metadata-heavy scans (delete batches, directory
+# sizing). These are seek-bound, not CPU-bound, so oversubscribing the
+# cores a little keeps the disk queue full; 8 bounds thread overhead
+# on the small STB CPUs this runs on.
+_SCAN_WORKERS = min(8, 2 * (os.cpu_count() or 1))
+
+# Directories whose top level alone has more entries than this are
+# handed to the system rm binary: it walks getdents64/unlinkat in
+# native code, and on trees with tens of thousands of entries the
+# per-entry interpreter cost of even the dirfd-based Python deleter
+# dominates. Probed once; busybox ships rm on every STB image.
+_RM_TREE_THRESHOLD = 512
+_RM_BINARY = shutil.which('rm')
+
+# rwx string for every 9-bit permission value, built once at import so
+# the per-file permission string is a type prefix plus one table index
+# instead of nine bit tests and concatenations per call
+_PERM_TABLE = tuple(
+    ''.join('rwx'[i % 3] if n & (1 << (8 - i)) else '-' for i in range(9))
+    for n in range(512)
+)
+
+# Inverse of _PERM_TABLE: exact 9-char rwx string -> mode bits, so
+# symbolic parsing in set_permissions is one dict hit
+_PERM_MODES = {s: n for n, s in enumerate(_PERM_TABLE)}
+
+# Per-triplet masks for symbolic strings the dict misses (characters
+# other than r/w/x/- leave that bit clear, matching the old parser)
+_POS_MASKS = (
+    (stat.S_IRUSR, stat.S_IWUSR, stat.S_IXUSR),
+    (stat.S_IRGRP, stat.S_IWGRP, stat.S_IXGRP),
+    (stat.S_IROTH, stat.S_IWOTH, stat.S_IXOTH),
+)
+
+# renameat2(2) with RENAME_NOREPLACE refuses to overwrite in a single
+# syscall, closing the stat-then-rename race the old exists() check
+# left open. Python does not expose it here, so it is reached through
+# ctypes; kernels or filesystems without it fall back to the checked
+# two-step in the caller.
+_RENAME_NOREPLACE = 1
+_AT_FDCWD = -100
+try:
+    import ctypes
+    _renameat2 = ctypes.CDLL(None, use_errno=True).renameat2
+except (ImportError, OSError, AttributeError):
+    _renameat2 = None
+
+
+def _rename_noreplace(old, new):
+    """Atomic no-clobber rename; returns False when unsupported
+
+    Raises FileExistsError when the target exists, other OSErrors for
+    real failures - same surface as os.rename plus the EEXIST case.
+    """
+    if _renameat2 is None:
+        return False
+    if _renameat2(_AT_FDCWD, os.fsencode(old),
+                  _AT_FDCWD, os.fsencode(new), _RENAME_NOREPLACE) == 0:
+        return True
+    err = ctypes.get_errno()
+    if err in (errno.ENOSYS, errno.EINVAL):
+        return False  # pre-3.15 kernel or filesystem without support
+    raise OSError(err, os.strerror(err), old, None, new)
+
+
+# Optional blake3 extension (SIMD, multi-threaded) for file hashing;
+# an STB image cannot be assumed to ship it, so the stdlib blake2b is
+# the fallback - still several times faster than MD5 per byte
+try:
+    import blake3 as _blake3
+except ImportError:
+    _blake3 = None
+
+# Optional compiled md5 loop (see core/_fastdigest.pyx): one nogil C
+# loop over EVP_DigestUpdate instead of Python-level read/update
+# iterations. Same drop-in convention as core/_compat_fast - when the
+# extension is absent, the hashlib path below is used unchanged.
+try:
+    from Plugins.Extensions.WGFileManagerPro.core import _fastdigest
+except ImportError:
+    try:
+        from . import _fastdigest
+    except ImportError:
+        _fastdigest = None
+
 
 class OperationProgress:
     """Progress tracking for file operations"""
     
     def __init__(self):
+        # Reused by every to_dict call - see the docstring there
+        self._snapshot = {
+            'file': '',
+            'percent': 0,
+            'copied': 0,
+            'total': 0,
+            'speed': 0,
+            'eta': 0,
+            'overall_percent': 0,
+            'completed': 0,
+            'files_total': 0,
+            'elapsed': 0.0,
+            'errors': 0,
+            'warnings': 0,
+        }
         self.reset()
-    
+
     def reset(self):
         """Reset progress"""
         self.current_file = ""
@@ -50,27 +200,35 @@ class OperationProgress:
         self.warnings = []
     
     def to_dict(self):
-        """Convert to dictionary"""
-        elapsed = time.time() - self.start_time
-        return {
-            'file': self.current_file,
-            'percent': self.current_percent,
-            'copied': self.current_bytes,
-            'total': self.current_total,
-            'speed': self.speed,
-            'eta': self.eta,
-            'overall_percent': self.overall_percent,
-            'completed': self.files_done,
-            'files_total': self.files_total,
-            'elapsed': elapsed,
-            'errors': len(self.errors),
-            'warnings': len(self.warnings)
-        }
+        """Convert to dictionary
+
+        Returns one preallocated dict updated in place, so a tick every
+        100 ms costs zero allocations. Callers must consume it before
+        the next update and copy() it if they need to keep a snapshot.
+        """
+        snap = self._snapshot
+        snap['file'] = self.current_file
+        snap['percent'] = self.current_percent
+        snap['copied'] = self.current_bytes
+        snap['total'] = self.current_total
+        snap['speed'] = self.speed
+        snap['eta'] = self.eta
+        snap['overall_percent'] = self.overall_percent
+        snap['completed'] = self.files_done
+        snap['files_total'] = self.files_total
+        snap['elapsed'] = time.time() - self.start_time
+        snap['errors'] = len(self.errors)
+        snap['warnings'] = len(self.warnings)
+        return snap
 
 
 class FileOperations:
     """Advanced file operations with progress tracking"""
-    
+
+    # Cleared after the first "operation not supported" so later files
+    # skip the kernel-copy probe entirely
+    _kernel_copy_ok = True
+
     def __init__(self, progress_callback=None):
         """
         Initialize file operations
@@ -80,31 +238,63 @@ class FileOperations:
         """
         self.progress_callback = progress_callback
         self.cancel_flag = threading.Event()
-        self.pause_flag = threading.Event()
+        # Pause is a condition variable, not a polled Event: the copy
+        # thread sleeps in wait() while paused (no 10 Hz wakeups) and
+        # resume()/cancel() release it immediately
+        self._pause_cv = threading.Condition()
+        self._paused = False
         self.progress = OperationProgress()
-        self.progress_lock = threading.RLock()
-        
+        # Plain Lock, not RLock: no code path re-enters it (callbacks
+        # always run after release) and Lock skips owner/count tracking
+        self.progress_lock = threading.Lock()
+        # Reusable copy buffers, one per worker thread (allocated on
+        # first use) so the fallback loop never allocates per chunk and
+        # parallel workers never share a buffer
+        self._buffer_local = threading.local()
+        # Per-thread error/warning buffers for parallel workers, so the
+        # hot path appends without taking progress_lock per message
+        self._error_local = threading.local()
+        # Copy plan from the last calculate_total_size scan:
+        # (path, rel_path, size) per file, (path, rel_path) per dir
+        # and (path, rel_path) per symlink
+        self._scan_files = []
+        self._scan_dirs = []
+        self._scan_links = []
+        # Parallel copies share the per-file progress slots between
+        # workers; while this is True the reporting publishes only
+        # overall-derived numbers (see _maybe_report)
+        self._parallel_copy = False
+        self._op_start_ns = 0
+
         # Get buffer size from config
         if get_config:
             try:
                 config = get_config()
-                self.buffer_size = config.get('buffer_size', 64) * 1024
+                # Clamp upward: tiny buffers mean 2 syscalls per few KB
+                self.buffer_size = max(config.get('buffer_size', 1024) * 1024,
+                                       256 * 1024)
                 self.preserve_permissions = config.get('preserve_permissions', True)
                 self.use_trash = config.get('use_trash', True)
                 self.verify_copy = config.get('verify_copy', False)
+                self.parallel_copies = config.get('parallel_copies', 4)
+                self.parallel_scan = config.get('parallel_scan', True)
                 logger.debug("[FileOps] Config loaded: buffer=%dKB, preserve_perms=%s, use_trash=%s, verify=%s",
                            self.buffer_size // 1024, self.preserve_permissions, self.use_trash, self.verify_copy)
             except Exception as e:
                 logger.error("[FileOps] Config error: %s", e)
-                self.buffer_size = 64 * 1024
+                self.buffer_size = 1024 * 1024
                 self.preserve_permissions = True
                 self.use_trash = True
                 self.verify_copy = False
+                self.parallel_copies = 4
+                self.parallel_scan = True
         else:
-            self.buffer_size = 64 * 1024
+            self.buffer_size = 1024 * 1024
             self.preserve_permissions = True
             self.use_trash = True
             self.verify_copy = False
+            self.parallel_copies = 4
+            self.parallel_scan = True
         
         logger.info("[FileOps] Initialized with buffer size: %d KB", self.buffer_size // 1024)
     
@@ -112,16 +302,22 @@ class FileOperations:
         """Cancel current operation"""
         logger.info("[FileOps] Cancelling operation")
         self.cancel_flag.set()
+        # Unblock a paused copy thread so cancellation is immediate
+        with self._pause_cv:
+            self._pause_cv.notify_all()
     
     def pause(self):
         """Pause current operation"""
         logger.info("[FileOps] Pausing operation")
-        self.pause_flag.set()
+        with self._pause_cv:
+            self._paused = True
     
     def resume(self):
         """Resume paused operation"""
         logger.info("[FileOps] Resuming operation")
-        self.pause_flag.clear()
+        with self._pause_cv:
+            self._paused = False
+            self._pause_cv.notify_all()
     
     def is_cancelled(self):
         """Check if operation is cancelled"""
@@ -129,12 +325,15 @@ class FileOperations:
     
     def is_paused(self):
         """Check if operation is paused"""
-        return self.pause_flag.is_set()
+        return self._paused
     
     def wait_if_paused(self):
-        """Wait while paused"""
-        while self.pause_flag.is_set() and not self.cancel_flag.is_set():
-            time.sleep(0.1)
+        """Block while paused; woken by resume() or cancel()"""
+        if not self._paused:
+            return
+        with self._pause_cv:
+            while self._paused and not self.cancel_flag.is_set():
+                self._pause_cv.wait(timeout=1.0)
     
     def report_progress(self):
         """Report progress to callback"""
@@ -145,61 +344,459 @@ class FileOperations:
                 self.progress_callback(progress_data)
             except Exception as e:
                 logger.error("[FileOps] Progress callback error: %s", e)
-    
+
+    def _record_error(self, msg):
+        """Append an operation error to the shared progress list
+
+        Inside a parallel task the message lands in that thread's local
+        buffer instead, so workers do not serialize on progress_lock
+        per message; _flush_records folds the buffer in at the task
+        boundary.
+        """
+        buf = getattr(self._error_local, 'errors', None)
+        if buf is not None:
+            buf.append(msg)
+            return
+        with self.progress_lock:
+            self.progress.errors.append(msg)
+
+    def _record_warning(self, msg):
+        """Append an operation warning; buffered per thread like errors"""
+        buf = getattr(self._error_local, 'warnings', None)
+        if buf is not None:
+            buf.append(msg)
+            return
+        with self.progress_lock:
+            self.progress.warnings.append(msg)
+
+    def _buffer_records(self):
+        """Start buffering this thread's errors/warnings locally"""
+        self._error_local.errors = []
+        self._error_local.warnings = []
+
+    def _flush_records(self):
+        """Fold this thread's buffered messages into shared progress"""
+        errors = getattr(self._error_local, 'errors', None)
+        warnings = getattr(self._error_local, 'warnings', None)
+        self._error_local.errors = None
+        self._error_local.warnings = None
+        if errors or warnings:
+            with self.progress_lock:
+                if errors:
+                    self.progress.errors.extend(errors)
+                if warnings:
+                    self.progress.warnings.extend(warnings)
+
+    def _flush_copied(self, pending):
+        """Fold locally accumulated bytes into the shared counters"""
+        if pending:
+            with self.progress_lock:
+                self.progress.current_bytes += pending
+                self.progress.overall_bytes += pending
+
+    def _maybe_report(self, file_size, start_ns, last_ns, pending):
+        """Fold pending bytes and refresh derived stats, at most every 100ms
+
+        The copy loops count bytes in a local variable so the tight path
+        never touches the lock; everything is folded in here on the
+        100ms tick under a single acquisition. Timestamps are
+        monotonic_ns ints: cheaper to sample than time.time() and the
+        throttle compare stays pure integer math, no float boxing in
+        the per-chunk check.
+
+        Returns (last_ns, pending) - pending is zeroed on a tick.
+        """
+        now_ns = time.monotonic_ns()
+        if now_ns - last_ns < 100_000_000:
+            return last_ns, pending
+
+        with self.progress_lock:
+            self.progress.current_bytes += pending
+            self.progress.overall_bytes += pending
+
+            if self._parallel_copy:
+                # Several workers share the per-file slots, so per-file
+                # size/percent/ETA would mix one file's name with
+                # another's byte counts. Publish only numbers derived
+                # from the overall counters, which stay correct under
+                # concurrent folding; the current row mirrors them.
+                elapsed_ns = now_ns - self._op_start_ns
+                if elapsed_ns > 0:
+                    self.progress.speed = (
+                        self.progress.overall_bytes * 1_000_000_000 // elapsed_ns
+                    )
+                if self.progress.overall_total > 0:
+                    self.progress.overall_percent = int(
+                        (self.progress.overall_bytes * 100)
+                        / self.progress.overall_total
+                    )
+                    if self.progress.speed > 0:
+                        remaining = (self.progress.overall_total
+                                     - self.progress.overall_bytes)
+                        self.progress.eta = remaining // self.progress.speed
+                self.progress.current_percent = self.progress.overall_percent
+            else:
+                # Calculate speed (bytes/sec, integer)
+                elapsed_ns = now_ns - start_ns
+                if elapsed_ns > 0:
+                    self.progress.speed = (
+                        self.progress.current_bytes * 1_000_000_000 // elapsed_ns
+                    )
+
+                # Calculate ETA (whole seconds)
+                if self.progress.speed > 0:
+                    remaining = file_size - self.progress.current_bytes
+                    self.progress.eta = remaining // self.progress.speed
+
+                # Calculate percentages
+                if file_size > 0:
+                    self.progress.current_percent = int(
+                        (self.progress.current_bytes * 100) / file_size
+                    )
+
+                if self.progress.overall_total > 0:
+                    self.progress.overall_percent = int(
+                        (self.progress.overall_bytes * 100)
+                        / self.progress.overall_total
+                    )
+
+        self.report_progress()
+        return now_ns, 0
+
+    def _get_copy_buffer(self):
+        """Memoryview over this thread's copy buffer (lazily allocated)"""
+        buf = getattr(self._buffer_local, 'buf', None)
+        if buf is None or len(buf) != self.buffer_size:
+            buf = self._buffer_local.buf = bytearray(self.buffer_size)
+        return memoryview(buf)
+
+    def _copy_in_kernel(self, fsrc, fdst, file_size, start_ns):
+        """Copy fd-to-fd via copy_file_range/sendfile in chunks
+
+        Returns 'done', 'cancelled', or 'fallback'. 'fallback' is only
+        returned before any bytes were written, so the caller's
+        userspace loop can safely take over from offset 0.
+        """
+        if not FileOperations._kernel_copy_ok:
+            return 'fallback'
+
+        src_fd = fsrc.fileno()
+        dst_fd = fdst.fileno()
+        copied = 0
+        pending = 0
+        last_ns = start_ns
+        use_cfr = _HAS_COPY_FILE_RANGE
+
+        while copied < file_size:
+            if self.is_cancelled():
+                self._flush_copied(pending)
+                return 'cancelled'
+            self.wait_if_paused()
+
+            want = min(_KERNEL_COPY_CHUNK, file_size - copied)
+            try:
+                if use_cfr:
+                    n = os.copy_file_range(src_fd, dst_fd, want)
+                elif _HAS_SENDFILE:
+                    n = os.sendfile(dst_fd, src_fd, None, want)
+                else:
+                    return 'fallback'
+            except OSError as e:
+                if copied == 0 and e.errno in _KERNEL_COPY_ERRNOS:
+                    if use_cfr and _HAS_SENDFILE:
+                        # copy_file_range unsupported (e.g. cross-device);
+                        # sendfile may still work
+                        use_cfr = False
+                        continue
+                    if e.errno in (errno.EOPNOTSUPP, errno.ENOSYS):
+                        FileOperations._kernel_copy_ok = False
+                    logger.debug("[FileOps] Kernel copy unavailable: %s", e)
+                    return 'fallback'
+                raise
+
+            if n == 0:
+                # Source shrank under us; what we have is all there is
+                break
+
+            copied += n
+            pending += n
+            last_ns, pending = self._maybe_report(
+                file_size, start_ns, last_ns, pending)
+
+        self._flush_copied(pending)
+        return 'done'
+
+    def _try_reflink(self, src, dst, file_size):
+        """Clone src into dst via the FICLONE ioctl (CoW filesystems)
+
+        On btrfs/XFS this is a metadata-only operation that finishes in
+        microseconds regardless of size. Returns True on success (the
+        copy is complete, progress already accounted); False means the
+        filesystem can't reflink this pair and the byte copy must run.
+        """
+        if fcntl is None:
+            return False
+        try:
+            src_fd = os.open(src, os.O_RDONLY)
+        except OSError:
+            return False
+        try:
+            try:
+                dst_fd = self._open_dst_fd(dst)
+            except OSError:
+                return False
+            try:
+                fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+            except OSError as e:
+                # EXDEV/EOPNOTSUPP/EINVAL/ENOTTY: not a CoW pair
+                os.close(dst_fd)
+                try:
+                    os.unlink(dst)
+                except OSError:
+                    pass
+                logger.debug("[FileOps] Reflink unavailable: %s", e)
+                return False
+            os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+
+        logger.debug("[FileOps] Reflinked %s (no data copied)",
+                     os.path.basename(src))
+        self._flush_copied(file_size)
+        return True
+
+    def _copy_mmap(self, fsrc, fdst, file_size, start_ns):
+        """Copy by mapping the source and writing it out in slices
+
+        Skips the read() copy into a userspace buffer: pages come
+        straight from the page cache into write(). Returns 'done',
+        'cancelled', or 'fallback' when the source cannot be mapped
+        (nothing has been written at that point).
+        """
+        try:
+            mm = mmap.mmap(fsrc.fileno(), file_size, prot=mmap.PROT_READ)
+        except (OSError, ValueError) as e:
+            logger.debug("[FileOps] mmap copy unavailable: %s", e)
+            return 'fallback'
+
+        with mm:
+            view = memoryview(mm)
+            chunk = None
+            try:
+                pending = 0
+                last_ns = start_ns
+                for off in range(0, file_size, _MMAP_COPY_CHUNK):
+                    if self.is_cancelled():
+                        self._flush_copied(pending)
+                        return 'cancelled'
+                    self.wait_if_paused()
+
+                    chunk = view[off:off + _MMAP_COPY_CHUNK]
+                    n = len(chunk)
+                    while chunk:
+                        written = fdst.write(chunk)
+                        chunk = chunk[written:]
+                    pending += n
+                    last_ns, pending = self._maybe_report(
+                        file_size, start_ns, last_ns, pending)
+
+                self._flush_copied(pending)
+            finally:
+                # Live memoryviews pin the mapping - release them or
+                # mmap.close() raises "exported pointers exist"
+                if chunk is not None:
+                    chunk.release()
+                view.release()
+        return 'done'
+
+    def _copy_small(self, src, dst, src_stat, preserve_permissions, verify):
+        """Straight-line copy for files no bigger than one buffer
+
+        One read, one write, metadata on the open fd, one progress
+        flush at the end - none of the per-chunk cancel/pause/throttle
+        branches of the streaming path, which on trees of thousands of
+        small files cost more than the byte copying itself.
+        """
+        with open(src, 'rb', buffering=0) as fsrc:
+            data = fsrc.readall()
+
+        fd = self._open_dst_fd(dst)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            self._apply_metadata(src, dst, src_stat, preserve_permissions,
+                                 fd=fd)
+        finally:
+            os.close(fd)
+
+        self._flush_copied(len(data))
+
+        if verify:
+            if (hashlib.blake2b(data, digest_size=16).digest()
+                    != self._hash_copied_file(dst)):
+                error_msg = f"Verification failed: {os.path.basename(src)}"
+                logger.error("[FileOps] %s", error_msg)
+                self._record_error(error_msg)
+                try:
+                    os.remove(dst)
+                except:
+                    pass
+                return False
+
+        logger.info("[FileOps] Successfully copied: %s", os.path.basename(src))
+        return True
+
+    def _open_dst_fd(self, dst):
+        """Create-or-truncate a copy destination, warning on overwrite
+
+        O_EXCL folds the old exists() pre-check into the open itself:
+        the first attempt only succeeds for a new file, and the EEXIST
+        fallback is what flags the overwrite - no separate stat and no
+        window for a race between check and open.
+        """
+        try:
+            return os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        except FileExistsError:
+            logger.warning("[FileOps] Destination exists: %s", dst)
+            self._record_warning(f"Overwriting: {os.path.basename(dst)}")
+            return os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+
+    def _apply_metadata(self, src, dst, src_stat, preserve_permissions,
+                        fd=None):
+        """Carry timestamps/mode/ownership from src_stat onto dst
+
+        When the destination fd is still open the fd-based variants
+        (utime-on-fd, fchmod, fchown) are used, saving a path
+        resolution per call;
+        otherwise the path-based equivalents run. Failures degrade to
+        warnings, matching the old shutil.copystat behaviour.
+        """
+        if src_stat is None:
+            return
+        try:
+            # os.utime accepts an fd in place of the path (futimens
+            # under the hood), so both branches share one call
+            os.utime(fd if fd is not None else dst,
+                     ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+            logger.debug("[FileOps] Metadata copied")
+        except Exception as e:
+            logger.warning("[FileOps] Cannot copy metadata: %s", e)
+            self._record_warning(f"Cannot copy metadata: {os.path.basename(src)}")
+
+        if not preserve_permissions:
+            return
+        try:
+            if fd is not None:
+                os.fchmod(fd, src_stat.st_mode)
+            else:
+                os.chmod(dst, src_stat.st_mode)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[FileOps] Permissions preserved: %s", oct(src_stat.st_mode)[-3:])
+
+            # Copy ownership if running as root
+            if os.geteuid() == 0:  # root
+                try:
+                    if fd is not None:
+                        os.fchown(fd, src_stat.st_uid, src_stat.st_gid)
+                    else:
+                        os.chown(dst, src_stat.st_uid, src_stat.st_gid)
+                    logger.debug("[FileOps] Ownership preserved: %s:%s",
+                               src_stat.st_uid, src_stat.st_gid)
+                except Exception as e:
+                    logger.warning("[FileOps] Cannot preserve ownership: %s", e)
+        except Exception as e:
+            logger.warning("[FileOps] Cannot preserve permissions: %s", e)
+            self._record_warning(f"Cannot preserve permissions: {os.path.basename(src)}")
+
     def calculate_total_size(self, items):
         """
         Calculate total size of items
-        
+
         Args:
             items: List of paths
-            
+
         Returns:
             tuple: (total_size, file_count)
+
+        As a side effect, self._scan_files caches (path, rel_path, size)
+        triples and self._scan_dirs/_scan_links cache (path, rel_path)
+        pairs for every directory and symlink seen, so a copy that
+        follows the scan can be driven straight off the plan without
+        re-statting the tree.
         """
         total_size = 0
         file_count = 0
-        
+        scanned = []
+        scanned_dirs = []
+        scanned_links = []
+
         logger.debug("[FileOps] Calculating total size for %d items", len(items))
-        
+
         for item in items:
             if self.is_cancelled():
                 logger.debug("[FileOps] Calculation cancelled")
                 break
-                
+
             item = ensure_str(item)
+            item_rel = os.path.basename(os.path.normpath(item))
             if os.path.isfile(item):
                 try:
                     size = os.path.getsize(item)
                     total_size += size
                     file_count += 1
-                    logger.debug("[FileOps] File: %s (%s)", os.path.basename(item), format_size(size))
+                    scanned.append((item, item_rel, size))
                 except (OSError, PermissionError) as e:
                     logger.error("[FileOps] Error getting size for %s: %s", item, e)
-                    with self.progress_lock:
-                        self.progress.warnings.append(f"Cannot read size: {os.path.basename(item)}")
+                    self._record_warning(f"Cannot read size: {os.path.basename(item)}")
             elif os.path.isdir(item):
                 logger.debug("[FileOps] Directory: %s", item)
-                try:
-                    for root, dirs, files in os.walk(item):
-                        if self.is_cancelled():
-                            break
-                        # Filter out directories we can't access
-                        dirs[:] = [d for d in dirs if os.access(os.path.join(root, d), os.R_OK | os.X_OK)]
-                        
-                        for f in files:
+                # scandir gives each entry a cached stat, so this costs
+                # about one syscall per file instead of the ~4 that the
+                # old walk + isfile/islink/getsize/access combination did
+                scanned_dirs.append((item, item_rel))
+                stack = [(item, item_rel)]
+                # Bound methods hoisted out of the per-entry loop: each
+                # dotted access is a dict probe in CPython, and this
+                # loop runs once per file in the tree
+                add_file = scanned.append
+                add_dir = scanned_dirs.append
+                add_link = scanned_links.append
+                push = stack.append
+                join = safe_join
+                while stack:
+                    if self.is_cancelled():
+                        break
+                    path, rel = stack.pop()
+                    try:
+                        entries = os.scandir(path)
+                    except OSError as e:
+                        logger.debug("[FileOps] Cannot scan %s: %s", path, e)
+                        self._record_warning(f"Cannot scan directory: {os.path.basename(path)}")
+                        continue
+                    with entries:
+                        for entry in entries:
                             try:
-                                filepath = safe_join(root, f)
-                                if os.path.exists(filepath) and not os.path.islink(filepath):
-                                    size = os.path.getsize(filepath)
+                                entry_rel = join(rel, entry.name)
+                                if entry.is_symlink():
+                                    # Links are recreated verbatim on
+                                    # copy; they carry no byte count
+                                    add_link((entry.path, entry_rel))
+                                    continue
+                                if entry.is_dir(follow_symlinks=False):
+                                    add_dir((entry.path, entry_rel))
+                                    push((entry.path, entry_rel))
+                                elif entry.is_file(follow_symlinks=False):
+                                    size = entry.stat(follow_symlinks=False).st_size
                                     total_size += size
                                     file_count += 1
-                            except (OSError, PermissionError) as e:
-                                logger.debug("[FileOps] Cannot access %s: %s", f, e)
-                except Exception as e:
-                    logger.error("[FileOps] Error walking directory %s: %s", item, e)
-                    with self.progress_lock:
-                        self.progress.warnings.append(f"Cannot scan directory: {os.path.basename(item)}")
-        
+                                    add_file((entry.path, entry_rel, size))
+                            except OSError as e:
+                                logger.debug("[FileOps] Cannot access %s: %s", entry.name, e)
+
+        self._scan_files = scanned
+        self._scan_dirs = scanned_dirs
+        self._scan_links = scanned_links
         logger.info("[FileOps] Total size: %s (%d files)", format_size(total_size), file_count)
         return total_size, file_count
     
@@ -228,139 +825,155 @@ class FileOperations:
         logger.debug("[FileOps] Options: verify=%s, preserve_perms=%s", verify, preserve_permissions)
         
         try:
-            # Get source file info
+            # Get source file info - one stat serves permissions,
+            # ownership and timestamps below
             src_stat = None
-            if preserve_permissions:
-                try:
-                    src_stat = os.stat(src)
-                except Exception as e:
-                    logger.warning("[FileOps] Cannot stat source file: %s", e)
-                    with self.progress_lock:
-                        self.progress.warnings.append(f"Cannot read source permissions: {os.path.basename(src)}")
+            try:
+                src_stat = os.stat(src)
+            except Exception as e:
+                logger.warning("[FileOps] Cannot stat source file: %s", e)
+                self._record_warning(f"Cannot read source permissions: {os.path.basename(src)}")
             
-            # Check if destination exists
-            if os.path.exists(dst):
-                logger.warning("[FileOps] Destination exists: %s", dst)
+            # File size comes from the stat above - getsize would be a
+            # second stat of the same inode
+            if src_stat is not None:
+                file_size = src_stat.st_size
+            else:
+                file_size = os.path.getsize(src)
+            if not self._parallel_copy:
+                # With parallel workers the current_* slots describe the
+                # batch (seeded once in _copy_files_parallel); resetting
+                # them per file would interleave one worker's name with
+                # another's byte counts
                 with self.progress_lock:
-                    self.progress.warnings.append(f"Overwriting: {os.path.basename(dst)}")
-            
-            # Get file size
-            file_size = os.path.getsize(src)
-            with self.progress_lock:
-                self.progress.current_file = ensure_unicode(os.path.basename(src))
-                self.progress.current_total = file_size
-                self.progress.current_bytes = 0
-                self.progress.current_percent = 0
-            
-            logger.debug("[FileOps] File size: %s", format_size(file_size))
-            
-            # Calculate speed and ETA
-            start_time = time.time()
-            last_update = start_time
-            last_bytes = 0
-            
-            # Ensure destination directory exists
-            dst_dir = os.path.dirname(dst)
-            if not os.path.exists(dst_dir):
-                try:
-                    os.makedirs(dst_dir, exist_ok=True)
-                    logger.debug("[FileOps] Created directory: %s", dst_dir)
-                except Exception as e:
-                    logger.error("[FileOps] Cannot create directory %s: %s", dst_dir, e)
-                    with self.progress_lock:
-                        self.progress.errors.append(f"Cannot create directory: {dst_dir}")
-                    return False
-            
+                    self.progress.current_file = ensure_unicode(os.path.basename(src))
+                    self.progress.current_total = file_size
+                    self.progress.current_bytes = 0
+                    self.progress.current_percent = 0
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[FileOps] File size: %s", format_size(file_size))
+            
+            # Monotonic integer clock for speed/ETA and throttling
+            start_ns = time.monotonic_ns()
+            last_ns = start_ns
+            
+            # The destination directory is the caller's responsibility:
+            # copy() and copy_directory() pre-create every directory in
+            # one pass over the scan plan, so re-checking the parent
+            # chain here would just repeat those stats per file. A
+            # missing parent surfaces as ENOENT from open below.
+
             # Copy with progress tracking
             try:
-                with open(src, 'rb') as fsrc:
-                    with open(dst, 'wb') as fdst:
-                        while True:
-                            # Check cancellation and pause
-                            if self.is_cancelled():
+                # Files that fit one buffer take a straight-line path:
+                # no kernel probe, no chunk loop, no throttle branches
+                if file_size <= self.buffer_size:
+                    return self._copy_small(src, dst, src_stat,
+                                            preserve_permissions, verify)
+
+                src_hash = None
+                # Reflink first on CoW filesystems: a metadata-only clone
+                # regardless of size. Pointless when verifying - the
+                # "copy" shares the source's blocks by construction.
+                # buffering=0 gives raw io.FileIO objects: each readinto
+                # is one syscall straight into our 1 MiB buffer instead
+                # of being staged through an 8 KiB BufferedReader, and
+                # writes hit the kernel without an extra memcpy
+                if verify or not self._try_reflink(src, dst, file_size):
+                    with open(src, 'rb', buffering=0) as fsrc:
+                        with os.fdopen(self._open_dst_fd(dst), 'wb',
+                                       buffering=0) as fdst:
+                            # Tell the kernel both files stream sequentially
+                            # so read-ahead ramps up immediately
+                            if _HAS_FADVISE:
+                                _fadvise(fsrc.fileno(), os.POSIX_FADV_SEQUENTIAL)
+                                _fadvise(fdst.fileno(), os.POSIX_FADV_SEQUENTIAL)
+                            if verify:
+                                # Hash the source as it streams through the
+                                # userspace buffer - the kernel path never
+                                # sees the bytes, so skip it when verifying
+                                src_hash = hashlib.blake2b(digest_size=16)
+                                result = 'fallback'
+                            else:
+                                # Kernel fast path first: bytes never enter
+                                # userspace and CoW filesystems can reflink
+                                result = self._copy_in_kernel(fsrc, fdst,
+                                                              file_size, start_ns)
+                            if result == 'cancelled':
                                 logger.info("[FileOps] Copy cancelled by user")
                                 return False
-                            self.wait_if_paused()
-                            
-                            # Read chunk
-                            chunk = fsrc.read(self.buffer_size)
-                            if not chunk:
-                                break
-                            
-                            # Write chunk
-                            fdst.write(chunk)
-                            bytes_copied = len(chunk)
-                            
-                            with self.progress_lock:
-                                self.progress.current_bytes += bytes_copied
-                                self.progress.overall_bytes += bytes_copied
-                            
-                            # Update progress periodically
-                            now = time.time()
-                            if now - last_update >= 0.1:  # Update every 100ms
-                                with self.progress_lock:
-                                    # Calculate speed
-                                    elapsed = now - start_time
-                                    if elapsed > 0:
-                                        self.progress.speed = self.progress.current_bytes / elapsed
-                                    
-                                    # Calculate ETA
-                                    if self.progress.speed > 0:
-                                        remaining = file_size - self.progress.current_bytes
-                                        self.progress.eta = remaining / self.progress.speed
-                                    
-                                    # Calculate percentages
-                                    if file_size > 0:
-                                        self.progress.current_percent = int(
-                                            (self.progress.current_bytes * 100) / file_size
-                                        )
-                                    
-                                    if self.progress.overall_total > 0:
-                                        self.progress.overall_percent = int(
-                                            (self.progress.overall_bytes * 100) / self.progress.overall_total
-                                        )
-                                
-                                self.report_progress()
-                                last_update = now
-                
+
+                            # Kernel copy unavailable: for medium files
+                            # map the source instead of read()ing it -
+                            # cheap when the pages are already cached
+                            if (result == 'fallback' and src_hash is None
+                                    and _MMAP_COPY_MIN <= file_size <= _MMAP_COPY_MAX):
+                                result = self._copy_mmap(fsrc, fdst,
+                                                         file_size, start_ns)
+                                if result == 'cancelled':
+                                    logger.info("[FileOps] Copy cancelled by user")
+                                    return False
+
+                            if result == 'fallback':
+                                mv = self._get_copy_buffer()
+                            pending = 0
+
+                            while result == 'fallback':
+                                # Check cancellation and pause
+                                if self.is_cancelled():
+                                    self._flush_copied(pending)
+                                    logger.info("[FileOps] Copy cancelled by user")
+                                    return False
+                                self.wait_if_paused()
+
+                                # Read chunk into the reusable buffer
+                                n = fsrc.readinto(mv)
+                                if not n:
+                                    break
+
+                                # Write chunk - raw IO may write short,
+                                # so loop until the slice is drained
+                                view = mv[:n]
+                                while view:
+                                    written = fdst.write(view)
+                                    view = view[written:]
+                                if src_hash is not None:
+                                    src_hash.update(mv[:n])
+                                pending += n
+                                last_ns, pending = self._maybe_report(
+                                    file_size, start_ns, last_ns, pending)
+
+                            self._flush_copied(pending)
+
+                            # The source won't be read again - drop its pages
+                            # so multi-GB copies don't evict hotter data
+                            if _HAS_FADVISE:
+                                _fadvise(fsrc.fileno(), os.POSIX_FADV_DONTNEED)
+
+                            # Metadata while the fd is still open: the
+                            # f-variants skip re-resolving the dst path
+                            # for each of the 3-4 calls copystat made
+                            self._apply_metadata(src, dst, src_stat,
+                                                 preserve_permissions,
+                                                 fd=fdst.fileno())
+                else:
+                    # Reflink path closed its own fds; fall back to the
+                    # path-based calls for metadata
+                    self._apply_metadata(src, dst, src_stat,
+                                         preserve_permissions)
+
                 logger.debug("[FileOps] File copy completed")
                 
-                # Preserve metadata
-                try:
-                    shutil.copystat(src, dst)
-                    logger.debug("[FileOps] Metadata copied")
-                    
-                    # Preserve permissions if requested
-                    if preserve_permissions and src_stat:
-                        try:
-                            os.chmod(dst, src_stat.st_mode)
-                            logger.debug("[FileOps] Permissions preserved: %s", oct(src_stat.st_mode)[-3:])
-                            
-                            # Copy ownership if running as root
-                            if os.geteuid() == 0:  # root
-                                try:
-                                    os.chown(dst, src_stat.st_uid, src_stat.st_gid)
-                                    logger.debug("[FileOps] Ownership preserved: %s:%s", 
-                                               src_stat.st_uid, src_stat.st_gid)
-                                except Exception as e:
-                                    logger.warning("[FileOps] Cannot preserve ownership: %s", e)
-                        except Exception as e:
-                            logger.warning("[FileOps] Cannot preserve permissions: %s", e)
-                            with self.progress_lock:
-                                self.progress.warnings.append(f"Cannot preserve permissions: {os.path.basename(src)}")
-                except Exception as e:
-                    logger.warning("[FileOps] Cannot copy metadata: %s", e)
-                    with self.progress_lock:
-                        self.progress.warnings.append(f"Cannot copy metadata: {os.path.basename(src)}")
-                
-                # Verify if requested
+                # Verify if requested: the source digest was computed in
+                # the copy loop above, so only the destination needs a
+                # read here - one extra pass instead of two
                 if verify:
                     logger.debug("[FileOps] Verifying copy...")
-                    if not self.verify_file(src, dst):
+                    if src_hash.digest() != self._hash_copied_file(dst):
                         error_msg = f"Verification failed: {os.path.basename(src)}"
                         logger.error("[FileOps] %s", error_msg)
-                        with self.progress_lock:
-                            self.progress.errors.append(error_msg)
+                        self._record_error(error_msg)
                         
                         # Remove failed copy
                         try:
@@ -379,21 +992,18 @@ class FileOperations:
             except (IOError, OSError, PermissionError) as e:
                 error_msg = f"I/O error copying {os.path.basename(src)}: {str(e)}"
                 logger.error("[FileOps] %s", error_msg)
-                with self.progress_lock:
-                    self.progress.errors.append(error_msg)
+                self._record_error(error_msg)
                 return False
             except Exception as e:
                 error_msg = f"Error copying {os.path.basename(src)}: {str(e)}"
                 logger.error("[FileOps] %s", error_msg)
-                with self.progress_lock:
-                    self.progress.errors.append(error_msg)
+                self._record_error(error_msg)
                 return False
                 
         except Exception as e:
             error_msg = f"Failed to copy {os.path.basename(src)}: {str(e)}"
             logger.error("[FileOps] %s", error_msg)
-            with self.progress_lock:
-                self.progress.errors.append(error_msg)
+            self._record_error(error_msg)
             return False
     
     def copy(self, items, dest_dir, verify=None, preserve_permissions=None):
@@ -424,9 +1034,11 @@ class FileOperations:
         # Reset progress
         with self.progress_lock:
             self.progress.reset()
+        self._op_start_ns = time.monotonic_ns()
         self.cancel_flag.clear()
-        self.pause_flag.clear()
-        
+        with self._pause_cv:
+            self._paused = False
+
         # Calculate total size
         total_size, total_files = self.calculate_total_size(items)
         with self.progress_lock:
@@ -437,47 +1049,58 @@ class FileOperations:
             logger.info("[FileOps] Operation cancelled before starting")
             return False
         
-        # Ensure destination exists
-        if not os.path.exists(dest_dir):
-            try:
-                os.makedirs(dest_dir, exist_ok=True)
-                logger.info("[FileOps] Created destination directory: %s", dest_dir)
-            except Exception as e:
-                error_msg = f"Cannot create destination directory: {dest_dir}"
-                logger.error("[FileOps] %s: %s", error_msg, e)
-                with self.progress_lock:
-                    self.progress.errors.append(error_msg)
-                return False
+        # Ensure destination exists - exist_ok makes the call idempotent,
+        # no point statting first
+        try:
+            os.makedirs(dest_dir, exist_ok=True)
+        except Exception as e:
+            error_msg = f"Cannot create destination directory: {dest_dir}"
+            logger.error("[FileOps] %s: %s", error_msg, e)
+            self._record_error(error_msg)
+            return False
         
-        # Copy each item
+        # Drive the copy off the scan plan: directories first, then the
+        # symlinks, then a flat loop over the files - no isfile/isdir/
+        # getsize calls here, the scan already paid for that metadata
         success = True
-        for item in items:
+        for src_dir, rel in self._scan_dirs:
             if self.is_cancelled():
                 logger.info("[FileOps] Copy operation cancelled")
                 success = False
                 break
-            
-            item = ensure_str(item)
-            item_name = os.path.basename(item)
-            dest_path = safe_join(dest_dir, item_name)
-            
-            logger.debug("[FileOps] Processing: %s", item_name)
-            
-            if os.path.isfile(item):
-                # Copy file
-                if not self.copy_file(item, dest_path, verify, preserve_permissions):
+            if not self._create_dest_dir(src_dir, safe_join(dest_dir, rel),
+                                         preserve_permissions):
+                success = False
+
+        if success:
+            for src_path, rel in self._scan_links:
+                if self.is_cancelled():
+                    logger.info("[FileOps] Copy operation cancelled")
+                    success = False
+                    break
+                if not self._copy_symlink(src_path, safe_join(dest_dir, rel)):
+                    success = False
+
+        if success and self.parallel_copies > 1 and len(self._scan_files) > 1:
+            # Overlap read stalls on one file with writes of another;
+            # progress counters are already lock-protected
+            if not self._copy_files_parallel(dest_dir, verify,
+                                             preserve_permissions):
+                success = False
+        else:
+            for src_path, rel, size in self._scan_files:
+                if self.is_cancelled():
+                    logger.info("[FileOps] Copy operation cancelled")
+                    success = False
+                    break
+
+                if not self.copy_file(src_path, safe_join(dest_dir, rel),
+                                      verify, preserve_permissions):
                     success = False
                     if self.is_cancelled():
                         break
                 with self.progress_lock:
                     self.progress.files_done += 1
-                
-            elif os.path.isdir(item):
-                # Copy directory recursively
-                if not self.copy_directory(item, dest_path, verify, preserve_permissions):
-                    success = False
-                    if self.is_cancelled():
-                        break
         
         # Final progress update
         if not self.is_cancelled():
@@ -499,7 +1122,54 @@ class FileOperations:
                            len(self.progress.errors))
         
         return success and not self.is_cancelled()
-    
+
+    def _copy_files_parallel(self, dest_dir, verify, preserve_permissions):
+        """
+        Copy the scanned file plan with a bounded worker pool
+
+        Destination directories already exist by the time this runs, so
+        workers are independent: each one copies whole files through
+        copy_file() with its own thread-local buffer. The per-file
+        progress slots are shared between workers and would be garbage
+        if updated per file, so while _parallel_copy is set the
+        current_* row describes the batch as a whole and _maybe_report
+        publishes only overall-derived numbers, which stay correct
+        under concurrent folding.
+        """
+        def _copy_one(entry):
+            src_path, rel, size = entry
+            if self.is_cancelled():
+                return False
+            self._buffer_records()
+            try:
+                ok = self.copy_file(src_path, safe_join(dest_dir, rel),
+                                    verify, preserve_permissions)
+            finally:
+                self._flush_records()
+            with self.progress_lock:
+                self.progress.files_done += 1
+            return ok
+
+        workers = min(self.parallel_copies, len(self._scan_files))
+        logger.info("[FileOps] Copying %d files with %d workers",
+                    len(self._scan_files), workers)
+        with self.progress_lock:
+            self.progress.current_file = "%d files" % len(self._scan_files)
+            self.progress.current_total = self.progress.overall_total
+            self.progress.current_bytes = self.progress.overall_bytes
+            self.progress.current_percent = self.progress.overall_percent
+        self._parallel_copy = True
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_copy_one, self._scan_files))
+        finally:
+            self._parallel_copy = False
+
+        if self.is_cancelled():
+            logger.info("[FileOps] Copy operation cancelled")
+            return False
+        return all(results)
+
     def copy_directory(self, src_dir, dst_dir, verify=None, preserve_permissions=None):
         """
         Copy directory recursively
@@ -522,67 +1192,121 @@ class FileOperations:
             preserve_permissions = self.preserve_permissions
         
         logger.debug("[FileOps] Copying directory: %s -> %s", src_dir, dst_dir)
-        
+
         try:
-            # Get source directory info for permissions
-            src_stat = None
-            if preserve_permissions:
-                try:
-                    src_stat = os.stat(src_dir)
-                except:
-                    pass
-            
-            # Create destination directory
-            if not os.path.exists(dst_dir):
-                try:
-                    os.makedirs(dst_dir, exist_ok=True)
-                    logger.debug("[FileOps] Created directory: %s", dst_dir)
-                except Exception as e:
-                    error_msg = f"Cannot create directory {dst_dir}: {str(e)}"
-                    logger.error("[FileOps] %s", error_msg)
-                    with self.progress_lock:
-                        self.progress.errors.append(error_msg)
-                    return False
-            
-            # Apply directory permissions if preserving
-            if preserve_permissions and src_stat:
-                try:
-                    os.chmod(dst_dir, src_stat.st_mode)
-                    if os.geteuid() == 0:  # root
-                        os.chown(dst_dir, src_stat.st_uid, src_stat.st_gid)
-                    logger.debug("[FileOps] Directory permissions preserved")
-                except Exception as e:
-                    logger.warning("[FileOps] Cannot set directory permissions: %s", e)
-                    with self.progress_lock:
-                        self.progress.warnings.append(f"Cannot set permissions for {os.path.basename(dst_dir)}")
-            
-            # Copy contents
-            for item in safe_listdir(src_dir):
+            if hasattr(os, 'fwalk'):
+                # fwalk keeps a directory fd open per level (openat-based),
+                # so neither the walk nor our stats re-resolve full paths,
+                # and each directory is listed exactly once
+                for root, dirs, files, rootfd in os.fwalk(src_dir):
+                    if self.is_cancelled():
+                        return False
+
+                    rel = os.path.relpath(root, src_dir)
+                    dst_root = dst_dir if rel == '.' else safe_join(dst_dir, rel)
+                    if not self._create_dest_dir(root, dst_root,
+                                                 preserve_permissions):
+                        return False
+
+                    for name in files:
+                        if self.is_cancelled():
+                            return False
+                        if not self.copy_file(safe_join(root, name),
+                                              safe_join(dst_root, name),
+                                              verify, preserve_permissions):
+                            return False
+                        with self.progress_lock:
+                            self.progress.files_done += 1
+
+                return True
+
+            # Portable fallback: recursive listing
+            if not self._create_dest_dir(src_dir, dst_dir, preserve_permissions):
+                return False
+
+            for item in safe_listdir_names(src_dir):
                 if self.is_cancelled():
                     return False
-                
+
                 src_path = safe_join(src_dir, item)
                 dst_path = safe_join(dst_dir, item)
-                
+
                 if os.path.isfile(src_path):
                     if not self.copy_file(src_path, dst_path, verify, preserve_permissions):
                         return False
                     with self.progress_lock:
                         self.progress.files_done += 1
-                    
+
                 elif os.path.isdir(src_path):
                     if not self.copy_directory(src_path, dst_path, verify, preserve_permissions):
                         return False
-            
+
             return True
-            
+
         except Exception as e:
             error_msg = f"Error copying directory {src_dir}: {str(e)}"
             logger.error("[FileOps] %s", error_msg)
-            with self.progress_lock:
-                self.progress.errors.append(error_msg)
+            self._record_error(error_msg)
             return False
-    
+
+    def _create_dest_dir(self, src_dir, dst_dir, preserve_permissions):
+        """Create one destination directory, optionally copying its
+        permissions/ownership from src_dir"""
+        src_stat = None
+        if preserve_permissions:
+            try:
+                src_stat = os.stat(src_dir)
+            except OSError:
+                pass
+
+        # Parents come earlier in the scan plan, so a single mkdir is
+        # the common case - makedirs walking the whole path chain only
+        # runs for standalone calls with a missing parent
+        try:
+            os.mkdir(dst_dir)
+        except FileExistsError:
+            pass
+        except OSError:
+            try:
+                os.makedirs(dst_dir, exist_ok=True)
+            except Exception as e:
+                error_msg = f"Cannot create directory {dst_dir}: {str(e)}"
+                logger.error("[FileOps] %s", error_msg)
+                self._record_error(error_msg)
+                return False
+
+        if src_stat:
+            try:
+                os.chmod(dst_dir, src_stat.st_mode)
+                if os.geteuid() == 0:  # root
+                    os.chown(dst_dir, src_stat.st_uid, src_stat.st_gid)
+            except Exception as e:
+                logger.warning("[FileOps] Cannot set directory permissions: %s", e)
+                self._record_warning(f"Cannot set permissions for {os.path.basename(dst_dir)}")
+
+        return True
+
+    def _copy_symlink(self, src_path, dst_path):
+        """Recreate one symlink at the destination, target verbatim
+
+        Links keep pointing at whatever they pointed at - relative
+        targets resolve inside the copied tree, absolute ones outside
+        it - which is what a file manager move/copy is expected to do.
+        """
+        try:
+            target = os.readlink(src_path)
+            try:
+                os.symlink(target, dst_path)
+            except FileExistsError:
+                os.unlink(dst_path)
+                os.symlink(target, dst_path)
+            return True
+        except OSError as e:
+            error_msg = f"Cannot copy symlink {os.path.basename(src_path)}: {str(e)}"
+            logger.error("[FileOps] %s", error_msg)
+            self._record_error(error_msg)
+            return False
+
     def move(self, items, dest_dir, preserve_permissions=None):
         """
         Move files/directories
@@ -615,11 +1339,43 @@ class FileOperations:
         logger.debug("[FileOps] Rename failed, using copy+delete")
         if self.copy(items, dest_dir, verify=False, preserve_permissions=preserve_permissions):
             logger.debug("[FileOps] Copy successful, now deleting originals")
-            return self.delete(items, use_trash=False)
-        
+            return self._delete_moved_sources(items)
+
         logger.error("[FileOps] Move operation failed")
         return False
-    
+
+    def _delete_moved_sources(self, items):
+        """Remove the originals after a cross-filesystem move
+
+        The copy just traversed the whole tree and the scan plan still
+        holds every path it saw, so the sources are unlinked straight
+        off the plan - files and symlinks first, then directories
+        children-first - instead of paying a second full tree walk
+        with its stat per entry. If a directory refuses to go away,
+        it contains something the copy never saw (an entry created
+        after the scan, or a special file the scan skips); deleting
+        that would destroy data the destination does not have, so the
+        leftovers are left in place and the move reports failure.
+        """
+        try:
+            for path, _rel, _size in self._scan_files:
+                os.unlink(path)
+            for path, _rel in self._scan_links:
+                os.unlink(path)
+            for path, _rel in reversed(self._scan_dirs):
+                os.rmdir(path)
+        except OSError as e:
+            logger.error("[FileOps] Source cleanup stopped at %s: %s",
+                         getattr(e, 'filename', '?'), e)
+            self._record_error("Move incomplete: uncopied entries remain "
+                               "in the source and were not deleted")
+            return False
+
+        logger.info("[FileOps] Move sources removed (%d files, %d links, %d dirs)",
+                    len(self._scan_files), len(self._scan_links),
+                    len(self._scan_dirs))
+        return True
+
     def _try_rename_move(self, items, dest_dir):
         """Try to move using rename (faster, same filesystem)"""
         try:
@@ -669,7 +1425,8 @@ class FileOperations:
         with self.progress_lock:
             self.progress.reset()
         self.cancel_flag.clear()
-        self.pause_flag.clear()
+        with self._pause_cv:
+            self._paused = False
         
         with self.progress_lock:
             self.progress.files_total = len(items)
@@ -678,14 +1435,46 @@ class FileOperations:
         trash_dir = None
         if use_trash:
             trash_dir = "/tmp/.wg_trash"
-            if not os.path.exists(trash_dir):
-                try:
-                    os.makedirs(trash_dir, mode=0o755, exist_ok=True)
-                    logger.info("[FileOps] Created trash directory: %s", trash_dir)
-                except Exception as e:
-                    logger.error("[FileOps] Cannot create trash directory: %s", e)
-                    use_trash = False
+            try:
+                os.makedirs(trash_dir, mode=0o755, exist_ok=True)
+            except Exception as e:
+                logger.error("[FileOps] Cannot create trash directory: %s", e)
+                use_trash = False
         
+        success = True
+        dir_fds = {}  # parent path -> fd, shared by sibling items
+        if not use_trash and self.parallel_scan and len(items) > 1:
+            # Permanent deletes are independent per item; overlap the
+            # seek-bound unlinks. Trash moves stay serial because the
+            # duplicate-name probe races against itself.
+            success = self._delete_items_parallel(items, dir_fds)
+        else:
+            success = self._delete_items_serial(items, use_trash, trash_dir,
+                                                dir_fds)
+
+        for dfd in dir_fds.values():
+            if dfd >= 0:
+                os.close(dfd)
+
+        # Final progress update
+        if not self.is_cancelled():
+            with self.progress_lock:
+                self.progress.overall_percent = 100
+            self.report_progress()
+
+        if success and not self.is_cancelled():
+            logger.info("[FileOps] Delete operation completed successfully")
+        else:
+            if self.is_cancelled():
+                logger.info("[FileOps] Delete operation cancelled by user")
+            else:
+                logger.error("[FileOps] Delete operation failed with %d errors",
+                           len(self.progress.errors))
+
+        return success and not self.is_cancelled()
+
+    def _delete_items_serial(self, items, use_trash, trash_dir, dir_fds):
+        """Original one-at-a-time delete loop; also handles trash moves"""
         success = True
         for i, item in enumerate(items):
             if self.is_cancelled():
@@ -715,42 +1504,159 @@ class FileOperations:
                         counter += 1
                     
                     logger.debug("[FileOps] Moving to trash: %s", trash_path)
-                    shutil.move(item, trash_path)
+                    # rename is O(1) when the trash lives on the same
+                    # filesystem - the common case on an STB; only a
+                    # cross-device move pays for shutil's copy+delete
+                    try:
+                        os.rename(item, trash_path)
+                    except OSError as e:
+                        if e.errno != errno.EXDEV:
+                            raise
+                        shutil.move(item, trash_path)
                     logger.info("[FileOps] Moved to trash: %s", os.path.basename(item))
                     
                 else:
-                    # Permanent delete
-                    if os.path.isfile(item) or os.path.islink(item):
-                        os.remove(item)
-                        logger.info("[FileOps] Deleted file: %s", os.path.basename(item))
-                    elif os.path.isdir(item):
-                        shutil.rmtree(item, ignore_errors=True)
-                        logger.info("[FileOps] Deleted directory: %s", os.path.basename(item))
-                        
+                    # Permanent delete: unlink through the parent's
+                    # dirfd so the kernel resolves each parent path
+                    # once per batch of siblings, not once per item
+                    self._delete_permanent(item, dir_fds)
+
             except Exception as e:
                 error_msg = f"Cannot delete {os.path.basename(item)}: {str(e)}"
                 logger.error("[FileOps] %s", error_msg)
-                with self.progress_lock:
-                    self.progress.errors.append(error_msg)
+                self._record_error(error_msg)
                 success = False
-        
-        # Final progress update
-        if not self.is_cancelled():
+
+        return success
+
+    def _delete_items_parallel(self, items, dir_fds):
+        """
+        Permanently delete a batch of items with a bounded worker pool
+
+        Parent directory fds are opened up front in the calling thread,
+        so workers only ever read the shared cache; unlink(dir_fd=...)
+        on a shared fd is thread-safe. Progress counters and the error
+        list are updated under progress_lock, same as the serial loop.
+        """
+        items = [ensure_str(item) for item in items]
+        for item in items:
+            parent = os.path.dirname(item) or '.'
+            if parent not in dir_fds:
+                try:
+                    dir_fds[parent] = os.open(parent,
+                                              os.O_RDONLY | os.O_DIRECTORY)
+                except OSError:
+                    dir_fds[parent] = -1  # per-item os.remove fallback
+
+        def _delete_one(item):
+            if self.is_cancelled():
+                return False
+            logger.debug("[FileOps] Deleting: %s", item)
+            self._buffer_records()
+            try:
+                self._delete_permanent(item, dir_fds)
+            except Exception as e:
+                error_msg = f"Cannot delete {os.path.basename(item)}: {str(e)}"
+                logger.error("[FileOps] %s", error_msg)
+                self._record_error(error_msg)
+                return False
+            finally:
+                self._flush_records()
             with self.progress_lock:
-                self.progress.overall_percent = 100
+                self.progress.files_done += 1
+                self.progress.current_file = ensure_unicode(os.path.basename(item))
+                self.progress.overall_percent = int(
+                    self.progress.files_done * 100 / len(items))
             self.report_progress()
-        
-        if success and not self.is_cancelled():
-            logger.info("[FileOps] Delete operation completed successfully")
-        else:
-            if self.is_cancelled():
-                logger.info("[FileOps] Delete operation cancelled by user")
+            return True
+
+        workers = min(_SCAN_WORKERS, len(items))
+        logger.info("[FileOps] Deleting %d items with %d workers",
+                    len(items), workers)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_delete_one, items))
+
+        if self.is_cancelled():
+            logger.info("[FileOps] Delete operation cancelled")
+            return False
+        return all(results)
+
+    def _delete_permanent(self, item, dir_fds):
+        """Delete one item, reusing an opened parent directory fd
+
+        Files and symlinks go through unlink(name, dir_fd=...), which
+        skips re-resolving the parent path for every sibling; the fd is
+        opened once per distinct parent and cached in dir_fds (caller
+        closes them). Directories are removed bottom-up with the
+        fwalk-based helper that already works on dirfds. Errors
+        propagate to the caller's per-item handler.
+        """
+        parent = os.path.dirname(item) or '.'
+        dfd = dir_fds.get(parent)
+        if dfd is None:
+            try:
+                dfd = os.open(parent, os.O_RDONLY | os.O_DIRECTORY)
+            except OSError:
+                dfd = -1  # fall back to full-path syscalls
+            dir_fds[parent] = dfd
+
+        name = os.path.basename(item)
+        try:
+            if dfd >= 0:
+                os.unlink(name, dir_fd=dfd)
             else:
-                logger.error("[FileOps] Delete operation failed with %d errors", 
-                           len(self.progress.errors))
-        
-        return success and not self.is_cancelled()
-    
+                os.remove(item)
+            # DEBUG, not INFO: one line per file adds up in bulk deletes
+            logger.debug("[FileOps] Deleted file: %s", name)
+            return
+        except FileNotFoundError:
+            # Already gone - same quiet outcome as the old isfile gate
+            logger.debug("[FileOps] Already absent: %s", item)
+            return
+        except (IsADirectoryError, PermissionError):
+            if not os.path.isdir(item) or os.path.islink(item):
+                raise
+
+        if not self._rmtree_external(item):
+            if hasattr(os, 'fwalk'):
+                _fast_rmtree(item)
+            else:
+                shutil.rmtree(item, ignore_errors=True)
+        logger.debug("[FileOps] Deleted directory: %s", name)
+
+    def _rmtree_external(self, path):
+        """Hand a large subtree to the system rm; False means use Python
+
+        Only kicks in when a quick scan of the top level already shows
+        more than _RM_TREE_THRESHOLD entries. Per-file progress is not
+        lost by this - bulk directory deletes already ran through
+        rmtree without per-file callbacks. A non-zero exit or a
+        leftover path reports False so the Python deleter can finish
+        whatever rm left behind.
+        """
+        if _RM_BINARY is None:
+            return False
+        count = 0
+        try:
+            with os.scandir(path) as it:
+                for _entry in it:
+                    count += 1
+                    if count > _RM_TREE_THRESHOLD:
+                        break
+        except OSError:
+            return False
+        if count <= _RM_TREE_THRESHOLD:
+            return False
+
+        logger.debug("[FileOps] Large tree, delegating to rm: %s", path)
+        try:
+            result = subprocess.run([_RM_BINARY, '-rf', '--', path],
+                                    check=False)
+        except OSError as e:
+            logger.debug("[FileOps] rm unavailable: %s", e)
+            return False
+        return result.returncode == 0 and not os.path.lexists(path)
+
     def rename(self, old_path, new_name):
         """
         Rename file/directory (preserves permissions automatically)
@@ -769,24 +1675,28 @@ class FileOperations:
         
         try:
             new_path = safe_join(os.path.dirname(old_path), new_name)
-            
-            # Check if new name already exists
-            if os.path.exists(new_path):
+
+            try:
+                if not _rename_noreplace(old_path, new_path):
+                    # No renameat2 here: keep the checked two-step
+                    if os.path.exists(new_path):
+                        raise FileExistsError(errno.EEXIST,
+                                              os.strerror(errno.EEXIST),
+                                              new_path)
+                    os.rename(old_path, new_path)
+            except FileExistsError:
                 error_msg = f"Cannot rename: {os.path.basename(new_path)} already exists"
                 logger.error("[FileOps] %s", error_msg)
-                with self.progress_lock:
-                    self.progress.errors.append(error_msg)
+                self._record_error(error_msg)
                 return False
-            
-            os.rename(old_path, new_path)
+
             logger.info("[FileOps] Rename successful")
             return True
-            
+
         except Exception as e:
             error_msg = f"Cannot rename {os.path.basename(old_path)}: {str(e)}"
             logger.error("[FileOps] %s", error_msg)
-            with self.progress_lock:
-                self.progress.errors.append(error_msg)
+            self._record_error(error_msg)
             return False
     
     def create_directory(self, path, permissions=0o755):
@@ -801,17 +1711,23 @@ class FileOperations:
             bool: True if successful
         """
         logger.info("[FileOps] Creating directory: %s", path)
-        logger.debug("[FileOps] Permissions: %s", oct(permissions)[-3:])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[FileOps] Permissions: %s", oct(permissions)[-3:])
         
         try:
-            os.makedirs(ensure_str(path), mode=permissions, exist_ok=True)
+            # makedirs filters mode through the umask, and umask is
+            # process-global - zeroing it would race the copy/delete
+            # worker threads. A chmod after the fact pins the exact
+            # mode without touching shared state.
+            path_s = ensure_str(path)
+            os.makedirs(path_s, mode=permissions, exist_ok=True)
+            os.chmod(path_s, permissions)
             logger.info("[FileOps] Directory created successfully")
             return True
         except Exception as e:
             error_msg = f"Cannot create directory {path}: {str(e)}"
             logger.error("[FileOps] %s", error_msg)
-            with self.progress_lock:
-                self.progress.errors.append(error_msg)
+            self._record_error(error_msg)
             return False
     
     def create_file(self, path, content="", permissions=0o644):
@@ -831,44 +1747,69 @@ class FileOperations:
                    oct(permissions)[-3:], len(content))
         
         try:
-            # Ensure directory exists
+            # Ensure directory exists; exist_ok makes this a no-op for
+            # a present parent, no stat probe needed first
             dir_path = os.path.dirname(path)
-            if dir_path and not os.path.exists(dir_path):
+            if dir_path:
                 os.makedirs(dir_path, exist_ok=True)
-                logger.debug("[FileOps] Created parent directory: %s", dir_path)
-            
-            with open(ensure_str(path), 'w') as f:
-                f.write(ensure_str(content))
-            
-            # Set permissions
-            os.chmod(path, permissions)
-            
+
+            # Create, then pin the exact mode with fchmod on the open
+            # fd. The open mode is filtered through the umask, but
+            # umask is process-global and zeroing it would race the
+            # copy/delete worker threads into creating world-writable
+            # files; fchmod costs one extra syscall and touches
+            # nothing shared.
+            path_s = ensure_str(path)
+            try:
+                fd = os.open(path_s,
+                             os.O_WRONLY | os.O_CREAT | os.O_EXCL,
+                             permissions)
+            except FileExistsError:
+                fd = os.open(path_s, os.O_WRONLY | os.O_TRUNC)
+            os.fchmod(fd, permissions)
+
+            try:
+                if content:
+                    data = content if isinstance(content, bytes) \
+                        else ensure_str(content).encode('utf-8')
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+
             logger.info("[FileOps] File created successfully")
             return True
             
         except Exception as e:
             error_msg = f"Cannot create file {path}: {str(e)}"
             logger.error("[FileOps] %s", error_msg)
-            with self.progress_lock:
-                self.progress.errors.append(error_msg)
+            self._record_error(error_msg)
             return False
     
-    def verify_file(self, file1, file2):
+    def verify_file(self, file1, file2, algo='blake3'):
         """
-        Verify two files are identical using MD5
-        
+        Verify two files are identical by hash
+
         Args:
             file1: First file path
             file2: Second file path
-            
+            algo: Hash algorithm ('blake3' default, 'md5' for digests
+                comparable with external tools)
+
         Returns:
             bool: True if files match
         """
         logger.debug("[FileOps] Verifying files: %s vs %s", file1, file2)
-        
+
         try:
-            hash1 = self._calculate_md5(file1)
-            hash2 = self._calculate_md5(file2)
+            # Hash both files concurrently: the C hash cores release
+            # the GIL on large buffers, so the two streams overlap
+            # their IO waits and, on multi-core boxes, their CPU work
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                f2 = pool.submit(self._calculate_hash, file2, algo)
+                hash1 = self._calculate_hash(file1, algo)
+                hash2 = f2.result()
             
             match = hash1 == hash2
             logger.debug("[FileOps] Verification %s: %s == %s", 
@@ -879,16 +1820,82 @@ class FileOperations:
             logger.error("[FileOps] Verification error: %s", e)
             return False
     
-    def _calculate_md5(self, filepath):
-        """Calculate MD5 hash of file"""
-        md5 = hashlib.md5()
+    def _hash_copied_file(self, filepath):
+        """
+        blake2b digest of a just-copied file for verification
+
+        Maps the file read-only and feeds the whole mapping to hashlib
+        in one call, avoiding the chunked read loop; falls back to a
+        plain read for empty files, which cannot be mapped.
+        """
+        h = hashlib.blake2b(digest_size=16)
         with open(ensure_str(filepath), 'rb') as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ) as mm:
+                    h.update(mm)
+            except ValueError:
+                h.update(f.read())
+        return h.digest()
+
+    def _calculate_hash(self, filepath, algo='blake3'):
+        """Hex digest of a file
+
+        'blake3' (the default) uses the optional blake3 extension when
+        installed - SIMD and threaded, with a zero-copy mmap ingest -
+        and otherwise the stdlib blake2b; both leave verification
+        bandwidth-bound rather than hash-bound. 'md5' remains for
+        callers that need digests comparable with external tools.
+        """
+        filepath = ensure_str(filepath)
+        if algo == 'md5':
+            if _fastdigest is not None:
+                try:
+                    fd = os.open(filepath, os.O_RDONLY)
+                    try:
+                        return _fastdigest.hash_fd(fd, 'md5').hex()
+                    finally:
+                        os.close(fd)
+                except (OSError, ValueError) as e:
+                    logger.debug("[FileOps] Compiled digest unavailable: %s", e)
+            h = hashlib.md5()
+        elif _blake3 is not None:
+            h = _blake3.blake3(max_threads=_blake3.blake3.AUTO)
+            if hasattr(h, 'update_mmap'):
+                h.update_mmap(filepath)
+                return h.hexdigest()
+        else:
+            h = hashlib.blake2b(digest_size=16)
+
+        with open(filepath, 'rb') as f:
+            # Tell the kernel up front this is a straight sweep so
+            # read-ahead ramps up immediately
+            if _HAS_FADVISE:
+                _fadvise(f.fileno(), os.POSIX_FADV_SEQUENTIAL)
+            # Files that fit the threshold are hashed in one C-level
+            # update over a read-only mapping: no per-chunk Python
+            # iterations and no copies into a userspace buffer
+            size = os.fstat(f.fileno()).st_size
+            if 0 < size <= _MMAP_HASH_MAX:
+                try:
+                    with mmap.mmap(f.fileno(), size,
+                                   prot=mmap.PROT_READ) as mm:
+                        if hasattr(mm, 'madvise'):
+                            mm.madvise(mmap.MADV_SEQUENTIAL)
+                        h.update(mm)
+                    return h.hexdigest()
+                except (OSError, ValueError) as e:
+                    logger.debug("[FileOps] mmap hash unavailable: %s", e)
+
             while True:
                 chunk = f.read(self.buffer_size)
                 if not chunk:
                     break
-                md5.update(chunk)
-        return md5.hexdigest()
+                h.update(chunk)
+            if size > _MMAP_HASH_MAX and _HAS_FADVISE:
+                # One-shot verify of a huge file: drop its pages now
+                # rather than letting them evict more useful cache
+                _fadvise(f.fileno(), os.POSIX_FADV_DONTNEED)
+        return h.hexdigest()
     
     # ==================== PERMISSION METHODS ====================
     
@@ -905,7 +1912,8 @@ class FileOperations:
         try:
             mode = os.stat(path).st_mode
             perm_str = oct(mode)[-3:]
-            logger.debug("[FileOps] Permissions for %s: %s", os.path.basename(path), perm_str)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[FileOps] Permissions for %s: %s", os.path.basename(path), perm_str)
             return perm_str
         except Exception as e:
             logger.error("[FileOps] Cannot get permissions for %s: %s", path, e)
@@ -914,45 +1922,49 @@ class FileOperations:
     def get_permissions_string(self, path):
         """
         Get file permissions as rwx string
-        
+
         Args:
             path: File path
-            
+
         Returns:
             str: Permission string (e.g., 'rwxr-xr-x') or '----------'
         """
         try:
             mode = os.stat(path).st_mode
-            
-            perm_str = ''
-            # File type
-            if os.path.isdir(path):
-                perm_str += 'd'
-            elif os.path.islink(path):
-                perm_str += 'l'
-            else:
-                perm_str += '-'
-            
-            # Owner permissions
-            perm_str += 'r' if mode & stat.S_IRUSR else '-'
-            perm_str += 'w' if mode & stat.S_IWUSR else '-'
-            perm_str += 'x' if mode & stat.S_IXUSR else '-'
-            
-            # Group permissions
-            perm_str += 'r' if mode & stat.S_IRGRP else '-'
-            perm_str += 'w' if mode & stat.S_IWGRP else '-'
-            perm_str += 'x' if mode & stat.S_IXGRP else '-'
-            
-            # Others permissions
-            perm_str += 'r' if mode & stat.S_IROTH else '-'
-            perm_str += 'w' if mode & stat.S_IWOTH else '-'
-            perm_str += 'x' if mode & stat.S_IXOTH else '-'
-            
-            logger.debug("[FileOps] Permission string for %s: %s", os.path.basename(path), perm_str)
+            perm_str = self.get_permissions_string_from_mode(
+                mode, is_link=os.path.islink(path))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[FileOps] Permission string for %s: %s", os.path.basename(path), perm_str)
             return perm_str
         except Exception as e:
             logger.error("[FileOps] Cannot get permission string for %s: %s", path, e)
             return '----------'
+
+    def get_permissions_string_from_mode(self, mode, is_link=False):
+        """
+        Build the rwx string from an already-known st_mode
+
+        Callers that hold a stat result (get_file_info, directory
+        scans) use this to avoid re-statting the path.
+
+        Args:
+            mode: st_mode value
+            is_link: True when the path itself is a symlink; a followed
+                     stat loses that bit, so the caller supplies it
+
+        Returns:
+            str: Permission string (e.g., 'drwxr-xr-x')
+        """
+        # File type
+        if stat.S_ISDIR(mode):
+            type_char = 'd'
+        elif is_link or stat.S_ISLNK(mode):
+            type_char = 'l'
+        else:
+            type_char = '-'
+
+        # The nine rwx characters come precomputed from the table
+        return type_char + _PERM_TABLE[mode & 0o777]
     
     def set_permissions(self, path, permissions):
         """
@@ -978,33 +1990,22 @@ class FileOperations:
                     logger.debug("[FileOps] Octal mode: %s -> %o", permissions, mode)
                 elif len(permissions) == 9 or len(permissions) == 10:
                     # Symbolic notation
-                    mode = 0
                     perm_str = permissions[-9:]  # Get last 9 chars
                     logger.debug("[FileOps] Symbolic: %s", perm_str)
-                    
-                    # Owner
-                    if perm_str[0] == 'r':
-                        mode |= stat.S_IRUSR
-                    if perm_str[1] == 'w':
-                        mode |= stat.S_IWUSR
-                    if perm_str[2] == 'x':
-                        mode |= stat.S_IXUSR
-                    
-                    # Group
-                    if perm_str[3] == 'r':
-                        mode |= stat.S_IRGRP
-                    if perm_str[4] == 'w':
-                        mode |= stat.S_IWGRP
-                    if perm_str[5] == 'x':
-                        mode |= stat.S_IXGRP
-                    
-                    # Others
-                    if perm_str[6] == 'r':
-                        mode |= stat.S_IROTH
-                    if perm_str[7] == 'w':
-                        mode |= stat.S_IWOTH
-                    if perm_str[8] == 'x':
-                        mode |= stat.S_IXOTH
+
+                    # Well-formed strings resolve in one table hit;
+                    # anything else falls back to per-triplet masking
+                    mode = _PERM_MODES.get(perm_str)
+                    if mode is None:
+                        mode = 0
+                        for i, (r_bit, w_bit, x_bit) in enumerate(_POS_MASKS):
+                            triplet = perm_str[i * 3:i * 3 + 3]
+                            if triplet[0] == 'r':
+                                mode |= r_bit
+                            if triplet[1] == 'w':
+                                mode |= w_bit
+                            if triplet[2] == 'x':
+                                mode |= x_bit
                 else:
                     logger.error("[FileOps] Invalid permission format: %s", permissions)
                     return False
@@ -1020,8 +2021,7 @@ class FileOperations:
         except Exception as e:
             error_msg = f"Cannot set permissions for {os.path.basename(path)}: {str(e)}"
             logger.error("[FileOps] %s", error_msg)
-            with self.progress_lock:
-                self.progress.errors.append(error_msg)
+            self._record_error(error_msg)
             return False
     
     def get_ownership(self, path):
@@ -1036,24 +2036,30 @@ class FileOperations:
         """
         try:
             stat_info = os.stat(path)
-            uid = stat_info.st_uid
-            gid = stat_info.st_gid
-            
-            try:
-                user_name = pwd.getpwuid(uid).pw_name
-            except:
-                user_name = str(uid)
-            
-            try:
-                group_name = grp.getgrgid(gid).gr_name
-            except:
-                group_name = str(gid)
-            
-            logger.debug("[FileOps] Ownership for %s: %s:%s", os.path.basename(path), user_name, group_name)
+            user_name, group_name = self.get_ownership_from_ids(
+                stat_info.st_uid, stat_info.st_gid)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[FileOps] Ownership for %s: %s:%s", os.path.basename(path), user_name, group_name)
             return user_name, group_name
         except Exception as e:
             logger.error("[FileOps] Cannot get ownership for %s: %s", path, e)
             return None, None
+
+    def get_ownership_from_ids(self, uid, gid):
+        """
+        Resolve numeric owner/group ids to names
+
+        No filesystem access; the lookups are memoized in
+        compatibility.py, so repeated ids cost one NSS hit total.
+
+        Args:
+            uid: Owner id
+            gid: Group id
+
+        Returns:
+            tuple: (user_name, group_name)
+        """
+        return _uid_to_name(uid), _gid_to_name(gid)
     
     def set_ownership(self, path, user=None, group=None):
         """
@@ -1078,34 +2084,35 @@ class FileOperations:
                 if isinstance(user, int):
                     uid = user
                 else:
+                    # Imported on demand - name-to-id resolution is the
+                    # only pwd use here and can pull in NSS libraries
+                    import pwd
                     try:
                         uid = pwd.getpwnam(user).pw_uid
                     except KeyError:
                         error_msg = f"User not found: {user}"
                         logger.error("[FileOps] %s", error_msg)
-                        with self.progress_lock:
-                            self.progress.errors.append(error_msg)
+                        self._record_error(error_msg)
                         return False
             
             if group is not None:
                 if isinstance(group, int):
                     gid = group
                 else:
+                    import grp
                     try:
                         gid = grp.getgrnam(group).gr_gid
                     except KeyError:
                         error_msg = f"Group not found: {group}"
                         logger.error("[FileOps] %s", error_msg)
-                        with self.progress_lock:
-                            self.progress.errors.append(error_msg)
+                        self._record_error(error_msg)
                         return False
             
             # Check if we have root privileges
             if os.geteuid() != 0:
                 error_msg = "Root privileges required to change ownership"
                 logger.error("[FileOps] %s", error_msg)
-                with self.progress_lock:
-                    self.progress.errors.append(error_msg)
+                self._record_error(error_msg)
                 return False
             
             os.chown(path, uid, gid)
@@ -1115,8 +2122,7 @@ class FileOperations:
         except Exception as e:
             error_msg = f"Cannot set ownership for {os.path.basename(path)}: {str(e)}"
             logger.error("[FileOps] %s", error_msg)
-            with self.progress_lock:
-                self.progress.errors.append(error_msg)
+            self._record_error(error_msg)
             return False
     
     def copy_permissions(self, src, dst):
@@ -1135,24 +2141,40 @@ class FileOperations:
         try:
             # Get source permissions
             src_stat = os.stat(src)
-            
-            # Apply to destination
-            os.chmod(dst, src_stat.st_mode)
-            logger.debug("[FileOps] Permissions copied: %s", oct(src_stat.st_mode)[-3:])
-            
-            # Copy ownership if root
-            if os.geteuid() == 0:  # root
-                os.chown(dst, src_stat.st_uid, src_stat.st_gid)
-                logger.debug("[FileOps] Ownership copied: %s:%s", src_stat.st_uid, src_stat.st_gid)
-            
+
+            # Apply through one open fd: the destination path is walked
+            # once instead of once per chmod/chown. Unopenable targets
+            # (e.g. mode 000 owned by us) keep the path-based calls.
+            try:
+                dfd = os.open(ensure_str(dst), os.O_RDONLY)
+            except OSError:
+                dfd = -1
+            try:
+                if dfd >= 0:
+                    os.fchmod(dfd, src_stat.st_mode)
+                else:
+                    os.chmod(dst, src_stat.st_mode)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[FileOps] Permissions copied: %s", oct(src_stat.st_mode)[-3:])
+
+                # Copy ownership if root
+                if os.geteuid() == 0:  # root
+                    if dfd >= 0:
+                        os.fchown(dfd, src_stat.st_uid, src_stat.st_gid)
+                    else:
+                        os.chown(dst, src_stat.st_uid, src_stat.st_gid)
+                    logger.debug("[FileOps] Ownership copied: %s:%s", src_stat.st_uid, src_stat.st_gid)
+            finally:
+                if dfd >= 0:
+                    os.close(dfd)
+
             logger.info("[FileOps] Permissions copied successfully")
             return True
             
         except Exception as e:
             error_msg = f"Cannot copy permissions from {os.path.basename(src)}: {str(e)}"
             logger.error("[FileOps] %s", error_msg)
-            with self.progress_lock:
-                self.progress.errors.append(error_msg)
+            self._record_error(error_msg)
             return False
     
     def change_file_mode(self, path, add_bits=None, remove_bits=None):
@@ -1171,25 +2193,43 @@ class FileOperations:
         logger.debug("[FileOps] Add bits: %s, Remove bits: %s", add_bits, remove_bits)
         
         try:
-            current_mode = os.stat(path).st_mode
-            
-            if add_bits:
-                current_mode |= add_bits
-                logger.debug("[FileOps] Added bits: %o", add_bits)
-            
-            if remove_bits:
-                current_mode &= ~remove_bits
-                logger.debug("[FileOps] Removed bits: %o", remove_bits)
-            
-            os.chmod(path, current_mode)
+            # Read-modify-write on one open fd walks the path once;
+            # the old stat-then-chmod pair resolved it twice and could
+            # race against a concurrent rename in between
+            try:
+                fd = os.open(ensure_str(path), os.O_RDONLY)
+            except OSError:
+                fd = -1  # unopenable but maybe chmod-able: use paths
+
+            try:
+                if fd >= 0:
+                    current_mode = os.fstat(fd).st_mode
+                else:
+                    current_mode = os.stat(path).st_mode
+
+                if add_bits:
+                    current_mode |= add_bits
+                    logger.debug("[FileOps] Added bits: %o", add_bits)
+
+                if remove_bits:
+                    current_mode &= ~remove_bits
+                    logger.debug("[FileOps] Removed bits: %o", remove_bits)
+
+                if fd >= 0:
+                    os.fchmod(fd, current_mode)
+                else:
+                    os.chmod(path, current_mode)
+            finally:
+                if fd >= 0:
+                    os.close(fd)
+
             logger.info("[FileOps] File mode changed successfully: %s", oct(current_mode)[-3:])
             return True
             
         except Exception as e:
             error_msg = f"Cannot change file mode for {os.path.basename(path)}: {str(e)}"
             logger.error("[FileOps] %s", error_msg)
-            with self.progress_lock:
-                self.progress.errors.append(error_msg)
+            self._record_error(error_msg)
             return False
     
     def make_executable(self, path):
@@ -1249,48 +2289,67 @@ class FileOperations:
             self.progress.errors = []
             self.progress.warnings = []
     
-    def get_file_info(self, path):
+    def get_file_info(self, path, stat_info=None):
         """
         Get detailed file information
-        
+
         Args:
             path: File path
-            
+            stat_info: Optional pre-fetched os.lstat result, so callers
+                       scanning a directory can reuse the stat cached
+                       on each DirEntry instead of paying a second one
+
         Returns:
             dict: File information
         """
         try:
-            stat_info = os.stat(path)
-            
-            info = {
-                'path': path,
-                'name': os.path.basename(path),
-                'size': stat_info.st_size,
-                'size_formatted': format_size(stat_info.st_size),
-                'is_dir': os.path.isdir(path),
-                'is_file': os.path.isfile(path),
-                'is_link': os.path.islink(path),
-                'permissions': oct(stat_info.st_mode)[-3:],
-                'permissions_string': self.get_permissions_string(path),
-                'owner': stat_info.st_uid,
-                'group': stat_info.st_gid,
-                'created': stat_info.st_ctime,
-                'modified': stat_info.st_mtime,
-                'accessed': stat_info.st_atime,
-            }
-            
-            # Get owner/group names
-            user, group = self.get_ownership(path)
-            if user:
-                info['owner_name'] = user
-            if group:
-                info['group_name'] = group
-            
-            return info
-            
+            if stat_info is None:
+                stat_info = os.lstat(path)
+            return self._build_info(path, os.path.basename(path), stat_info)
         except Exception as e:
             logger.error("[FileOps] Cannot get file info for %s: %s", path, e)
             return None
+
+    def _build_info(self, path, name, stat_info):
+        """Build the info dict from a path, its name and an lstat result
+
+        Everything derives from the one stat the caller already holds -
+        no isdir/isfile/islink round trips to the kernel. Symlinks get
+        one extra os.stat so size, permissions and timestamps describe
+        the target, as before; a broken link raises OSError.
+        """
+        mode = stat_info.st_mode
+        is_link = stat.S_ISLNK(mode)
+        if is_link:
+            stat_info = os.stat(path)
+            mode = stat_info.st_mode
+
+        info = {
+            'path': path,
+            'name': name,
+            'size': stat_info.st_size,
+            'size_formatted': format_size(stat_info.st_size),
+            'is_dir': stat.S_ISDIR(mode),
+            'is_file': stat.S_ISREG(mode),
+            'is_link': is_link,
+            'permissions': oct(mode)[-3:],
+            'permissions_string': self.get_permissions_string_from_mode(mode, is_link=is_link),
+            'owner': stat_info.st_uid,
+            'group': stat_info.st_gid,
+            'created': stat_info.st_ctime,
+            'modified': stat_info.st_mtime,
+            'accessed': stat_info.st_atime,
+        }
+
+        # Get owner/group names
+        user, group = self.get_ownership_from_ids(stat_info.st_uid,
+                                                  stat_info.st_gid)
+        if user:
+            info['owner_name'] = user
+        if group:
+            info['group_name'] = group
+
+        return info
     
     def calculate_directory_size(self, path):
         """
@@ -1304,28 +2363,78 @@ class FileOperations:
         """
         total_size = 0
         file_count = 0
-        
+
         logger.debug("[FileOps] Calculating directory size: %s", path)
-        
+
         try:
-            for root, dirs, files in os.walk(path):
-                # Filter out directories we can't access
-                dirs[:] = [d for d in dirs if os.access(os.path.join(root, d), os.R_OK | os.X_OK)]
-                
-                for f in files:
+            # Split the tree at the top level: files here are summed
+            # inline, each subdirectory becomes one independent walk.
+            # DirEntry type checks and stat come cached from the scan,
+            # so no per-entry stat syscall is paid here.
+            subdirs = []
+            with os.scandir(path) as it:
+                for entry in it:
                     try:
-                        filepath = safe_join(root, f)
-                        if os.path.exists(filepath) and not os.path.islink(filepath):
-                            total_size += os.path.getsize(filepath)
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total_size += entry.stat(follow_symlinks=False).st_size
                             file_count += 1
                     except (OSError, PermissionError):
                         pass
-        
+
+            if self.parallel_scan and len(subdirs) > 1:
+                # Walks are seek-bound; overlapping them keeps the disk
+                # queue full. Results aggregate in this thread, so no
+                # locking is needed around the counters.
+                workers = min(_SCAN_WORKERS, len(subdirs))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    for size, count in pool.map(self._walk_and_sum, subdirs):
+                        total_size += size
+                        file_count += count
+            else:
+                for subdir in subdirs:
+                    size, count = self._walk_and_sum(subdir)
+                    total_size += size
+                    file_count += count
+
         except Exception as e:
             logger.error("[FileOps] Error calculating directory size: %s", e)
-        
-        logger.debug("[FileOps] Directory size: %s (%d files)", format_size(total_size), file_count)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[FileOps] Directory size: %s (%d files)", format_size(total_size), file_count)
         return total_size
+
+    def _walk_and_sum(self, path):
+        """Sum regular-file sizes under one subtree; returns (bytes, files)
+
+        Explicit-stack scandir traversal instead of os.walk: DirEntry
+        objects carry the stat from the directory scan, so each file
+        costs one syscall batch via getdents instead of a listdir plus
+        a stat per entry. Unreadable directories are skipped when their
+        scandir fails rather than pre-filtered with os.access.
+        """
+        total_size = 0
+        file_count = 0
+        stack = [path]
+        push = stack.append  # hoisted: runs once per directory entry
+        scandir = os.scandir
+        while stack:
+            current = stack.pop()
+            try:
+                with scandir(current) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                push(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                total_size += entry.stat(follow_symlinks=False).st_size
+                                file_count += 1
+                        except (OSError, PermissionError):
+                            pass
+            except (OSError, PermissionError):
+                pass
+        return total_size, file_count
     
     def get_directory_contents(self, path):
         """
@@ -1338,27 +2447,36 @@ class FileOperations:
             list: List of file info dictionaries
         """
         contents = []
-        
+
         try:
-            for item in safe_listdir(path):
-                item_path = safe_join(path, item)
-                info = self.get_file_info(item_path)
-                if info:
-                    contents.append(info)
-        
+            # One scandir pass; the no-follow stat is cached on the
+            # DirEntry and entry.name is already split out, so each
+            # listed entry costs zero extra syscalls and no basename
+            # (symlink entries pay one os.stat for the target)
+            with os.scandir(ensure_str(path)) as it:
+                add = contents.append
+                build = self._build_info
+                for entry in it:
+                    try:
+                        add(build(entry.path, entry.name,
+                                  entry.stat(follow_symlinks=False)))
+                    except OSError:
+                        continue  # vanished mid-scan or broken symlink
+
         except Exception as e:
             logger.error("[FileOps] Error getting directory contents: %s", e)
-        
+
         return contents
     
-    def compare_files(self, file1, file2):
+    def compare_files(self, file1, file2, algo='blake3'):
         """
         Compare two files (size and content)
-        
+
         Args:
             file1: First file path
             file2: Second file path
-            
+            algo: Hash algorithm for the content check
+
         Returns:
             dict: Comparison results
         """
@@ -1384,12 +2502,25 @@ class FileOperations:
             
             # Compare content if sizes match
             if result['size_match']:
-                hash1 = self._calculate_md5(file1)
-                hash2 = self._calculate_md5(file2)
-                result['hash1'] = hash1
-                result['hash2'] = hash2
-                result['content_match'] = (hash1 == hash2)
-                result['identical'] = result['content_match']
+                if size1 <= 2 * _CMP_PROBE_BYTES:
+                    # Small enough to compare outright - no hashing
+                    with open(ensure_str(file1), 'rb') as f1:
+                        with open(ensure_str(file2), 'rb') as f2:
+                            match = f1.read() == f2.read()
+                    result['content_match'] = match
+                    result['identical'] = match
+                elif self._head_tail_differ(file1, file2, size1):
+                    # Most same-size non-identical files differ in the
+                    # first or last block; two small reads reject them
+                    # without hashing either file end to end
+                    pass
+                else:
+                    hash1 = self._calculate_hash(file1, algo)
+                    hash2 = self._calculate_hash(file2, algo)
+                    result['hash1'] = hash1
+                    result['hash2'] = hash2
+                    result['content_match'] = (hash1 == hash2)
+                    result['identical'] = result['content_match']
             
             logger.debug("[FileOps] Comparison result: %s", result)
             return result
@@ -1398,6 +2529,24 @@ class FileOperations:
             logger.error("[FileOps] Error comparing files: %s", e)
             return result
     
+    def _head_tail_differ(self, file1, file2, size):
+        """True when the first or last probe block of two same-size
+        files differs - a cheap rejection before full hashing"""
+        fd1 = os.open(ensure_str(file1), os.O_RDONLY)
+        try:
+            fd2 = os.open(ensure_str(file2), os.O_RDONLY)
+            try:
+                if (os.pread(fd1, _CMP_PROBE_BYTES, 0)
+                        != os.pread(fd2, _CMP_PROBE_BYTES, 0)):
+                    return True
+                off = max(size - _CMP_PROBE_BYTES, 0)
+                return (os.pread(fd1, _CMP_PROBE_BYTES, off)
+                        != os.pread(fd2, _CMP_PROBE_BYTES, off))
+            finally:
+                os.close(fd2)
+        finally:
+            os.close(fd1)
+
     def create_symlink(self, target_path, link_path):
         """
         Create symbolic link
@@ -1418,8 +2567,7 @@ class FileOperations:
         except Exception as e:
             error_msg = f"Cannot create symlink {link_path}: {str(e)}"
             logger.error("[FileOps] %s", error_msg)
-            with self.progress_lock:
-                self.progress.errors.append(error_msg)
+            self._record_error(error_msg)
             return False
     
     def get_symlink_target(self, link_path):
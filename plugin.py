@@ -4,73 +4,151 @@ Enigma2 Plugin Entry Point for WG File Manager Pro
 
 from __future__ import absolute_import, print_function
 
-# Define PluginDescriptor at module level BEFORE any conditionals
+import os
+
+# Startup chatter costs real time on set-top-box serial consoles;
+# keep the diagnostics opt-in. Error paths still print unconditionally.
+_VERBOSE = bool(os.environ.get('WGFM_VERBOSE'))
+
+# Define PluginDescriptor at module level BEFORE any conditionals;
+# both are filled in by _ensure_enigma2 on first use
 PluginDescriptor = None
 ENIGMA2_AVAILABLE = False
 
-# Try to import Enigma2 components
-try:
-    from Plugins.Plugin import PluginDescriptor as RealPluginDescriptor
-    from Screens.Screen import Screen
-    PluginDescriptor = RealPluginDescriptor
-    ENIGMA2_AVAILABLE = True
-    print("[WGFileManager] Enigma2 components imported successfully")
-except ImportError:
-    # Running outside Enigma2 (testing mode)
-    ENIGMA2_AVAILABLE = False
-    print("[WGFileManager] Running in test mode (no Enigma2)")
+_enigma2_state = None
+
+
+def _ensure_enigma2():
+    """Resolve the Enigma2 imports once, on first use
+
+    Importing plugin.py no longer pays for the Enigma2 component
+    resolution - callers that never build descriptors (test harnesses,
+    menu()/autostart()) skip it entirely. The result is cached, and
+    the module globals are kept in step for the error paths and the
+    __main__ smoke test.
+
+    Returns:
+        tuple: (available, PluginDescriptor or None)
+    """
+    global _enigma2_state, PluginDescriptor, ENIGMA2_AVAILABLE
+    if _enigma2_state is None:
+        try:
+            # PluginDescriptor alone is enough to prove Enigma2 is
+            # present; nothing here ever referenced Screens.Screen,
+            # and importing it dragged in its transitive module graph
+            from Plugins.Plugin import PluginDescriptor as RealPluginDescriptor
+            _enigma2_state = (True, RealPluginDescriptor)
+            if _VERBOSE:
+                print("[WGFileManager] Enigma2 components imported successfully")
+        except ImportError:
+            # Running outside Enigma2 (testing mode)
+            _enigma2_state = (False, None)
+            if _VERBOSE:
+                print("[WGFileManager] Running in test mode (no Enigma2)")
+        ENIGMA2_AVAILABLE, PluginDescriptor = _enigma2_state
+    return _enigma2_state
+
+
+# Separator reused by the startup preamble and the __main__ output
+_BANNER = "=" * 60
+
+# Imports resolved on first use and memoized here, so the second and
+# later launches of the file manager cost a dict lookup instead of a
+# pass through the import machinery for the whole UI stack
+_cached = {}
+
+
+def _lazy(name, importer):
+    """Memoize the result of an import callable under a short name"""
+    value = _cached.get(name)
+    if value is None:
+        value = importer()
+        _cached[name] = value
+    return value
+
+
+def _import_main_screen():
+    # ABSOLUTE IMPORTS FOR ENIGMA2
+    from Plugins.Extensions.WGFileManagerPro.ui.main_screen import WGFileManagerMain
+    return WGFileManagerMain
+
+
+def _import_logger():
+    from Plugins.Extensions.WGFileManagerPro.utils.logger import get_logger, set_debug_mode
+    return get_logger, set_debug_mode
+
+
+def _import_config():
+    from Plugins.Extensions.WGFileManagerPro.core.config import get_config
+    return get_config
+
+
+def _import_messagebox():
+    from Screens.MessageBox import MessageBox
+    return MessageBox
+
+
+# (logger, debug_enabled) resolved on the first launch and reused, so
+# later opens skip the config read and logger setup; core.config calls
+# invalidate_runtime() whenever debug_mode is written, so a toggle
+# takes effect on the next launch without a GUI restart
+_runtime = None
+
+
+def invalidate_runtime():
+    """Drop the cached logger/debug state (call after config changes)"""
+    global _runtime
+    _runtime = None
+
+
+def _show_error(session, msg):
+    """Show an error MessageBox if Enigma2 is up; never raises"""
+    if _ensure_enigma2()[0]:
+        try:
+            MessageBox = _lazy('MessageBox', _import_messagebox)
+            session.open(MessageBox, msg, MessageBox.TYPE_ERROR)
+        except:
+            print("[WGFileManager] Could not show error dialog: %s" % msg)
 
 
 def main(session, **kwargs):
     """
     Main entry point for plugin
-    
+
     Args:
         session: Enigma2 session
         **kwargs: Additional arguments
     """
+    global _runtime
     try:
-        # ABSOLUTE IMPORTS FOR ENIGMA2
-        from Plugins.Extensions.WGFileManagerPro.ui.main_screen import WGFileManagerMain
-        from Plugins.Extensions.WGFileManagerPro.utils.logger import get_logger, set_debug_mode
-        from Plugins.Extensions.WGFileManagerPro.core.config import get_config
-        
-        # Get config and set debug mode
-        config = get_config()
-        debug_enabled = config.get('debug_mode', False)
-        set_debug_mode(debug_enabled)
-        
-        logger = get_logger()
-        logger.info("=" * 60)
-        logger.info("Starting WG File Manager Pro")
-        logger.info("Debug mode: %s", "ENABLED" if debug_enabled else "DISABLED")
-        logger.info("=" * 60)
-        
+        WGFileManagerMain = _lazy('main_screen', _import_main_screen)
+
+        if _runtime is None:
+            get_logger, set_debug_mode = _lazy('logger', _import_logger)
+            get_config = _lazy('config', _import_config)
+            # Get config and set debug mode
+            config = get_config()
+            debug_enabled = config.get('debug_mode', False)
+            set_debug_mode(debug_enabled)
+            _runtime = (get_logger(), debug_enabled)
+        logger, debug_enabled = _runtime
+
+        # One logger call for the whole preamble - the framework
+        # overhead per record outweighs the lines themselves
+        logger.info("%s\nStarting WG File Manager Pro\nDebug mode: %s\n%s",
+                    _BANNER,
+                    "ENABLED" if debug_enabled else "DISABLED",
+                    _BANNER)
+
         # Create and open main screen
         session.open(WGFileManagerMain)
         
     except ImportError as e:
-        error_msg = f"Import Error: {str(e)}"
-        print(f"[WGFileManager] {error_msg}")
-        if ENIGMA2_AVAILABLE:
-            try:
-                from Screens.MessageBox import MessageBox
-                session.open(MessageBox, 
-                            f"WG File Manager Import Error:\n{str(e)}",
-                            MessageBox.TYPE_ERROR)
-            except:
-                print(f"[WGFileManager] Could not show error dialog: {error_msg}")
+        print("[WGFileManager] Import Error: %s" % e)
+        _show_error(session, "WG File Manager Import Error:\n%s" % e)
     except Exception as e:
-        error_msg = str(e)
-        print(f"[WGFileManager] Error starting: {error_msg}")
-        if ENIGMA2_AVAILABLE:
-            try:
-                from Screens.MessageBox import MessageBox
-                session.open(MessageBox, 
-                            f"WG File Manager Error:\n{error_msg}",
-                            MessageBox.TYPE_ERROR)
-            except:
-                print(f"[WGFileManager] Could not show error dialog: {error_msg}")
+        print("[WGFileManager] Error starting: %s" % e)
+        _show_error(session, "WG File Manager Error:\n%s" % e)
 
 
 def autostart(reason, **kwargs):
@@ -82,92 +160,110 @@ def autostart(reason, **kwargs):
         **kwargs: Additional arguments
     """
     if reason == 0:  # Startup
-        print("[WGFileManager] System started")
+        if _VERBOSE:
+            print("[WGFileManager] System started")
     elif reason == 1:  # Shutdown
-        print("[WGFileManager] System shutting down")
+        if _VERBOSE:
+            print("[WGFileManager] System shutting down")
+
+
+# Shared across menu() calls: Enigma2 evaluates every registered menu
+# hook per menu id and treats the returned entries as read-only, so
+# one list serves all hits (and one all misses) with no per-call
+# allocation
+_MAINMENU_ENTRY = [("WG File Manager Pro", main, "wg_filemanager", 50)]
+_NO_MENU_ENTRY = []
 
 
 def menu(menuid, **kwargs):
     """
     Menu integration
-    
+
     Args:
         menuid: Menu ID
         **kwargs: Additional arguments
-        
+
     Returns:
         Menu entry or None
     """
-    if menuid == "mainmenu":
-        return [("WG File Manager Pro", main, "wg_filemanager", 50)]
-    return []
+    return _MAINMENU_ENTRY if menuid == "mainmenu" else _NO_MENU_ENTRY
+
+
+# Descriptor list built once and reused: Enigma2 rescans the plugin
+# registry repeatedly, and the descriptors never change after import
+_PLUGIN_DESCRIPTORS = None
 
 
 def Plugins(**kwargs):
     """
     Plugin descriptor
-    
+
     Returns:
         list: List of plugin descriptors
     """
+    global _PLUGIN_DESCRIPTORS
+    if _PLUGIN_DESCRIPTORS is not None:
+        return _PLUGIN_DESCRIPTORS
+
+    available, PluginDescriptor = _ensure_enigma2()
+
     # Always return a list, even if empty
-    if not ENIGMA2_AVAILABLE:
-        print("[WGFileManager] Enigma2 not available - returning empty plugin list")
-        return []
-    
+    if not available:
+        if _VERBOSE:
+            print("[WGFileManager] Enigma2 not available - returning empty plugin list")
+        _PLUGIN_DESCRIPTORS = []
+        return _PLUGIN_DESCRIPTORS
+
     if PluginDescriptor is None:
-        print("[WGFileManager] PluginDescriptor is None - returning empty plugin list")
-        return []
-    
-    try:
-        descriptors = []
-        
-        # Main menu entry
-        descriptors.append(
-            PluginDescriptor(
-                name="WG File Manager Pro",
-                description="Advanced dual-pane file manager with visual progress",
-                where=PluginDescriptor.WHERE_PLUGINMENU,
-                fnc=main,
-                icon="filemanager.png",
-                needsRestart=False
-            )
-        )
-        
-        # Extensions menu
-        descriptors.append(
-            PluginDescriptor(
-                name="WG File Manager Pro",
-                description="Advanced File Manager",
-                where=PluginDescriptor.WHERE_EXTENSIONSMENU,
-                fnc=main,
-                needsRestart=False
-            )
-        )
-        
-        # Menu hook
-        descriptors.append(
-            PluginDescriptor(
-                name="WG File Manager Pro",
-                where=PluginDescriptor.WHERE_MENU,
-                fnc=menu,
-                needsRestart=False
-            )
-        )
-        
+        if _VERBOSE:
+            print("[WGFileManager] PluginDescriptor is None - returning empty plugin list")
+        _PLUGIN_DESCRIPTORS = []
+        return _PLUGIN_DESCRIPTORS
+
+    where_pluginmenu = PluginDescriptor.WHERE_PLUGINMENU
+    where_extensionsmenu = PluginDescriptor.WHERE_EXTENSIONSMENU
+    where_menu = PluginDescriptor.WHERE_MENU
+
+    # One list display instead of append calls: plugin menu,
+    # extensions menu, menu hook. Constructing descriptors is pure
+    # attribute plumbing; if it raises, something is wrong enough that
+    # swallowing the exception would only hide it from the log
+    descriptors = [
+        PluginDescriptor(
+            name="WG File Manager Pro",
+            description="Advanced dual-pane file manager with visual progress",
+            where=where_pluginmenu,
+            fnc=main,
+            icon="filemanager.png",
+            needsRestart=False
+        ),
+        PluginDescriptor(
+            name="WG File Manager Pro",
+            description="Advanced File Manager",
+            where=where_extensionsmenu,
+            fnc=main,
+            needsRestart=False
+        ),
+        PluginDescriptor(
+            name="WG File Manager Pro",
+            where=where_menu,
+            fnc=menu,
+            needsRestart=False
+        ),
+    ]
+
+    if _VERBOSE:
         print("[WGFileManager] Created %d plugin descriptors" % len(descriptors))
-        return descriptors
-        
-    except Exception as e:
-        print("[WGFileManager] Error creating plugin descriptors: %s" % str(e))
-        return []
+    _PLUGIN_DESCRIPTORS = descriptors
+    return descriptors
 
 
 # For testing without Enigma2
 if __name__ == "__main__":
-    print("=" * 60)
+    _ensure_enigma2()
+    print(_BANNER)
     print("WG File Manager Pro - Plugin Test")
-    print("=" * 60)
+    print(_BANNER)
     print("Enigma2 Available: %s" % ENIGMA2_AVAILABLE)
     print("PluginDescriptor: %s" % ("Available" if PluginDescriptor else "None"))
     
@@ -179,13 +275,22 @@ if __name__ == "__main__":
         print("\nThis plugin requires Enigma2 GUI to run.")
         print("Run from plugin menu in Enigma2.")
     else:
-        print("\nRunning in test mode...")
-        try:
-            # For test mode, use relative imports
-            from .ui.main_screen import create_main_screen
-            screen = create_main_screen()
-            print("✓ Test screen created successfully")
-        except Exception as e:
-            print("✗ Test error: %s" % str(e))
+        # Opt-in via env var: by default `python plugin.py` only smoke
+        # tests descriptor construction and never touches the UI stack.
+        # (The old relative import could not work from __main__ anyway
+        # - it raised unconditionally and always printed the error.)
+        if os.environ.get('WGFM_TEST_SCREEN'):
+            print("\nRunning in test mode...")
+            try:
+                import importlib
+                create_main_screen = importlib.import_module(
+                    'Plugins.Extensions.WGFileManagerPro.ui.main_screen'
+                ).create_main_screen
+                screen = create_main_screen()
+                print("✓ Test screen created successfully")
+            except Exception as e:
+                print("✗ Test error: %s" % str(e))
+        else:
+            print("\nSet WGFM_TEST_SCREEN=1 to also exercise screen creation.")
     
-    print("=" * 60)
\ No newline at end of file
+    print(_BANNER)
\ No newline at end of file
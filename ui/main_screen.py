@@ -6,6 +6,8 @@ Features: Visual dual panes, arrow navigation, progress bars
 from __future__ import absolute_import, print_function
 import os
 import threading
+import time
+from functools import lru_cache, partial
 
 try:
     from Screens.Screen import Screen
@@ -30,6 +32,22 @@ from Plugins.Extensions.WGFileManagerPro.ui.permission_dialog import PermissionD
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _cached_disk_usage(path, bucket):
+    """statvfs-backed usage string, cached per (path, 5s time bucket)
+
+    update_info runs every timer tick and re-stat'ed the filesystem
+    each time even when nothing changed; the bucket argument expires
+    entries after at most 5 seconds without any explicit TTL tracking.
+    """
+    return format_disk_usage(path)
+
+
+def _disk_usage(path):
+    """Disk usage for path, refreshed at most every 5 seconds"""
+    return _cached_disk_usage(path, int(time.monotonic() // 5))
+
+
 if ENIGMA2_AVAILABLE:
     
     class WGFileManagerMain(Screen):
@@ -80,35 +98,33 @@ if ENIGMA2_AVAILABLE:
             
             # State
             self.active_pane = 'left'
+            self._dirty = True
             self.marked_files = set()
             self.clipboard = []
             self.clipboard_mode = None  # 'copy' or 'move'
             self.operation_in_progress = False
+            self._last_button_bar_key = None
             
             # File operations
             self.file_ops = FileOperations(progress_callback=self.on_progress_update)
             
-            # Get initial paths from config
+            # Get initial paths from config; they are validated on a
+            # worker thread below - os.path.exists against a spun-down
+            # HDD can block for hundreds of ms, so the panes come up
+            # on /tmp instantly and the real paths are swapped in when
+            # the stats return
             left_path = self.config.get('left_path', '/media/hdd')
             right_path = self.config.get('right_path', '/tmp')
             
-            # Validate paths
-            if not os.path.exists(left_path):
-                left_path = '/media/hdd' if os.path.exists('/media/hdd') else '/'
-            if not os.path.exists(right_path):
-                right_path = '/tmp'
-            
-            logger.info("[MainScreen] Left path: %s, Right path: %s", left_path, right_path)
-            
             # UI Components
             self["title"] = Label("WG File Manager Pro")
             self["disk_info"] = Label("")
             self["status_bar"] = Label("Ready")
             
             # Left pane
-            self["left_title"] = Label(left_path)
+            self["left_title"] = Label("/tmp")
             self["left_pane"] = EnhancedFileList(
-                left_path, 
+                "/tmp", 
                 config=self.config,
                 showDirectories=True,
                 showFiles=True,
@@ -119,9 +135,9 @@ if ENIGMA2_AVAILABLE:
             self["left_info"] = Label("")
             
             # Right pane
-            self["right_title"] = Label(right_path)
+            self["right_title"] = Label("/tmp")
             self["right_pane"] = EnhancedFileList(
-                right_path, 
+                "/tmp", 
                 config=self.config,
                 showDirectories=True,
                 showFiles=True,
@@ -134,6 +150,21 @@ if ENIGMA2_AVAILABLE:
             # Button bar
             self["button_bar"] = Label("")
             
+            # Direct widget references for the hot paths: Enigma2's
+            # GUISkin.__getitem__ is a dict walk plus wrapping on every
+            # lookup, and the handlers below hit it several times per
+            # keypress. The self[...] bindings above stay in place for
+            # the skin resolver.
+            self._left_pane = self["left_pane"]
+            self._right_pane = self["right_pane"]
+            self._left_title = self["left_title"]
+            self._right_title = self["right_title"]
+            self._left_info = self["left_info"]
+            self._right_info = self["right_info"]
+            self._disk_info = self["disk_info"]
+            self._status_bar = self["status_bar"]
+            self._button_bar = self["button_bar"]
+            
             # Setup actions
             self.setup_actions()
             
@@ -141,13 +172,35 @@ if ENIGMA2_AVAILABLE:
             self.update_timer = eTimer()
             self.update_timer.callback.append(self.update_info)
             
+            # Status bar writes coalesce through a short single-shot
+            # timer: under key-repeat only the final message renders
+            self._status_pending = None
+            self._status_flush_timer = eTimer()
+            self._status_flush_timer.callback.append(self._flush_status)
+            
             # Initialize on layout finish
             self.onLayoutFinish.append(self.on_layout_finish)
             
+            # Kick off path validation; the worker only writes the
+            # result attribute - eTimer is not thread-safe, so the
+            # already-running update tick picks the result up on the
+            # UI thread
+            self._validated_paths = None
+            threading.Thread(target=self._validate_paths,
+                             args=(left_path, right_path),
+                             daemon=True).start()
+            
             logger.info("[MainScreen] Initialization complete")
         
+        # Digit keys bound by both action maps below
+        _NUMBER_KEYS = tuple(str(i) for i in range(10))
+
         def setup_actions(self):
             """Setup keyboard/remote actions - COMPLETE FIX"""
+            # One partial per digit instead of twenty per-open lambdas
+            num_map = {k: partial(self.key_number, int(k))
+                       for k in self._NUMBER_KEYS}
+
             # Try different action map names for compatibility
             self["actions"] = ActionMap(
                 ["WGFileManagerActions", "MenuActions", "InfobarMenuActions", "DirectionActions", "ColorActions", "MovieSelectionActions"],
@@ -177,37 +230,16 @@ if ENIGMA2_AVAILABLE:
                     # Additional navigation
                     "nextBouquet": self.key_page_up,
                     "prevBouquet": self.key_page_down,
-                    
-                    # Number keys
-                    "0": lambda: self.key_number(0),
-                    "1": lambda: self.key_number(1),
-                    "2": lambda: self.key_number(2),
-                    "3": lambda: self.key_number(3),
-                    "4": lambda: self.key_number(4),
-                    "5": lambda: self.key_number(5),
-                    "6": lambda: self.key_number(6),
-                    "7": lambda: self.key_number(7),
-                    "8": lambda: self.key_number(8),
-                    "9": lambda: self.key_number(9),
                 },
                 -1  # Priority
             )
             
-            # Also create a separate number action map
+            # Digit keys live only in the NumberActionMap - they were
+            # also registered in the map above, which doubled Enigma2's
+            # per-keypress action scan for identical handlers
             self["number_actions"] = NumberActionMap(
                 ["NumberActions"],
-                {
-                    "0": lambda: self.key_number(0),
-                    "1": lambda: self.key_number(1),
-                    "2": lambda: self.key_number(2),
-                    "3": lambda: self.key_number(3),
-                    "4": lambda: self.key_number(4),
-                    "5": lambda: self.key_number(5),
-                    "6": lambda: self.key_number(6),
-                    "7": lambda: self.key_number(7),
-                    "8": lambda: self.key_number(8),
-                    "9": lambda: self.key_number(9),
-                },
+                num_map,
                 -1
             )
         
@@ -227,27 +259,56 @@ if ENIGMA2_AVAILABLE:
             # Connect selection change callbacks
             self.connect_selection_callbacks()
             
-            # Start update timer (1 second intervals)
-            self.update_timer.start(1000, False)
+            # Update timer: a fast tick that only redraws when some
+            # handler marked the screen dirty, so idle cost is a flag
+            # test instead of label updates and a statvfs every second
+            self.update_timer.start(250, False)
             
             # Update button bar
             self.update_button_bar()
             
             # Set status
-            self["status_bar"].setText("Navigation: ↑↓←→ OK=Open EXIT=Back")
+            self._set_status("Navigation: ↑↓←→ OK=Open EXIT=Back")
             
             logger.info("[MainScreen] Layout setup complete, ready for user input")
         
+        def _validate_paths(self, left_path, right_path):
+            """Stat the configured start paths off the UI thread
+            
+            Runs on a worker thread: the single attribute assignment
+            is the only cross-thread traffic, and update_info polls it
+            from the timer tick on the UI thread.
+            """
+            if not os.path.exists(left_path):
+                left_path = '/media/hdd' if os.path.exists('/media/hdd') else '/'
+            if not os.path.exists(right_path):
+                right_path = '/tmp'
+            self._validated_paths = (left_path, right_path)
+        
+        def _apply_validated_paths(self):
+            """Swap the validated start paths into the panes"""
+            left_path, right_path = self._validated_paths
+            self._validated_paths = None
+            logger.info("[MainScreen] Left path: %s, Right path: %s",
+                        left_path, right_path)
+            if left_path != self._left_pane.getCurrentDirectory():
+                self._left_pane.changeDir(left_path)
+            if right_path != self._right_pane.getCurrentDirectory():
+                self._right_pane.changeDir(right_path)
+            _cached_disk_usage.cache_clear()
+            self.update_pane_highlight()
+            self._dirty = True
+        
         def connect_selection_callbacks(self):
             """Connect selection change callbacks to both panes"""
             try:
                 # Check if panes have onSelectionChanged attribute
-                if hasattr(self["left_pane"], 'onSelectionChanged'):
-                    self["left_pane"].onSelectionChanged.append(self.on_selection_changed)
+                if hasattr(self._left_pane, 'onSelectionChanged'):
+                    self._left_pane.onSelectionChanged.append(self.on_selection_changed)
                     logger.debug("[MainScreen] Connected left pane selection callback")
                 
-                if hasattr(self["right_pane"], 'onSelectionChanged'):
-                    self["right_pane"].onSelectionChanged.append(self.on_selection_changed)
+                if hasattr(self._right_pane, 'onSelectionChanged'):
+                    self._right_pane.onSelectionChanged.append(self.on_selection_changed)
                     logger.debug("[MainScreen] Connected right pane selection callback")
             except Exception as e:
                 logger.error("[MainScreen] Error connecting callbacks: %s", e)
@@ -259,26 +320,26 @@ if ENIGMA2_AVAILABLE:
                 
                 if self.active_pane == 'left':
                     # Enable left pane, disable right
-                    if hasattr(self["left_pane"], 'selectionEnabled'):
-                        self["left_pane"].selectionEnabled(1)
-                    if hasattr(self["right_pane"], 'selectionEnabled'):
-                        self["right_pane"].selectionEnabled(0)
+                    if hasattr(self._left_pane, 'selectionEnabled'):
+                        self._left_pane.selectionEnabled(1)
+                    if hasattr(self._right_pane, 'selectionEnabled'):
+                        self._right_pane.selectionEnabled(0)
                     
                     # Move instance to front
                     try:
-                        self.instance.moveSelectionTo(self["left_pane"].instance)
+                        self.instance.moveSelectionTo(self._left_pane.instance)
                     except:
                         pass
                 else:
                     # Enable right pane, disable left
-                    if hasattr(self["left_pane"], 'selectionEnabled'):
-                        self["left_pane"].selectionEnabled(0)
-                    if hasattr(self["right_pane"], 'selectionEnabled'):
-                        self["right_pane"].selectionEnabled(1)
+                    if hasattr(self._left_pane, 'selectionEnabled'):
+                        self._left_pane.selectionEnabled(0)
+                    if hasattr(self._right_pane, 'selectionEnabled'):
+                        self._right_pane.selectionEnabled(1)
                     
                     # Move instance to front
                     try:
-                        self.instance.moveSelectionTo(self["right_pane"].instance)
+                        self.instance.moveSelectionTo(self._right_pane.instance)
                     except:
                         pass
             except Exception as e:
@@ -286,57 +347,70 @@ if ENIGMA2_AVAILABLE:
         
         def get_active_pane(self):
             """Get active pane widget"""
-            return self["left_pane"] if self.active_pane == 'left' else self["right_pane"]
+            return self._left_pane if self.active_pane == 'left' else self._right_pane
         
         def get_inactive_pane(self):
             """Get inactive pane widget"""
-            return self["right_pane"] if self.active_pane == 'left' else self["left_pane"]
+            return self._right_pane if self.active_pane == 'left' else self._left_pane
         
         def update_pane_highlight(self):
             """Update visual highlight for active pane"""
             try:
-                left_dir = self["left_pane"].getCurrentDirectory()
-                right_dir = self["right_pane"].getCurrentDirectory()
+                left_dir = self._left_pane.getCurrentDirectory()
+                right_dir = self._right_pane.getCurrentDirectory()
                 
                 if self.active_pane == 'left':
-                    self["left_title"].setText("▶ " + left_dir)
-                    self["right_title"].setText("  " + right_dir)
+                    self._left_title.setText("▶ " + left_dir)
+                    self._right_title.setText("  " + right_dir)
                 else:
-                    self["left_title"].setText("  " + left_dir)
-                    self["right_title"].setText("▶ " + right_dir)
+                    self._left_title.setText("  " + left_dir)
+                    self._right_title.setText("▶ " + right_dir)
             except Exception as e:
                 logger.error("[MainScreen] Error updating pane highlight: %s", e)
         
         def update_info(self):
+            """Redraw the info displays if anything changed"""
+            if self._validated_paths is not None:
+                self._apply_validated_paths()
+            if self._status_pending is not None:
+                # Status posted from a worker thread (which must not
+                # start the flush timer) lands here on the next tick
+                self._flush_status()
+            if not self._dirty:
+                return
+            self._dirty = False
+            self._do_update_info()
+
+        def _do_update_info(self):
             """Update information displays"""
             try:
                 # Update disk info
                 active_dir = self.get_active_pane().getCurrentDirectory()
-                disk_info = format_disk_usage(active_dir)
-                self["disk_info"].setText("Disk: %s" % disk_info)
+                disk_info = _disk_usage(active_dir)
+                self._disk_info.setText("Disk: %s" % disk_info)
                 
                 # Update pane info
-                left_info = self.get_pane_info(self["left_pane"])
-                right_info = self.get_pane_info(self["right_pane"])
+                left_info = self.get_pane_info(self._left_pane)
+                right_info = self.get_pane_info(self._right_pane)
                 
                 # Add marked files count
-                left_marked = len(self["left_pane"].get_marked_files())
-                right_marked = len(self["right_pane"].get_marked_files())
+                left_marked = self._left_pane.get_marked_count()
+                right_marked = self._right_pane.get_marked_count()
                 
                 if left_marked > 0:
                     left_info += " | Marked: %d" % left_marked
                 if right_marked > 0:
                     right_info += " | Marked: %d" % right_marked
                 
-                self["left_info"].setText(left_info)
-                self["right_info"].setText(right_info)
+                self._left_info.setText(left_info)
+                self._right_info.setText(right_info)
                 
                 # Update status bar with current selection
                 selection = self.get_active_pane().get_selection()
                 if selection:
                     path, is_dir, name = selection
                     status = f"Selected: {name} {'(Dir)' if is_dir else ''}"
-                    self["status_bar"].setText(status)
+                    self._set_status(status)
                 
             except Exception as e:
                 logger.error("[MainScreen] Update info error: %s", e)
@@ -350,21 +424,48 @@ if ENIGMA2_AVAILABLE:
         
         def on_selection_changed(self):
             """Called when selection changes in any pane"""
-            self.update_info()
+            self._dirty = True
         
         def update_button_bar(self):
             """Update button bar text"""
             try:
+                # Skip the rebuild (and the Label invalidate setText
+                # triggers) when the clipboard state is unchanged
+                key = (self.clipboard_mode, len(self.clipboard))
+                if key == self._last_button_bar_key:
+                    return
+                
                 if self.clipboard:
                     mode = "COPY" if self.clipboard_mode == 'copy' else "MOVE"
                     text = "🟢Copy 🟡Move 🔴Delete 🔵Mark ℹ️Perms | Clipboard: %s (%d)" % (mode, len(self.clipboard))
                 else:
                     text = "🟢Copy 🟡Move 🔴Delete 🔵Mark ℹ️Permissions"
                 
-                self["button_bar"].setText(text)
+                self._button_bar.setText(text)
+                self._last_button_bar_key = key
             except Exception as e:
                 logger.error("[MainScreen] Error updating button bar: %s", e)
         
+        def _set_status(self, text):
+            """Queue a status bar message (flushed after 50ms)
+
+            Safe to call from worker threads: only the UI thread may
+            drive eTimer, so off the main thread this is just the
+            attribute write and the 250ms update tick renders it -
+            the same polling handoff _validate_paths uses.
+            """
+            self._status_pending = text
+            if threading.current_thread() is not threading.main_thread():
+                return
+            if not self._status_flush_timer.isActive():
+                self._status_flush_timer.start(50, True)
+        
+        def _flush_status(self):
+            """Render the most recent pending status message"""
+            if self._status_pending is not None:
+                self._status_bar.setText(self._status_pending)
+                self._status_pending = None
+        
         # ==================== NAVIGATION METHODS ====================
         
         def key_up(self):
@@ -374,12 +475,12 @@ if ENIGMA2_AVAILABLE:
                 pane = self.get_active_pane()
                 if hasattr(pane, 'up'):
                     pane.up()
-                    self.update_info()
+                    self._dirty = True
                 else:
                     logger.error("[MainScreen] Pane has no 'up' method")
             except Exception as e:
                 logger.error("[MainScreen] key_up error: %s", e)
-                self["status_bar"].setText(f"Error: {str(e)}")
+                self._set_status(f"Error: {str(e)}")
         
         def key_down(self):
             """Move selection down"""
@@ -388,12 +489,12 @@ if ENIGMA2_AVAILABLE:
                 pane = self.get_active_pane()
                 if hasattr(pane, 'down'):
                     pane.down()
-                    self.update_info()
+                    self._dirty = True
                 else:
                     logger.error("[MainScreen] Pane has no 'down' method")
             except Exception as e:
                 logger.error("[MainScreen] key_down error: %s", e)
-                self["status_bar"].setText(f"Error: {str(e)}")
+                self._set_status(f"Error: {str(e)}")
         
         def key_left(self):
             """Switch to left pane"""
@@ -403,11 +504,11 @@ if ENIGMA2_AVAILABLE:
                     self.active_pane = 'left'
                     self.update_pane_highlight()
                     self.set_focus_to_active_pane()
-                    self.update_info()
-                    self["status_bar"].setText("Switched to LEFT pane")
+                    self._dirty = True
+                    self._set_status("Switched to LEFT pane")
                 else:
                     # Already in left pane, maybe scroll left?
-                    self["status_bar"].setText("Already in left pane")
+                    self._set_status("Already in left pane")
             except Exception as e:
                 logger.error("[MainScreen] key_left error: %s", e)
         
@@ -419,11 +520,11 @@ if ENIGMA2_AVAILABLE:
                     self.active_pane = 'right'
                     self.update_pane_highlight()
                     self.set_focus_to_active_pane()
-                    self.update_info()
-                    self["status_bar"].setText("Switched to RIGHT pane")
+                    self._dirty = True
+                    self._set_status("Switched to RIGHT pane")
                 else:
                     # Already in right pane, maybe scroll right?
-                    self["status_bar"].setText("Already in right pane")
+                    self._set_status("Already in right pane")
             except Exception as e:
                 logger.error("[MainScreen] key_right error: %s", e)
         
@@ -434,8 +535,8 @@ if ENIGMA2_AVAILABLE:
                 pane = self.get_active_pane()
                 if hasattr(pane, 'pageUp'):
                     pane.pageUp()
-                    self.update_info()
-                    self["status_bar"].setText("Page Up")
+                    self._dirty = True
+                    self._set_status("Page Up")
                 else:
                     logger.error("[MainScreen] Pane has no 'pageUp' method")
             except Exception as e:
@@ -448,8 +549,8 @@ if ENIGMA2_AVAILABLE:
                 pane = self.get_active_pane()
                 if hasattr(pane, 'pageDown'):
                     pane.pageDown()
-                    self.update_info()
-                    self["status_bar"].setText("Page Down")
+                    self._dirty = True
+                    self._set_status("Page Down")
                 else:
                     logger.error("[MainScreen] Pane has no 'pageDown' method")
             except Exception as e:
@@ -458,7 +559,7 @@ if ENIGMA2_AVAILABLE:
         def key_number(self, number):
             """Quick jump using number keys"""
             logger.debug("[MainScreen] Number key %d pressed", number)
-            self["status_bar"].setText(f"Number {number} - Quick jump not implemented yet")
+            self._set_status(f"Number {number} - Quick jump not implemented yet")
             # TODO: Implement quick jump to items starting with numbers
         
         # ==================== ACTION METHODS ====================
@@ -471,7 +572,7 @@ if ENIGMA2_AVAILABLE:
                 selection = pane.get_selection()
                 
                 if not selection:
-                    self["status_bar"].setText("No selection")
+                    self._set_status("No selection")
                     return
                 
                 path, is_dir, name = selection
@@ -483,27 +584,29 @@ if ENIGMA2_AVAILABLE:
                     parent = os.path.dirname(pane.getCurrentDirectory())
                     if parent and parent != pane.getCurrentDirectory():
                         pane.changeDir(parent)
+                        _cached_disk_usage.cache_clear()
                         self.update_pane_highlight()
-                        self.update_info()
-                        self["status_bar"].setText(f"Parent directory: {parent}")
+                        self._dirty = True
+                        self._set_status(f"Parent directory: {parent}")
                     else:
-                        self["status_bar"].setText("Already at root directory")
+                        self._set_status("Already at root directory")
                 
                 elif is_dir:
                     # Change to directory
                     pane.changeDir(path)
+                    _cached_disk_usage.cache_clear()
                     self.update_pane_highlight()
-                    self.update_info()
-                    self["status_bar"].setText(f"Entered: {name}")
+                    self._dirty = True
+                    self._set_status(f"Entered: {name}")
                 
                 elif is_media_file(name):
                     # Play media file
-                    self["status_bar"].setText(f"Playing: {name}")
+                    self._set_status(f"Playing: {name}")
                     self.play_file(path)
                 
                 else:
                     # Cannot open non-media files yet
-                    self["status_bar"].setText(f"Cannot open: {name}")
+                    self._set_status(f"Cannot open: {name}")
                     self.session.open(MessageBox, 
                                     f"File type not supported:\n{name}",
                                     MessageBox.TYPE_INFO, 
@@ -511,7 +614,7 @@ if ENIGMA2_AVAILABLE:
                     
             except Exception as e:
                 logger.error("[MainScreen] key_ok error: %s", e)
-                self["status_bar"].setText(f"Error: {str(e)}")
+                self._set_status(f"Error: {str(e)}")
                 self.session.open(MessageBox, 
                                 f"Error opening:\n{str(e)}",
                                 MessageBox.TYPE_ERROR, 
@@ -526,24 +629,25 @@ if ENIGMA2_AVAILABLE:
                 
                 if current_dir == '/':
                     # At root, exit application
-                    self["status_bar"].setText("Exiting...")
+                    self._set_status("Exiting...")
                     self.exit_application()
                 else:
                     # Go to parent directory
                     parent = os.path.dirname(current_dir)
                     pane.changeDir(parent)
+                    _cached_disk_usage.cache_clear()
                     self.update_pane_highlight()
-                    self.update_info()
-                    self["status_bar"].setText(f"Back to: {parent}")
+                    self._dirty = True
+                    self._set_status(f"Back to: {parent}")
                     
             except Exception as e:
                 logger.error("[MainScreen] key_exit error: %s", e)
-                self["status_bar"].setText(f"Error: {str(e)}")
+                self._set_status(f"Error: {str(e)}")
         
         def key_menu(self):
             """Show context menu"""
             logger.debug("[MainScreen] Key MENU pressed")
-            self["status_bar"].setText("Menu - Coming soon!")
+            self._set_status("Menu - Coming soon!")
             self.session.open(MessageBox, 
                             "Context Menu\n\nComing in next version!", 
                             MessageBox.TYPE_INFO, 
@@ -562,7 +666,7 @@ if ENIGMA2_AVAILABLE:
                     self.clipboard = marked
                     self.clipboard_mode = 'copy'
                     self.update_button_bar()
-                    self["status_bar"].setText(f"Copied {len(marked)} files to clipboard")
+                    self._set_status(f"Copied {len(marked)} files to clipboard")
                     self.session.open(MessageBox, 
                                     f"{len(marked)} files copied to clipboard", 
                                     MessageBox.TYPE_INFO, 
@@ -574,13 +678,13 @@ if ENIGMA2_AVAILABLE:
                         self.clipboard = [selection[0]]
                         self.clipboard_mode = 'copy'
                         self.update_button_bar()
-                        self["status_bar"].setText(f"Copied: {selection[2]}")
+                        self._set_status(f"Copied: {selection[2]}")
                     else:
-                        self["status_bar"].setText("No files selected")
+                        self._set_status("No files selected")
                         
             except Exception as e:
                 logger.error("[MainScreen] key_copy error: %s", e)
-                self["status_bar"].setText(f"Error: {str(e)}")
+                self._set_status(f"Error: {str(e)}")
         
         def key_move(self):
             """Move marked files to clipboard"""
@@ -593,7 +697,7 @@ if ENIGMA2_AVAILABLE:
                     self.clipboard = marked
                     self.clipboard_mode = 'move'
                     self.update_button_bar()
-                    self["status_bar"].setText(f"Ready to move {len(marked)} files")
+                    self._set_status(f"Ready to move {len(marked)} files")
                     self.session.open(MessageBox, 
                                     f"{len(marked)} files marked for move", 
                                     MessageBox.TYPE_INFO, 
@@ -603,11 +707,11 @@ if ENIGMA2_AVAILABLE:
                     if self.clipboard:
                         self.paste_files()
                     else:
-                        self["status_bar"].setText("No files marked for move")
+                        self._set_status("No files marked for move")
                         
             except Exception as e:
                 logger.error("[MainScreen] key_move error: %s", e)
-                self["status_bar"].setText(f"Error: {str(e)}")
+                self._set_status(f"Error: {str(e)}")
         
         def key_delete(self):
             """Delete marked files or current file"""
@@ -630,13 +734,13 @@ if ENIGMA2_AVAILABLE:
                         f"Delete {len(marked)} item(s)?\n\nThis action cannot be undone.",
                         MessageBox.TYPE_YESNO
                     )
-                    self["status_bar"].setText(f"Confirm delete {len(marked)} items")
+                    self._set_status(f"Confirm delete {len(marked)} items")
                 else:
-                    self["status_bar"].setText("No files to delete")
+                    self._set_status("No files to delete")
                     
             except Exception as e:
                 logger.error("[MainScreen] key_delete error: %s", e)
-                self["status_bar"].setText(f"Error: {str(e)}")
+                self._set_status(f"Error: {str(e)}")
         
         def key_mark(self):
             """Mark/unmark current file"""
@@ -649,17 +753,17 @@ if ENIGMA2_AVAILABLE:
                     pane.mark_file(selection[0])
                     # Move to next item
                     pane.down()
-                    self.update_info()
+                    self._dirty = True
                     
                     # Update status
-                    marked_count = len(pane.get_marked_files())
-                    self["status_bar"].setText(f"Marked: {selection[2]} ({marked_count} total)")
+                    marked_count = pane.get_marked_count()
+                    self._set_status(f"Marked: {selection[2]} ({marked_count} total)")
                 else:
-                    self["status_bar"].setText("Cannot mark this item")
+                    self._set_status("Cannot mark this item")
                     
             except Exception as e:
                 logger.error("[MainScreen] key_mark error: %s", e)
-                self["status_bar"].setText(f"Error: {str(e)}")
+                self._set_status(f"Error: {str(e)}")
         
         def key_permissions(self):
             """Open permissions dialog"""
@@ -671,7 +775,7 @@ if ENIGMA2_AVAILABLE:
                 if selection and selection[2] != '..':
                     self.open_permission_dialog(selection[0])
                 else:
-                    self["status_bar"].setText("Select a file first")
+                    self._set_status("Select a file first")
                     self.session.open(MessageBox, 
                                     "Please select a file or directory first", 
                                     MessageBox.TYPE_INFO, 
@@ -679,14 +783,14 @@ if ENIGMA2_AVAILABLE:
                     
             except Exception as e:
                 logger.error("[MainScreen] key_permissions error: %s", e)
-                self["status_bar"].setText(f"Error: {str(e)}")
+                self._set_status(f"Error: {str(e)}")
         
         # ==================== OPERATION METHODS ====================
         
         def paste_files(self):
             """Paste files from clipboard"""
             if not self.clipboard:
-                self["status_bar"].setText("Clipboard is empty")
+                self._set_status("Clipboard is empty")
                 return
             
             logger.info("[MainScreen] Pasting %d files", len(self.clipboard))
@@ -711,8 +815,8 @@ if ENIGMA2_AVAILABLE:
                         operation_name = "moved"
                     
                     # Refresh panes
-                    self["left_pane"].refresh()
-                    self["right_pane"].refresh()
+                    self._left_pane.refresh()
+                    self._right_pane.refresh()
                     
                     # Clear clipboard if move
                     if success and self.clipboard_mode == 'move':
@@ -721,18 +825,18 @@ if ENIGMA2_AVAILABLE:
                     
                     # Update UI
                     self.update_button_bar()
-                    self.update_info()
+                    self._dirty = True
                     
                     if success:
-                        self["status_bar"].setText(f"Successfully {operation_name} {len(self.clipboard)} files")
+                        self._set_status(f"Successfully {operation_name} {len(self.clipboard)} files")
                     else:
                         errors = self.file_ops.get_errors()
                         error_msg = errors[0] if errors else "Unknown error"
-                        self["status_bar"].setText(f"Operation failed: {error_msg}")
+                        self._set_status(f"Operation failed: {error_msg}")
                         
                 except Exception as e:
                     logger.error("[MainScreen] Paste operation error: %s", e)
-                    self["status_bar"].setText(f"Error: {str(e)}")
+                    self._set_status(f"Error: {str(e)}")
             
             # Start operation in thread
             thread = threading.Thread(target=do_operation)
@@ -746,7 +850,7 @@ if ENIGMA2_AVAILABLE:
         def delete_confirmed(self, confirmed):
             """Handle delete confirmation"""
             if not confirmed:
-                self["status_bar"].setText("Delete cancelled")
+                self._set_status("Delete cancelled")
                 return
             
             marked = self.get_active_pane().get_marked_files()
@@ -756,7 +860,7 @@ if ENIGMA2_AVAILABLE:
                     marked = [selection[0]]
             
             if not marked:
-                self["status_bar"].setText("No files to delete")
+                self._set_status("No files to delete")
                 return
             
             use_trash = self.config.get('use_trash', True)
@@ -776,18 +880,18 @@ if ENIGMA2_AVAILABLE:
                     pane = self.get_active_pane()
                     pane.clear_marks()
                     pane.refresh()
-                    self.update_info()
+                    self._dirty = True
                     
                     if success:
-                        self["status_bar"].setText(f"Deleted {len(marked)} files")
+                        self._set_status(f"Deleted {len(marked)} files")
                     else:
                         errors = self.file_ops.get_errors()
                         error_msg = errors[0] if errors else "Unknown error"
-                        self["status_bar"].setText(f"Delete failed: {error_msg}")
+                        self._set_status(f"Delete failed: {error_msg}")
                         
                 except Exception as e:
                     logger.error("[MainScreen] Delete operation error: %s", e)
-                    self["status_bar"].setText(f"Error: {str(e)}")
+                    self._set_status(f"Error: {str(e)}")
             
             # Start operation
             thread = threading.Thread(target=do_delete)
@@ -813,16 +917,16 @@ if ENIGMA2_AVAILABLE:
                     
                     # Play the file
                     InfoBar.instance.playService(service_ref.ref)
-                    self["status_bar"].setText("Playing media file...")
+                    self._set_status("Playing media file...")
                 else:
                     # Fallback to MoviePlayer
                     from Screens.InfoBar import MoviePlayer
                     self.session.open(MoviePlayer, path)
-                    self["status_bar"].setText("Opened in MoviePlayer")
+                    self._set_status("Opened in MoviePlayer")
                     
             except Exception as e:
                 logger.error("[MainScreen] Error playing file: %s", e)
-                self["status_bar"].setText(f"Cannot play: {str(e)}")
+                self._set_status(f"Cannot play: {str(e)}")
                 self.session.open(MessageBox, 
                                 f"Cannot play file:\n{str(e)}", 
                                 MessageBox.TYPE_ERROR)
@@ -830,7 +934,7 @@ if ENIGMA2_AVAILABLE:
         def open_file(self, path):
             """Open file with appropriate handler"""
             # TODO: Implement file type handlers
-            self["status_bar"].setText("File viewer not implemented yet")
+            self._set_status("File viewer not implemented yet")
             self.session.open(MessageBox, 
                             f"File viewer for:\n{os.path.basename(path)}\n\nComing soon!", 
                             MessageBox.TYPE_INFO, 
@@ -840,10 +944,10 @@ if ENIGMA2_AVAILABLE:
             """Open permission dialog for selected file"""
             try:
                 self.session.open(PermissionDialog, path)
-                self["status_bar"].setText("Opening permissions editor...")
+                self._set_status("Opening permissions editor...")
             except Exception as e:
                 logger.error("[MainScreen] Error opening permission dialog: %s", e)
-                self["status_bar"].setText(f"Error: {str(e)}")
+                self._set_status(f"Error: {str(e)}")
                 self.session.open(MessageBox, 
                                 f"Cannot edit permissions:\n{str(e)}", 
                                 MessageBox.TYPE_ERROR)
@@ -865,12 +969,12 @@ if ENIGMA2_AVAILABLE:
             # Save paths
             try:
                 if self.config.get('save_left_on_exit') == 'yes':
-                    left_path = self["left_pane"].getCurrentDirectory()
+                    left_path = self._left_pane.getCurrentDirectory()
                     self.config.set('left_path', left_path)
                     logger.debug("[MainScreen] Saved left path: %s", left_path)
                 
                 if self.config.get('save_right_on_exit') == 'yes':
-                    right_path = self["right_pane"].getCurrentDirectory()
+                    right_path = self._right_pane.getCurrentDirectory()
                     self.config.set('right_path', right_path)
                     logger.debug("[MainScreen] Saved right path: %s", right_path)
                 
@@ -905,18 +1009,18 @@ if ENIGMA2_AVAILABLE:
             print(f"Clipboard: {len(self.clipboard)} items ({self.clipboard_mode})")
             
             try:
-                left_dir = self["left_pane"].getCurrentDirectory()
-                right_dir = self["right_pane"].getCurrentDirectory()
+                left_dir = self._left_pane.getCurrentDirectory()
+                right_dir = self._right_pane.getCurrentDirectory()
                 print(f"\nLeft directory: {left_dir}")
                 print(f"Right directory: {right_dir}")
                 
-                left_selection = self["left_pane"].get_selection()
-                right_selection = self["right_pane"].get_selection()
+                left_selection = self._left_pane.get_selection()
+                right_selection = self._right_pane.get_selection()
                 print(f"\nLeft selection: {left_selection}")
                 print(f"Right selection: {right_selection}")
                 
-                left_marked = len(self["left_pane"].get_marked_files())
-                right_marked = len(self["right_pane"].get_marked_files())
+                left_marked = len(self._left_pane.get_marked_files())
+                right_marked = len(self._right_pane.get_marked_files())
                 print(f"\nLeft marked: {left_marked} files")
                 print(f"Right marked: {right_marked} files")
                 
@@ -23,7 +23,7 @@ except ImportError:
     MenuList = object
     FileList = object
 
-from Plugins.Extensions.WGFileManagerPro.core.compatibility import ensure_unicode, ensure_str, safe_listdir, safe_join
+from Plugins.Extensions.WGFileManagerPro.core.compatibility import ensure_unicode, ensure_str, safe_listdir, safe_listdir_names, safe_join
 from Plugins.Extensions.WGFileManagerPro.utils.formatters import format_size, get_file_icon, is_hidden, human_sort_key, format_permissions_with_octal
 from Plugins.Extensions.WGFileManagerPro.utils.logger import get_logger
 
@@ -304,6 +304,15 @@ if ENIGMA2_AVAILABLE:
             """
             return list(self._marked_files)
         
+        def get_marked_count(self):
+            """
+            Get number of marked files without building a list
+            
+            Returns:
+                int: Marked file count
+            """
+            return len(self._marked_files)
+        
         def clear_marks(self):
             """Clear all marks"""
             self._marked_files.clear()
@@ -665,7 +674,7 @@ if ENIGMA2_AVAILABLE:
             try:
                 current_dir = self.getCurrentDirectory()
                 if os.path.isdir(current_dir):
-                    items = safe_listdir(current_dir)
+                    items = safe_listdir_names(current_dir)
                     # Filter out hidden files if not showing them
                     if not self._show_hidden:
                         items = [item for item in items if not is_hidden(item)]
@@ -695,7 +704,7 @@ if ENIGMA2_AVAILABLE:
             """Check if current directory is empty"""
             try:
                 current_dir = self.getCurrentDirectory()
-                items = safe_listdir(current_dir)
+                items = safe_listdir_names(current_dir)
                 # Filter out hidden files if not showing them
                 if not self._show_hidden:
                     items = [item for item in items if not is_hidden(item)]
@@ -771,24 +780,29 @@ else:
                 self.items.append((parent, True, '..', 0))
             
             try:
-                # List directory
-                for name in safe_listdir(self.directory):
-                    # Skip hidden files if configured
-                    if not self.show_hidden and is_hidden(name):
-                        continue
-                    
-                    path = safe_join(self.directory, name)
-                    is_dir = os.path.isdir(path)
-                    
-                    # Get size
-                    size = 0
-                    if not is_dir:
+                # List directory - scandir hands back the entry type
+                # from getdents, so most entries never need a stat
+                with os.scandir(self.directory) as it:
+                    for entry in it:
+                        name = entry.name
+                        # Skip hidden files if configured
+                        if not self.show_hidden and is_hidden(name):
+                            continue
+
                         try:
-                            size = os.path.getsize(path)
-                        except:
-                            pass
-                    
-                    self.items.append((path, is_dir, name, size))
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+
+                        # Get size
+                        size = 0
+                        if not is_dir:
+                            try:
+                                size = entry.stat().st_size
+                            except OSError:
+                                pass
+
+                        self.items.append((entry.path, is_dir, name, size))
                 
                 # Apply sorting
                 if self.sort_dirs_first:
@@ -886,6 +900,10 @@ else:
             """Get marked files"""
             return list(self.marked_files)
         
+        def get_marked_count(self):
+            """Get number of marked files"""
+            return len(self.marked_files)
+        
         def clear_marks(self):
             """Clear all marks"""
             self.marked_files.clear()
@@ -1015,32 +1033,38 @@ class FilePane:
                 parent = self.get_parent_directory()
                 items.append((parent, True, '..', 0, ''))
             
-            # List directory
-            for name in safe_listdir(self.directory):
-                # Skip hidden files if configured
-                if not self.show_hidden and is_hidden(name):
-                    continue
-                
-                path = safe_join(self.directory, name)
-                is_dir = os.path.isdir(path)
-                
-                # Get size
-                size = 0
-                if not is_dir:
-                    try:
-                        size = os.path.getsize(path)
-                    except:
-                        pass
-                
-                # Get permissions
-                permissions = ''
-                if self.show_permissions:
+            # List directory - one getdents pass instead of a stat
+            # per entry
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    name = entry.name
+                    # Skip hidden files if configured
+                    if not self.show_hidden and is_hidden(name):
+                        continue
+                    
+                    path = entry.path
                     try:
-                        permissions = format_permissions_with_octal(path)
-                    except:
-                        pass
-                
-                items.append((path, is_dir, name, size, permissions))
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    
+                    # Get size
+                    size = 0
+                    if not is_dir:
+                        try:
+                            size = entry.stat().st_size
+                        except OSError:
+                            pass
+                    
+                    # Get permissions
+                    permissions = ''
+                    if self.show_permissions:
+                        try:
+                            permissions = format_permissions_with_octal(path)
+                        except:
+                            pass
+                    
+                    items.append((path, is_dir, name, size, permissions))
             
             # Sort: directories first, then by name
             items.sort(key=lambda x: (not x[1], human_sort_key(x[2])))
@@ -602,24 +602,15 @@ def get_file_owner_info(path):
         tuple: (user_name, group_name, uid, gid) or (None, None, None, None)
     """
     try:
-        import pwd
-        import grp
-        
+        # Memoized in compatibility.py - one NSS lookup per unique id
+        # instead of two per listed file
+        from Plugins.Extensions.WGFileManagerPro.core.compatibility import _uid_to_name, _gid_to_name
+
         stat_info = os.stat(path)
         uid = stat_info.st_uid
         gid = stat_info.st_gid
-        
-        try:
-            user_name = pwd.getpwuid(uid).pw_name
-        except:
-            user_name = str(uid)
-        
-        try:
-            group_name = grp.getgrgid(gid).gr_name
-        except:
-            group_name = str(gid)
-        
-        return user_name, group_name, uid, gid
+
+        return _uid_to_name(uid), _gid_to_name(gid), uid, gid
     except:
         return None, None, None, None
 